@@ -20,9 +20,18 @@ class Adapter:
     def __init__(self, specifications):
         self.encoder = Encoder(specifications)
         self.decoder = Decoder(specifications)
+        # The (commissioner name, node id) of the nodes requests were sent to since the last reset.
+        self.__peers = {}
 
     def encode(self, request):
+        if request.node_id is not None and not request.group_id:
+            self.__peers[(request.identity, request.node_id)] = None
         return self.encoder.encode(request)
 
+    def reset_requests(self):
+        requests = self.encoder.encode_reset(self.__peers)
+        self.__peers = {}
+        return requests
+
     def decode(self, response):
         return self.decoder.decode(response)
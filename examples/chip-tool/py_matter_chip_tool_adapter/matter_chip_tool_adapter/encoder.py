@@ -256,6 +256,25 @@ class Encoder:
             return str(request.timeout) if request.timeout is not None else ''
 
         arguments = self.__get_arguments(request)
+        return self.__encode_payload(cluster, command, arguments, command_specifier)
+
+    def encode_reset(self, peers):
+        """
+        Returns the requests shutting down all the subscriptions of chip-tool and expiring its CASE sessions
+        to peers, an iterable of (commissioner name, node id) tuples. darwin-framework-tool does not support
+        them, None is returned for it.
+        """
+        if self.__is_darwin_framework_tool:
+            return None
+
+        requests = [self.__encode_payload('subscriptions', 'shutdown-all', '')]
+        for identity, node_id in peers:
+            arguments = self.__maybe_add('', hex(node_id), 'node-id')
+            arguments = self.__maybe_add(arguments, identity, 'commissioner-name')
+            requests.append(self.__encode_payload('sessionmanagement', 'expire-case-sessions', arguments))
+        return requests
+
+    def __encode_payload(self, cluster, command, arguments, command_specifier=None):
         base64_arguments = base64.b64encode(
             (f'{{ {arguments} }}').encode('utf-8')).decode('utf-8')
 
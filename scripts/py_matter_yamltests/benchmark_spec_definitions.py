@@ -0,0 +1,65 @@
+#!/usr/bin/env -S python3 -B
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the 'License');
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an 'AS IS' BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# Compares loading the cluster definitions used by the YAML tests without a cache (cold: parsing every XML file)
+# and from the definitions cache (warm).
+#
+#   scripts/py_matter_yamltests/benchmark_spec_definitions.py --iterations 5
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from matter.yamltests.definitions import SpecDefinitionsFromPaths
+from matter.yamltests.pseudo_clusters.pseudo_clusters import get_default_pseudo_clusters
+
+SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
+DEFAULT_SPECIFICATIONS_PATHS = os.path.join(SCRIPT_DIR, '..', '..', 'src/app/zap-templates/zcl/data-model/chip/*.xml')
+
+
+def measure(paths, cache_directory, iterations):
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        SpecDefinitionsFromPaths(paths, get_default_pseudo_clusters(), cache_directory)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark loading the cluster definitions, with and without cache.')
+    parser.add_argument('--specifications_paths', default=DEFAULT_SPECIFICATIONS_PATHS,
+                        help='Comma separated paths of the files containing the clusters definitions.')
+    parser.add_argument('--iterations', type=int, default=3)
+    args = parser.parse_args()
+    paths = args.specifications_paths.split(',')
+
+    cold = measure(paths, None, args.iterations)
+    with tempfile.TemporaryDirectory() as cache_directory:
+        # Fill the cache.
+        measure(paths, cache_directory, 1)
+        warm = measure(paths, cache_directory, args.iterations)
+
+    for name, durations in (('cold', cold), ('warm', warm)):
+        print(f'{name}: median {statistics.median(durations) * 1000:.1f} ms, '
+              f'min {min(durations) * 1000:.1f} ms over {len(durations)} loads')
+    print(f'speedup: {statistics.median(cold) / statistics.median(warm):.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -41,3 +41,13 @@ class TestAdapter(ABC):
         from the adapter.
         """
         pass
+
+    def reset_requests(self):
+        """
+        Return the requests, in the adapter format, that bring the adapter target back to a
+        clean state between test files (e.g. no subscription left running) when it is kept
+        running across test files, see TestRunnerBase.reset.
+
+        None means that the adapter target can not be reset this way, and is restarted instead.
+        """
+        return None
@@ -17,10 +17,12 @@
 
 import ast
 import builtins
+import copy
 import inspect
 import math
 import re
 import string
+import types
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -180,49 +182,19 @@ class BaseConstraint(ABC):
         """Get the a human readable explanation about the failure."""
         pass
 
+    def with_context(self, context):
+        '''Returns a copy of this constraint reporting its errors in the given context.'''
+        constraint = copy.copy(self)
+        constraint._context = context
+        return constraint
+
     def _raise_error(self, reason):
-        if isinstance(self, _ConstraintType):
-            raise ConstraintTypeError(self._context, reason)
-        elif isinstance(self, _ConstraintContains):
-            raise ConstraintContainsError(self._context, reason)
-        elif isinstance(self, _ConstraintExcludes):
-            raise ConstraintExcludesError(self._context, reason)
-        elif isinstance(self, _ConstraintHasMaskClear):
-            raise ConstraintHasMaskClearError(self._context, reason)
-        elif isinstance(self, _ConstraintHasMaskSet):
-            raise ConstraintHasMaskSetError(self._context, reason)
-        elif isinstance(self, _ConstraintMinLength):
-            raise ConstraintMinLengthError(self._context, reason)
-        elif isinstance(self, _ConstraintMaxLength):
-            raise ConstraintMaxLengthError(self._context, reason)
-        elif isinstance(self, _ConstraintIsHexString):
-            raise ConstraintIsHexStringError(self._context, reason)
-        elif isinstance(self, _ConstraintStartsWith):
-            raise ConstraintStartsWithError(self._context, reason)
-        elif isinstance(self, _ConstraintEndsWith):
-            raise ConstraintEndsWithError(self._context, reason)
-        elif isinstance(self, _ConstraintIsUpperCase):
-            raise ConstraintIsUpperCaseError(self._context, reason)
-        elif isinstance(self, _ConstraintIsLowerCase):
-            raise ConstraintIsLowerCaseError(self._context, reason)
-        elif isinstance(self, _ConstraintIsSetOfValues):
-            raise ConstraintIsSetOfValuesError(self._context, reason)
-        elif isinstance(self, _ConstraintMinValue):
-            raise ConstraintMinValueError(self._context, reason)
-        elif isinstance(self, _ConstraintMaxValue):
-            raise ConstraintMaxValueError(self._context, reason)
-        elif isinstance(self, _ConstraintNotValue):
-            raise ConstraintNotValueError(self._context, reason)
-        elif isinstance(self, _ConstraintAnyOf):
-            raise ConstraintAnyOfError(self._context, reason)
-        elif isinstance(self, _ConstraintPython):
-            raise ConstraintPythonError(self._context, reason)
-        else:
-            # This should not happens.
-            raise ConstraintParseError('Unknown constraint instance.')
+        raise self._error(self._context, reason)
 
 
 class _ConstraintHasValue(BaseConstraint):
+    _error = ConstraintHasValueError
+
     def __init__(self, context, has_value):
         super().__init__(context, types=[])
         self._has_value = has_value
@@ -235,7 +207,7 @@ class _ConstraintHasValue(BaseConstraint):
             return
 
         reason = self.get_reason(value, value_type_name)
-        raise ConstraintHasValueError(self._context, reason)
+        self._raise_error(reason)
 
     def check_response(self, value, value_type_name) -> bool:
         has_value = value is not None
@@ -247,150 +219,102 @@ class _ConstraintHasValue(BaseConstraint):
         return f"The response contains the value ({value}), but wasn't expecting any value."
 
 
+def _is_floating_point(value):
+    return (value >= -1.7976931348623157E+308 and value <= -2.2250738585072014E-308) or value == 0.0 or (
+        value >= 2.2250738585072014E-308 and value <= 1.7976931348623157E+308) or math.isnan(value) or math.isinf(value)
+
+
+def _in_range(minimum, maximum):
+    return lambda value: value >= minimum and value <= maximum
+
+
+# The python type of the values of a type constraint, if the values need to be exactly of this type (or may be of a
+# subclass of it), and the range of those values.
+_TYPE_CHECKS = {
+    'boolean': (bool, True, None),
+    'struct': (dict, True, None),
+    'list': (list, True, None),
+    'char_string': (str, True, None),
+    'long_char_string': (str, True, None),
+    'octet_string': (bytes, True, None),
+    'long_octet_string': (bytes, True, None),
+    'group_id': (int, True, _in_range(0, 0xFFFF)),
+    'vendor_id': (int, True, _in_range(0, 0xFFFF)),
+    'devtype_id': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'nullable_cluster_id': (int, True, _in_range(0, 0xFFFFFFFE)),
+    'cluster_id': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'attribute_id': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'field_id': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'command_id': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'event_id': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'action_id': (int, True, _in_range(0, 0xFF)),
+    'transaction_id': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'nullable_node_id': (int, True, _in_range(0, 0xFFFFFFFFFFFFFFFE)),
+    'node_id': (int, True, _in_range(0, 0xFFFFFFFFFFFFFFFF)),
+    'bitmap8': (int, True, _in_range(0, 0xFF)),
+    'bitmap16': (int, True, _in_range(0, 0xFFFF)),
+    'bitmap32': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'bitmap64': (int, True, _in_range(0, 0xFFFFFFFFFFFFFFFF)),
+    'enum8': (int, False, _in_range(0, 0xFF)),
+    'enum16': (int, False, _in_range(0, 0xFFFF)),
+    'Percent': (int, True, _in_range(0, 0xFF)),
+    'Percent100ths': (int, True, _in_range(0, 0xFFFF)),
+    'epoch_us': (int, True, _in_range(0, 0xFFFFFFFFFFFFFFFF)),
+    'epoch_s': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'utc': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'date': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'tod': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'int8u': (int, True, _in_range(0, 0xFF)),
+    'int16u': (int, True, _in_range(0, 0xFFFF)),
+    'int24u': (int, True, _in_range(0, 0xFFFFFF)),
+    'int32u': (int, True, _in_range(0, 0xFFFFFFFF)),
+    'int40u': (int, True, _in_range(0, 0xFFFFFFFFFF)),
+    'int48u': (int, True, _in_range(0, 0xFFFFFFFFFFFF)),
+    'int56u': (int, True, _in_range(0, 0xFFFFFFFFFFFFFF)),
+    'int64u': (int, True, _in_range(0, 0xFFFFFFFFFFFFFFFF)),
+    'nullable_int8u': (int, True, _in_range(0, 0xFE)),
+    'nullable_int16u': (int, True, _in_range(0, 0xFFFE)),
+    'nullable_int24u': (int, True, _in_range(0, 0xFFFFFE)),
+    'nullable_int32u': (int, True, _in_range(0, 0xFFFFFFFE)),
+    'nullable_int40u': (int, True, _in_range(0, 0xFFFFFFFFFE)),
+    'nullable_int48u': (int, True, _in_range(0, 0xFFFFFFFFFFFE)),
+    'nullable_int56u': (int, True, _in_range(0, 0xFFFFFFFFFFFFFE)),
+    'nullable_int64u': (int, True, _in_range(0, 0xFFFFFFFFFFFFFFFE)),
+    'int8s': (int, True, _in_range(-128, 127)),
+    'int16s': (int, True, _in_range(-32768, 32767)),
+    'int24s': (int, True, _in_range(-8388608, 8388607)),
+    'int32s': (int, True, _in_range(-2147483648, 2147483647)),
+    'int40s': (int, True, _in_range(-549755813888, 549755813887)),
+    'int48s': (int, True, _in_range(-140737488355328, 140737488355327)),
+    'int56s': (int, True, _in_range(-36028797018963968, 36028797018963967)),
+    'int64s': (int, True, _in_range(-9223372036854775808, 9223372036854775807)),
+    'nullable_int8s': (int, True, _in_range(-127, 127)),
+    'nullable_int16s': (int, True, _in_range(-32767, 32767)),
+    'nullable_int24s': (int, True, _in_range(-8388607, 8388607)),
+    'nullable_int32s': (int, True, _in_range(-2147483647, 2147483647)),
+    'nullable_int40s': (int, True, _in_range(-549755813887, 549755813887)),
+    'nullable_int48s': (int, True, _in_range(-140737488355327, 140737488355327)),
+    'nullable_int56s': (int, True, _in_range(-36028797018963967, 36028797018963967)),
+    'nullable_int64s': (int, True, _in_range(-9223372036854775807, 9223372036854775807)),
+    'single': (float, True, _is_floating_point),
+    'double': (float, True, _is_floating_point),
+}
+
+
 class _ConstraintType(BaseConstraint):
+    _error = ConstraintTypeError
+
     def __init__(self, context, type):
         super().__init__(context, types=[], is_null_allowed=True)
         self._type = type
+        self._type_check = _TYPE_CHECKS.get(type)
 
     def check_response(self, value, value_type_name) -> bool:
-        success = False
-        if self._type == 'boolean' and type(value) is bool:
-            success = True
-        elif self._type == 'struct' and type(value) is dict:
-            success = True
-        elif self._type == 'list' and type(value) is list:
-            success = True
-        elif self._type == 'char_string' and type(value) is str:
-            success = True
-        elif self._type == 'long_char_string' and type(value) is str:
-            success = True
-        elif self._type == 'octet_string' and type(value) is bytes:
-            success = True
-        elif self._type == 'long_octet_string' and type(value) is bytes:
-            success = True
-        elif self._type == 'group_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFF
-        elif self._type == 'vendor_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFF
-        elif self._type == 'devtype_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'nullable_cluster_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFE
-        elif self._type == 'cluster_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'attribute_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'field_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'command_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'event_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'action_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFF
-        elif self._type == 'transaction_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'nullable_node_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFFFFFE
-        elif self._type == 'node_id' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFFFFFF
-        elif self._type == 'bitmap8' and type(value) is int:
-            success = value >= 0 and value <= 0xFF
-        elif self._type == 'bitmap16' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFF
-        elif self._type == 'bitmap32' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'bitmap64' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFFFFFF
-        elif self._type == 'enum8' and isinstance(value, int):
-            success = value >= 0 and value <= 0xFF
-        elif self._type == 'enum16' and isinstance(value, int):
-            success = value >= 0 and value <= 0xFFFF
-        elif self._type == 'Percent' and type(value) is int:
-            success = value >= 0 and value <= 0xFF
-        elif self._type == 'Percent100ths' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFF
-        elif self._type == 'epoch_us' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFFFFFF
-        elif self._type == 'epoch_s' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'utc' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'date' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'tod' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'int8u' and type(value) is int:
-            success = value >= 0 and value <= 0xFF
-        elif self._type == 'int16u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFF
-        elif self._type == 'int24u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFF
-        elif self._type == 'int32u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFF
-        elif self._type == 'int40u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFF
-        elif self._type == 'int48u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFF
-        elif self._type == 'int56u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFFFF
-        elif self._type == 'int64u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFFFFFF
-        elif self._type == 'nullable_int8u' and type(value) is int:
-            success = value >= 0 and value <= 0xFE
-        elif self._type == 'nullable_int16u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFE
-        elif self._type == 'nullable_int24u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFE
-        elif self._type == 'nullable_int32u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFE
-        elif self._type == 'nullable_int40u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFE
-        elif self._type == 'nullable_int48u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFE
-        elif self._type == 'nullable_int56u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFFFE
-        elif self._type == 'nullable_int64u' and type(value) is int:
-            success = value >= 0 and value <= 0xFFFFFFFFFFFFFFFE
-        elif self._type == 'int8s' and type(value) is int:
-            success = value >= -128 and value <= 127
-        elif self._type == 'int16s' and type(value) is int:
-            success = value >= -32768 and value <= 32767
-        elif self._type == 'int24s' and type(value) is int:
-            success = value >= -8388608 and value <= 8388607
-        elif self._type == 'int32s' and type(value) is int:
-            success = value >= -2147483648 and value <= 2147483647
-        elif self._type == 'int40s' and type(value) is int:
-            success = value >= -549755813888 and value <= 549755813887
-        elif self._type == 'int48s' and type(value) is int:
-            success = value >= -140737488355328 and value <= 140737488355327
-        elif self._type == 'int56s' and type(value) is int:
-            success = value >= -36028797018963968 and value <= 36028797018963967
-        elif self._type == 'int64s' and type(value) is int:
-            success = value >= -9223372036854775808 and value <= 9223372036854775807
-        elif self._type == 'nullable_int8s' and type(value) is int:
-            success = value >= -127 and value <= 127
-        elif self._type == 'nullable_int16s' and type(value) is int:
-            success = value >= -32767 and value <= 32767
-        elif self._type == 'nullable_int24s' and type(value) is int:
-            success = value >= -8388607 and value <= 8388607
-        elif self._type == 'nullable_int32s' and type(value) is int:
-            success = value >= -2147483647 and value <= 2147483647
-        elif self._type == 'nullable_int40s' and type(value) is int:
-            success = value >= -549755813887 and value <= 549755813887
-        elif self._type == 'nullable_int48s' and type(value) is int:
-            success = value >= -140737488355327 and value <= 140737488355327
-        elif self._type == 'nullable_int56s' and type(value) is int:
-            success = value >= -36028797018963967 and value <= 36028797018963967
-        elif self._type == 'nullable_int64s' and type(value) is int:
-            success = value >= -9223372036854775807 and value <= 9223372036854775807
-        elif self._type == 'single' and type(value) is float:
-            success = self._is_single(value)
-        elif self._type == 'double' and type(value) is float:
-            success = self._is_double(value)
-        else:
-            success = self._type == value_type_name
-        return success
+        if self._type_check is not None:
+            python_type, is_exact_type, in_range = self._type_check
+            if type(value) is python_type if is_exact_type else isinstance(value, python_type):
+                return in_range is None or in_range(value)
+        return self._type == value_type_name
 
     def get_reason(self, value, value_type_name) -> str:
         types = []
@@ -549,15 +473,15 @@ class _ConstraintType(BaseConstraint):
         return reason
 
     def _is_single(self, value):
-        return (value >= -1.7976931348623157E+308 and value <= -2.2250738585072014E-308) or value == 0.0 or (
-            value >= 2.2250738585072014E-308 and value <= 1.7976931348623157E+308) or math.isnan(value) or math.isinf(value)
+        return _is_floating_point(value)
 
     def _is_double(self, value):
-        return (value >= -1.7976931348623157E+308 and value <= -2.2250738585072014E-308) or value == 0.0 or (
-            value >= 2.2250738585072014E-308 and value <= 1.7976931348623157E+308) or math.isnan(value) or math.isinf(value)
+        return _is_floating_point(value)
 
 
 class _ConstraintMinLength(BaseConstraint):
+    _error = ConstraintMinLengthError
+
     def __init__(self, context, min_length):
         super().__init__(context, types=[
             str, bytes, list], is_null_allowed=True)
@@ -571,6 +495,8 @@ class _ConstraintMinLength(BaseConstraint):
 
 
 class _ConstraintMaxLength(BaseConstraint):
+    _error = ConstraintMaxLengthError
+
     def __init__(self, context, max_length):
         super().__init__(context, types=[
             str, bytes, list], is_null_allowed=True)
@@ -584,6 +510,8 @@ class _ConstraintMaxLength(BaseConstraint):
 
 
 class _ConstraintIsHexString(BaseConstraint):
+    _error = ConstraintIsHexStringError
+
     def __init__(self, context, is_hex_string: bool):
         super().__init__(context, types=[str])
         self._is_hex_string = is_hex_string
@@ -609,6 +537,8 @@ class _ConstraintIsHexString(BaseConstraint):
 
 
 class _ConstraintStartsWith(BaseConstraint):
+    _error = ConstraintStartsWithError
+
     def __init__(self, context, starts_with):
         super().__init__(context, types=[str])
         self._starts_with = starts_with
@@ -621,6 +551,8 @@ class _ConstraintStartsWith(BaseConstraint):
 
 
 class _ConstraintEndsWith(BaseConstraint):
+    _error = ConstraintEndsWithError
+
     def __init__(self, context, ends_with):
         super().__init__(context, types=[str])
         self._ends_with = ends_with
@@ -633,6 +565,8 @@ class _ConstraintEndsWith(BaseConstraint):
 
 
 class _ConstraintIsUpperCase(BaseConstraint):
+    _error = ConstraintIsUpperCaseError
+
     def __init__(self, context, is_upper_case):
         super().__init__(context, types=[str])
         self._is_upper_case = is_upper_case
@@ -661,6 +595,8 @@ class _ConstraintIsUpperCase(BaseConstraint):
 
 
 class _ConstraintIsLowerCase(BaseConstraint):
+    _error = ConstraintIsLowerCaseError
+
     def __init__(self, context, is_lower_case):
         super().__init__(context, types=[str])
         self._is_lower_case = is_lower_case
@@ -689,6 +625,8 @@ class _ConstraintIsLowerCase(BaseConstraint):
 
 
 class _ConstraintMinValue(BaseConstraint):
+    _error = ConstraintMinValueError
+
     def __init__(self, context, min_value):
         super().__init__(context, types=[int, float], is_null_allowed=True)
         self._min_value = min_value
@@ -701,6 +639,8 @@ class _ConstraintMinValue(BaseConstraint):
 
 
 class _ConstraintMaxValue(BaseConstraint):
+    _error = ConstraintMaxValueError
+
     def __init__(self, context, max_value):
         super().__init__(context, types=[int, float], is_null_allowed=True)
         self._max_value = max_value
@@ -735,6 +675,8 @@ def _values_match(expected_value, received_value):
 
 
 class _ConstraintContains(BaseConstraint):
+    _error = ConstraintContainsError
+
     def __init__(self, context, contains):
         super().__init__(context, types=[list])
         self._contains = contains
@@ -764,6 +706,8 @@ class _ConstraintContains(BaseConstraint):
 
 
 class _ConstraintIsSetOfValues(BaseConstraint):
+    _error = ConstraintIsSetOfValuesError
+
     def __init__(self, context, expected):
         super().__init__(context, types=[list])
         self._expected = expected
@@ -799,6 +743,8 @@ class _ConstraintIsSetOfValues(BaseConstraint):
 
 
 class _ConstraintExcludes(BaseConstraint):
+    _error = ConstraintExcludesError
+
     def __init__(self, context, excludes):
         super().__init__(context, types=[list])
         self._excludes = excludes
@@ -822,6 +768,8 @@ class _ConstraintExcludes(BaseConstraint):
 
 
 class _ConstraintHasMaskSet(BaseConstraint):
+    _error = ConstraintHasMaskSetError
+
     def __init__(self, context, has_masks_set):
         super().__init__(context, types=[int])
         self._has_masks_set = has_masks_set
@@ -840,6 +788,8 @@ class _ConstraintHasMaskSet(BaseConstraint):
 
 
 class _ConstraintHasMaskClear(BaseConstraint):
+    _error = ConstraintHasMaskClearError
+
     def __init__(self, context, has_masks_clear):
         super().__init__(context, types=[int])
         self._has_masks_clear = has_masks_clear
@@ -858,6 +808,8 @@ class _ConstraintHasMaskClear(BaseConstraint):
 
 
 class _ConstraintNotValue(BaseConstraint):
+    _error = ConstraintNotValueError
+
     def __init__(self, context, not_value):
         # NOTE: do not use is_null_allowed=True here, because 'notValue: null' needs to work.
         super().__init__(context, types=[])
@@ -871,6 +823,8 @@ class _ConstraintNotValue(BaseConstraint):
 
 
 class _ConstraintAnyOf(BaseConstraint):
+    _error = ConstraintAnyOfError
+
     def __init__(self, context, any_of):
         super().__init__(context, types=[], is_null_allowed=True)
         self._any_of = any_of
@@ -882,7 +836,18 @@ class _ConstraintAnyOf(BaseConstraint):
         return f'The response value "{value}" is not a value from {self._any_of}.'
 
 
+def _referenced_names(code: types.CodeType) -> frozenset:
+    '''The names used by the code and the functions, lambdas and comprehensions it defines.'''
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _referenced_names(const)
+    return frozenset(names)
+
+
 class _ConstraintPython(BaseConstraint):
+    _error = ConstraintPythonError
+
     def __init__(self, context, source: str):
         super().__init__(context, types=[], is_null_allowed=False)
 
@@ -892,16 +857,17 @@ class _ConstraintPython(BaseConstraint):
         parsed = ast.parse(source)
         module = ast.parse('def _func(value): pass')
         module.body[0].body = parsed.body  # inject parsed body
-        self._ast = module
+        # Compile it once, and make a new function of the code of _func for every validation.
+        self._code = next(const for const in compile(module, '<string>', 'exec').co_consts
+                          if isinstance(const, types.CodeType))
+        self._names = _referenced_names(self._code)
 
     def validate(self, value, value_type_name, runtime_variables):
-        # Build a global scope that includes all runtime variables
-        scope = {name: fix_typed_yaml_value(
-            value) for name, value in runtime_variables.items()}
+        # Build a global scope that includes the runtime variables used by the source
+        scope = {name: fix_typed_yaml_value(runtime_variables[name])
+                 for name in self._names if name in runtime_variables}
         scope['__builtins__'] = self.BUILTINS
-        # Execute the module AST and extract the defined function
-        exec(compile(self._ast, '<string>', 'exec'), scope)
-        func = scope['_func']
+        func = types.FunctionType(self._code, scope)
         # Call the function to validate the value
         try:
             valid = func(value)
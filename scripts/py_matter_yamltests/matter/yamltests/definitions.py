@@ -15,9 +15,17 @@
 
 import enum
 import glob
+import hashlib
 import io
+import logging
+import os
+import pickle
+import sys
+import tempfile
 from typing import List, Optional
 
+import matter.idl.matter_idl_types
+import matter.idl.zapxml
 from matter.idl.matter_idl_types import (Attribute, Bitmap, Cluster, Command, Enum, Event, FieldQuality, Struct, StructQuality,
                                          StructTag)
 from matter.idl.zapxml import ParseSource, ParseXmls
@@ -283,7 +291,84 @@ class SpecDefinitions:
         return target | global_target
 
 
-def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoClusters] = PseudoClusters([])):
+# Bump when the content of SpecDefinitions changes, to invalidate the cached definitions.
+_CACHE_FORMAT_VERSION = 1
+
+
+def _parser_digest() -> bytes:
+    """Hashes the sources of the XML parser and of this module (SpecDefinitions is cached as a whole), so that a
+    change to them invalidates the cached definitions."""
+    digest = hashlib.sha256()
+    parser_files = [__file__, matter.idl.matter_idl_types.__file__]
+    for root, _, files in os.walk(os.path.dirname(matter.idl.zapxml.__file__)):
+        parser_files.extend(os.path.join(root, name) for name in files if name.endswith('.py'))
+    for path in sorted(parser_files):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def _sources_digest(sources: List[ParseSource]) -> Optional[str]:
+    """Returns a hash of the content of the sources, or None if one of them can not be read without consuming it."""
+    digest = hashlib.sha256()
+    digest.update(f'{_CACHE_FORMAT_VERSION}:{sys.version_info.major}.{sys.version_info.minor}'.encode())
+    digest.update(_parser_digest())
+    for source in sources:
+        if isinstance(source.source, str):
+            with open(source.source, 'rb') as f:
+                content = f.read()
+        elif isinstance(source.source, io.StringIO):
+            content = source.source.getvalue().encode()
+        else:
+            return None
+        # The name ends up in the definitions, e.g. in the parsing metadata.
+        digest.update(source.source_file_name.encode())
+        digest.update(len(content).to_bytes(8, 'little'))
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def LoadSpecDefinitions(sources: List[ParseSource], cache_directory: Optional[str] = None) -> SpecDefinitions:
+    """Builds the SpecDefinitions of the sources.
+
+    With a cache_directory, the definitions (the parsed clusters and the lookup tables built from them) are stored
+    there, keyed by a hash of the content of the sources: loading the same sources again skips parsing the XML
+    altogether. Cached definitions which can not be loaded are rebuilt.
+    """
+    key = _sources_digest(sources) if cache_directory else None
+    if key is None:
+        return SpecDefinitions(sources)
+
+    cache_path = os.path.join(cache_directory, f'spec-definitions-{key}.pickle')
+    try:
+        with open(cache_path, 'rb') as f:
+            definitions = pickle.load(f)
+        if isinstance(definitions, SpecDefinitions):
+            return definitions
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning(f'Ignoring cached definitions {cache_path}: {e}')
+
+    definitions = SpecDefinitions(sources)
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        # Written to a temporary file first, so that concurrent runs never read a partial cache.
+        fd, temporary_path = tempfile.mkstemp(dir=cache_directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(definitions, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, cache_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+    except OSError as e:
+        logging.warning(f'Can not cache definitions in {cache_directory}: {e}')
+    return definitions
+
+
+def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoClusters] = PseudoClusters([]),
+                             cache_directory: Optional[str] = None):
     filenames = []
     for path in paths:
         if '*' in path or '?' in path:
@@ -300,4 +385,4 @@ def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: Optional[PseudoCluster
             sources = (
                 sources + [ParseSource(source=io.StringIO(definition), name=name)])
 
-    return SpecDefinitions(sources)
+    return LoadSpecDefinitions(sources, cache_directory)
@@ -267,6 +267,12 @@ class EnumType:
         return target_type == 'enum8' or target_type == 'enum16'
 
 
+def _get_response_constraints(responses):
+    '''Returns, for every value of every response, its constraints and the constraints parsed from them.'''
+    return [[(value['constraints'], get_constraints(value['constraints'])) if 'constraints' in value
+             else (None, None) for value in response['values']] for response in responses]
+
+
 class _TestStepWithPlaceholders:
     '''A single YAML test parsed, as is, from YAML.
 
@@ -341,16 +347,11 @@ class _TestStepWithPlaceholders:
         self.update_arguments(self.arguments_with_placeholders)
         self.update_responses(self.responses_with_placeholders)
 
-        # This performs a very basic sanity parse time check of constraints. This parsing happens
-        # again inside post processing response since at that time we will have required variables
-        # to substitute in. This parsing check here has value since some test can take a really
-        # long time to run so knowing earlier on that the test step would have failed at parsing
-        # time before the test step run occurs save developer time that building yaml tests.
-        for response in self.responses_with_placeholders:
-            for value in response:
-                if 'constraints' not in value:
-                    continue
-                get_constraints(value['constraints'])
+        # The constraints of every response value are parsed once, at parse time. Knowing earlier on that
+        # the test step would have failed at parsing time before the test step run occurs save developer
+        # time that building yaml tests, since some test can take a really long time to run. The test
+        # steps reuse those constraints, unless substituting the variables changes their values.
+        self.constraints_with_placeholders = _get_response_constraints(self.responses_with_placeholders)
 
     def _update_mappings(self, test: dict, definitions: SpecDefinitions):
         cluster_name = self.cluster
@@ -748,6 +749,23 @@ class TestStep:
                 self._test.node_id)
             test.update_arguments(self.arguments)
             test.update_responses(self.responses)
+        self._constraints = self._bind_constraints(test.constraints_with_placeholders)
+
+    def _bind_constraints(self, constraints_with_placeholders):
+        '''Returns the constraints of every response value, reporting their errors in this step.'''
+        constraints = []
+        for response, response_constraints in zip(self.responses, constraints_with_placeholders):
+            values_constraints = []
+            for value, (placeholders, value_constraints) in zip(response['values'], response_constraints):
+                if value_constraints is None:
+                    values_constraints.append(None)
+                elif value['constraints'] == placeholders:
+                    values_constraints.append([constraint.with_context(value['constraints'])
+                                               for constraint in value_constraints])
+                else:
+                    values_constraints.append(get_constraints(value['constraints']))
+            constraints.append(values_constraints)
+        return constraints
 
     @property
     def step_index(self):
@@ -908,7 +926,7 @@ class TestStep:
                                                f'but got {len(received_responses)} responses.')
 
         received_responses_copy = copy.deepcopy(received_responses)
-        for expected_response in self.responses:
+        for expected_response, constraints in zip(self.responses, self._constraints):
             if len(received_responses_copy) == 0:
                 result.error(check_type, error_failure_wrong_response_number)
                 return result
@@ -922,7 +940,7 @@ class TestStep:
             self._response_values_validation(
                 expected_response, received_response, result)
             self._response_constraints_validation(
-                expected_response, received_response, result)
+                expected_response, received_response, constraints, result)
             self._maybe_save_as('saveAs', 'value',
                                 expected_response, received_response, result)
             self._maybe_save_as('saveDataVersionAs', 'dataVersion',
@@ -1123,14 +1141,14 @@ class TestStep:
         else:
             return expected_value == received_value
 
-    def _response_constraints_validation(self, expected_response, received_response, result):
+    def _response_constraints_validation(self, expected_response, received_response, values_constraints, result):
         check_type = PostProcessCheckType.CONSTRAINT_VALIDATION
         error_success = 'Constraints check passed'
         error_failure = 'Constraints check failed'
 
         response_type_name = self._test.response_mapping_name
-        for value in expected_response['values']:
-            if 'constraints' not in value:
+        for value, constraints in zip(expected_response['values'], values_constraints):
+            if constraints is None:
                 continue
 
             received_value = received_response.get('value')
@@ -1153,8 +1171,6 @@ class TestStep:
                     # constraint check by the test writter.
                     response_type_name = None
 
-            constraints = get_constraints(value['constraints'])
-
             for constraint in constraints:
                 try:
                     constraint.validate(received_value, response_type_name, self._runtime_config_variable_storage)
@@ -13,8 +13,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import functools
 import unicodedata
-from typing import List
+from typing import Callable, Dict, List, Mapping
 
 _COMMENT_CHARACTER = '#'
 _VALUE_SEPARATOR = '='
@@ -38,12 +39,125 @@ class InvalidPICSParsingError(Exception):
     pass
 
 
+PICSExpression = Callable[[Mapping[str, bool]], bool]
+
+
+@functools.lru_cache(maxsize=None)
+def compile_pics_expression(expression: str) -> PICSExpression:
+    """Compiles a PICS expression (e.g. 'OO.S.A0000 && !(OO.S.F00 || OO.S.F01)') into a function evaluating it
+    against a dictionary of PICS, keyed by lowercase PICS code.
+
+    Expressions are compiled once, and shared by every caller. A PICS code missing from the dictionary is considered
+    unsupported.
+    """
+    compiler = _PICSExpressionCompiler(_tokenize(expression))
+    return compiler.compile()
+
+
+class _PICSExpressionCompiler:
+    """Recursive descent parser of the tokens of a PICS expression, building closures. '&&' and '||' have the same
+    precedence and are right associative: 'A && B || C' is 'A && (B || C)'."""
+
+    def __init__(self, tokens: List[str]):
+        self.__tokens = tokens
+        self.__index = 0
+
+    def compile(self) -> PICSExpression:
+        return self.__compile_expression()
+
+    def __compile_expression(self) -> PICSExpression:
+        left = self.__compile_sub_expression()
+        if self.__index >= len(self.__tokens):
+            return left
+
+        token = self.__tokens[self.__index]
+
+        if token == ')':
+            return left
+
+        if token == '&&':
+            self.__index += 1
+            right = self.__compile_expression()
+            return lambda pics: left(pics) and right(pics)
+
+        if token == '||':
+            self.__index += 1
+            right = self.__compile_expression()
+            return lambda pics: left(pics) or right(pics)
+
+        raise InvalidPICSParsingError(f'Unknown token: {token}')
+
+    def __compile_sub_expression(self) -> PICSExpression:
+        token = self.__tokens[self.__index]
+        if token == '(':
+            self.__index += 1
+            expr = self.__compile_expression()
+            if self.__tokens[self.__index] != ')':
+                raise KeyError('Missing ")"')
+
+            self.__index += 1
+            return expr
+
+        if token == '!':
+            self.__index += 1
+            expr = self.__compile_sub_expression()
+            return lambda pics: not expr(pics)
+
+        code = _normalize(token)
+        self.__index += 1
+
+        # By default, let's consider that if a PICS item is not defined, it is |false|.
+        # It allows to create a file that only contains enabled features.
+        return lambda pics: pics.get(code, False)
+
+
+def _tokenize(expression: str) -> List[str]:
+    token = ''
+    tokens = []
+
+    for c in expression:
+        if c == ' ' or c == '\t' or c == '\n':
+            pass
+        elif c == '(' or c == ')' or c == '!':
+            if token:
+                tokens.append(token)
+                token = ''
+            tokens.append(c)
+        elif c == '&' or c == '|':
+            if token and token[-1] == c:
+                token = token[:-1]
+                if token:
+                    tokens.append(token)
+                    token = ''
+                tokens.append(c + c)
+            else:
+                token += c
+        else:
+            token += c
+
+    if token:
+        tokens.append(token)
+        token = ''
+
+    return tokens
+
+
+def _normalize(token: str) -> str:
+    # Convert to all-lowercase so people who mess up cases don't have things
+    # break on them in subtle ways.
+    token = token.lower()
+
+    # TODO strip off "(Additional Context)" bits from the end of the code.
+    return token
+
+
 class PICSChecker():
     """Class to compute a PICS expression"""
 
     def __init__(self, pics_file: str):
         self.__pics = {}
-        self.__expression_index = 0
+        # The PICS do not change once loaded, so neither does the value of an expression.
+        self.__results: Dict[str, bool] = {}
 
         if pics_file is not None:
             self.__pics = self.__parse(pics_file)
@@ -52,9 +166,10 @@ class PICSChecker():
         if pics is None:
             return True
 
-        self.__expression_index = 0
-        tokens = self.__tokenize(pics)
-        return self.__evaluate_expression(tokens, self.__pics)
+        result = self.__results.get(pics)
+        if result is None:
+            result = self.__results[pics] = compile_pics_expression(pics)(self.__pics)
+        return result
 
     def __parse(self, pics_file: str):
         pics = {}
@@ -79,86 +194,6 @@ class PICSChecker():
                 line = f.readline()
         return pics
 
-    def __evaluate_expression(self, tokens: List[str], pics: dict):
-        leftExpr = self.__evaluate_sub_expression(tokens, pics)
-        if self.__expression_index >= len(tokens):
-            return leftExpr
-
-        token = tokens[self.__expression_index]
-
-        if token == ')':
-            return leftExpr
-
-        token = tokens[self.__expression_index]
-
-        if token == '&&':
-            self.__expression_index += 1
-            rightExpr = self.__evaluate_expression(tokens, pics)
-            return leftExpr and rightExpr
-
-        if token == '||':
-            self.__expression_index += 1
-            rightExpr = self.__evaluate_expression(tokens, pics)
-            return leftExpr or rightExpr
-
-        raise InvalidPICSParsingError(f'Unknown token: {token}')
-
-    def __evaluate_sub_expression(self, tokens: List[str], pics: dict):
-        token = tokens[self.__expression_index]
-        if token == '(':
-            self.__expression_index += 1
-            expr = self.__evaluate_expression(tokens, pics)
-            if tokens[self.__expression_index] != ')':
-                raise KeyError('Missing ")"')
-
-            self.__expression_index += 1
-            return expr
-
-        if token == '!':
-            self.__expression_index += 1
-            expr = self.__evaluate_sub_expression(tokens, pics)
-            return not expr
-
-        token = self.__normalize(token)
-        self.__expression_index += 1
-
-        if pics.get(token) is None:
-            # By default, let's consider that if a PICS item is not defined, it is |false|.
-            # It allows to create a file that only contains enabled features.
-            return False
-
-        return pics.get(token)
-
-    def __tokenize(self, expression: str):
-        token = ''
-        tokens = []
-
-        for c in expression:
-            if c == ' ' or c == '\t' or c == '\n':
-                pass
-            elif c == '(' or c == ')' or c == '!':
-                if token:
-                    tokens.append(token)
-                    token = ''
-                tokens.append(c)
-            elif c == '&' or c == '|':
-                if token and token[-1] == c:
-                    token = token[:-1]
-                    if token:
-                        tokens.append(token)
-                        token = ''
-                    tokens.append(c + c)
-                else:
-                    token += c
-            else:
-                token += c
-
-        if token:
-            tokens.append(token)
-            token = ''
-
-        return tokens
-
     def __preprocess_input(self, value: str):
         value = self.__remove_comments(value)
         value = self.__remove_control_characters(value)
@@ -177,11 +212,3 @@ class PICSChecker():
 
     def __make_lowercase(self, value: str) -> str:
         return value.lower()
-
-    def __normalize(self, token: str):
-        # Convert to all-lowercase so people who mess up cases don't have things
-        # break on them in subtle ways.
-        token = self.__make_lowercase(token)
-
-        # TODO strip off "(Additional Context)" bits from the end of the code.
-        return token
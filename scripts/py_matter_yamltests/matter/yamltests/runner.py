@@ -105,6 +105,16 @@ class TestRunnerBase(ABC):
         """
         pass
 
+    async def reset(self, adapter):
+        """
+        This method is called before running the steps of a particular test file
+        when the runner is not started and stopped for every test file. It may
+        allow the runner to check that it is still usable and to recover, and to
+        bring the adapter target back to a clean state (see
+        TestAdapter.reset_requests).
+        """
+        pass
+
     @abstractmethod
     async def execute(self, request):
         """
@@ -163,6 +173,8 @@ class TestRunner(TestRunnerBase):
         try:
             if config.auto_start_stop:
                 await self.start()
+            else:
+                await self.reset(config.adapter)
             task = self._run(parser, config)
             status = await asyncio.wait_for(asyncio.shield(task), parser.timeout)
         except (Exception, CancelledError) as exception:
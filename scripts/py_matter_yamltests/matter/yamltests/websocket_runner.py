@@ -13,6 +13,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import asyncio
 import logging
 import re
 import select
@@ -31,15 +32,29 @@ _CONNECT_MAX_RETRIES_DEFAULT = 4
 _WEBSOCKET_SERVER_MESSAGE = '== WebSocket Server Ready'
 _WEBSOCKET_SERVER_MESSAGE_TIMEOUT = 60  # seconds
 _WEBSOCKET_SERVER_TERMINATE_TIMEOUT = 10  # seconds
+_WEBSOCKET_SERVER_POLL_INTERVAL = 0.05  # seconds
+_WEBSOCKET_SERVER_RESET_TIMEOUT = 30  # seconds
 
 
 @dataclass
 class WebSocketRunnerConfig:
+    """
+    persistent_server: If set to True, the server and the connection to it are
+                       kept across test files: the runner is expected to be
+                       started and stopped once, outside of the run method
+                       (see TestRunnerConfig.auto_start_stop). Before every
+                       test file, the adapter reset requests are sent to the
+                       server (see TestAdapter.reset_requests). The server is
+                       restarted instead if the adapter has none, if they
+                       fail, if the server is not running anymore or if it
+                       did not answer the last request.
+    """
     server_address: str = 'localhost'
     server_port: int = '9002'
     server_path: str = None
     server_arguments: str = None
     hooks: WebSocketRunnerHooks = WebSocketRunnerHooks()
+    persistent_server: bool = False
 
 
 class WebSocketRunner(TestRunner):
@@ -47,6 +62,9 @@ class WebSocketRunner(TestRunner):
         self._client = None
         self._server = None
         self._hooks = config.hooks
+        self._persistent_server = config.persistent_server
+        # Set while a request is waiting for its response.
+        self._pending_request = False
 
         self._server_connection_url = self._make_server_connection_url(
             config.server_address, config.server_port)
@@ -69,12 +87,59 @@ class WebSocketRunner(TestRunner):
         await self._stop_server(self._server)
         self._client = None
         self._server = None
+        self._pending_request = False
+
+    async def reset(self, adapter):
+        if not self._persistent_server:
+            return
+
+        if self._client is None:
+            # Before the first test file.
+            await self.start()
+            return
+
+        if self._server_startup_command and self._server.poll() is not None:
+            logging.warning('WebSocket server exited with code %d, restarting it', self._server.returncode)
+        elif self._pending_request:
+            logging.warning('WebSocket server did not answer the last request, restarting it')
+        else:
+            if not self.is_connected:
+                await self._stop_client(self._client)
+                self._client = await self._start_client(self._server_connection_url)
+
+            if adapter is None or await self._reset_adapter_target(adapter):
+                return
+
+        await self.stop()
+        await self.start()
+
+    async def _reset_adapter_target(self, adapter) -> bool:
+        requests = adapter.reset_requests() if hasattr(adapter, 'reset_requests') else None
+        if requests is None:
+            logging.info('The adapter has no reset requests, restarting the WebSocket server')
+            return False
+
+        try:
+            for request in requests:
+                response = await asyncio.wait_for(self.execute(request), _WEBSOCKET_SERVER_RESET_TIMEOUT)
+                responses, _ = adapter.decode(response)
+                if any('error' in result for result in responses):
+                    logging.warning('Reset request %s failed: %s, restarting the WebSocket server', request, responses)
+                    return False
+        except Exception as exception:
+            logging.warning('Reset request failed: %r, restarting the WebSocket server', exception)
+            return False
+
+        return True
 
     async def execute(self, request):
         instance = self._client
         if instance:
+            self._pending_request = True
             await instance.send(request)
-            return await instance.recv()
+            response = await instance.recv()
+            self._pending_request = False
+            return response
         return None
 
     async def _start_client(self, url, max_retries=_CONNECT_MAX_RETRIES_DEFAULT, interval_between_retries=1):
@@ -90,7 +155,7 @@ class WebSocketRunner(TestRunner):
                 duration = round((time.time() - start) * 1000, 0)
                 self._hooks.failure(duration)
                 self._hooks.retry(interval_between_retries)
-                time.sleep(interval_between_retries)
+                await asyncio.sleep(interval_between_retries)
                 return await self._start_client(url, max_retries - 1, interval_between_retries + 1)
 
         self._hooks.abort(url)
@@ -120,15 +185,22 @@ class WebSocketRunner(TestRunner):
                     raise Exception(
                         f'Connecting to {url} failed. WebSocket startup has not been detected.')
 
-                ready, _, _ = select.select([instance.stdout], [], [], 1)
+                # Poll without blocking the event loop.
+                ready, _, _ = select.select([instance.stdout], [], [], 0)
                 if ready:
                     line = instance.stdout.readline()
                     if len(line):
                         lines.append(line)
                         if re.search(_WEBSOCKET_SERVER_MESSAGE, line.decode('utf-8')):
                             break  # Exit the loop if the pattern is found
+                    elif instance.poll() is not None:
+                        for line in lines:
+                            print(line.decode('utf-8'), end='')
+                        self._hooks.abort(url)
+                        raise Exception(
+                            f'Connecting to {url} failed. WebSocket server exited with code {instance.returncode}.')
                 else:
-                    continue
+                    await asyncio.sleep(_WEBSOCKET_SERVER_POLL_INTERVAL)
             instance.stdout.close()
 
         return instance
@@ -136,12 +208,14 @@ class WebSocketRunner(TestRunner):
     async def _stop_server(self, instance):
         if instance:
             instance.terminate()  # sends SIGTERM
-            try:
-                instance.wait(_WEBSOCKET_SERVER_TERMINATE_TIMEOUT)
-            except subprocess.TimeoutExpired:
+            deadline = time.time() + _WEBSOCKET_SERVER_TERMINATE_TIMEOUT
+            while instance.poll() is None and time.time() < deadline:
+                await asyncio.sleep(_WEBSOCKET_SERVER_POLL_INTERVAL)
+            if instance.poll() is None:
                 logging.debug(
                     'Subprocess did not terminate on SIGTERM, killing it now')
                 instance.kill()
+                instance.wait()
 
     def _make_server_connection_url(self, address: str, port: int):
         return 'ws://' + address + ':' + str(port)
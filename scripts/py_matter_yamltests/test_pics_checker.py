@@ -17,7 +17,8 @@
 import unittest
 from unittest.mock import mock_open, patch
 
-from matter.yamltests.pics_checker import InvalidPICSConfigurationError, InvalidPICSConfigurationValueError, PICSChecker
+from matter.yamltests.pics_checker import (InvalidPICSConfigurationError, InvalidPICSConfigurationValueError,
+                                           InvalidPICSParsingError, PICSChecker, compile_pics_expression)
 
 empty_config = ''
 
@@ -183,6 +184,15 @@ class TestPICSChecker(unittest.TestCase):
         self.assertFalse(pics_checker.check(
             '( !CC.S.F00 && !CC.S.F01 && !CC.S.F02 && !CC.S.F03 && !CC.S.F04 )'))
 
+    def test_compiled_expression(self):
+        expression = compile_pics_expression('a.a || !(a.b && a.c)')
+        self.assertIs(expression, compile_pics_expression('a.a || !(a.b && a.c)'))
+        self.assertTrue(expression({'a.a': False, 'a.b': True}))
+        self.assertFalse(expression({'a.a': False, 'a.b': True, 'a.c': True}))
+
+        with self.assertRaises(InvalidPICSParsingError):
+            compile_pics_expression('(a.a) a.b')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,9 +15,14 @@
 #    limitations under the License.
 
 import io
+import os
+import tempfile
 import unittest
+from unittest import mock
 
-from matter.yamltests.definitions import Attribute, Bitmap, Command, Enum, Event, ParseSource, SpecDefinitions, Struct
+from matter.yamltests import definitions as definitions_module
+from matter.yamltests.definitions import (Attribute, Bitmap, Command, Enum, Event, LoadSpecDefinitions, ParseSource,
+                                          SpecDefinitions, Struct)
 
 source_cluster = '''<?xml version="1.0"?>
   <configurator>
@@ -475,5 +480,52 @@ class TestSpecDefinitions(unittest.TestCase):
         self.assertEqual(events, [])
 
 
+class TestSpecDefinitionsCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_directory = directory.name
+
+    def load(self, source):
+        return LoadSpecDefinitions([ParseSource(source=io.StringIO(source), name='source')], self.cache_directory)
+
+    def test_cache_hit(self):
+        definitions = self.load(source_command)
+        self.assertEqual(len(os.listdir(self.cache_directory)), 1)
+
+        with mock.patch.object(definitions_module, 'ParseXmls', side_effect=AssertionError('parsed again')):
+            cached = self.load(source_command)
+        self.assertEqual(cached.get_command_name(0x1234, 0x0), 'TestCommand')
+        self.assertIsInstance(cached.get_command_by_name('Test', 'TestCommand'), Command)
+        self.assertEqual(cached.get_cluster_names(), definitions.get_cluster_names())
+
+    def test_content_change(self):
+        self.load(source_cluster)
+        definitions = self.load(source_command)
+        self.assertEqual(len(os.listdir(self.cache_directory)), 2)
+        self.assertEqual(definitions.get_command_name(0x1234, 0x0), 'TestCommand')
+
+    def test_definitions_module_change(self):
+        self.load(source_command)
+        with tempfile.NamedTemporaryFile('w', suffix='.py') as changed:
+            with open(definitions_module.__file__) as f:
+                changed.write(f.read() + '\n# changed\n')
+            changed.flush()
+            with mock.patch.object(definitions_module, '__file__', changed.name):
+                self.load(source_command)
+        self.assertEqual(len(os.listdir(self.cache_directory)), 2)
+
+    def test_corrupted_cache(self):
+        self.load(source_command)
+        for name in os.listdir(self.cache_directory):
+            with open(os.path.join(self.cache_directory, name), 'wb') as f:
+                f.write(b'corrupted')
+
+        definitions = self.load(source_command)
+        self.assertEqual(definitions.get_command_name(0x1234, 0x0), 'TestCommand')
+        # The corrupted entry is replaced.
+        self.assertEqual(self.load(source_command).get_cluster_name(0x1234), 'Test')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env -S python3 -B
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the 'License');
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an 'AS IS' BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import unittest
+
+import websockets.protocol
+
+from matter.yamltests.websocket_runner import WebSocketRunner, WebSocketRunnerConfig
+
+_RESET_REQUESTS = ['shutdown subscriptions', 'expire sessions']
+
+
+class MockServer:
+    def __init__(self, returncode=None):
+        self.returncode = returncode
+
+    def poll(self):
+        return self.returncode
+
+
+class MockClient:
+    def __init__(self, state=websockets.protocol.State.OPEN):
+        self.state = state
+
+
+class MockAdapter:
+    def __init__(self, requests=_RESET_REQUESTS, responses=None):
+        self._requests = requests
+        self._responses = responses or {}
+
+    def reset_requests(self):
+        return self._requests
+
+    def decode(self, response):
+        return self._responses.get(response, [{}]), []
+
+
+class MockAdapterWithoutReset:
+    pass
+
+
+class TestWebSocketRunnerReset(unittest.IsolatedAsyncioTestCase):
+    def make_runner(self, server=MockServer(), client=MockClient(), pending_request=False, persistent_server=True,
+                    server_path='/path/to/server', execute_error=None):
+        runner = WebSocketRunner(WebSocketRunnerConfig(server_path=server_path, persistent_server=persistent_server))
+        runner._server = server if server_path else None
+        runner._client = client
+        runner._pending_request = pending_request
+
+        self.calls = []
+
+        async def start():
+            self.calls.append('start')
+
+        async def stop():
+            self.calls.append('stop')
+
+        async def start_client(url):
+            self.calls.append('connect')
+            return MockClient()
+
+        async def stop_client(instance):
+            self.calls.append('disconnect')
+
+        async def execute(request):
+            if execute_error:
+                raise execute_error
+            self.calls.append(request)
+            return request
+
+        runner.start, runner.stop, runner._start_client, runner._stop_client, runner.execute = (
+            start, stop, start_client, stop_client, execute)
+        return runner
+
+    async def test_decision_table(self):
+        restart = ['stop', 'start']
+        cases = [
+            ('not persistent', dict(persistent_server=False), MockAdapter(), []),
+            ('first test file', dict(server=None, client=None), MockAdapter(), ['start']),
+            ('server exited', dict(server=MockServer(returncode=1)), MockAdapter(), restart),
+            ('unanswered request', dict(pending_request=True), MockAdapter(), restart),
+            ('disconnected', dict(client=MockClient(websockets.protocol.State.CLOSED)), MockAdapter(),
+             ['disconnect', 'connect'] + _RESET_REQUESTS),
+            ('healthy', dict(), MockAdapter(), _RESET_REQUESTS),
+            ('external server', dict(server_path=None), MockAdapter(), _RESET_REQUESTS),
+            ('no adapter', dict(), None, []),
+            ('no reset requests', dict(), MockAdapter(requests=None), restart),
+            ('adapter without reset', dict(), MockAdapterWithoutReset(), restart),
+            ('reset request error', dict(), MockAdapter(responses={_RESET_REQUESTS[0]: [{'error': 'FAILURE'}]}),
+             _RESET_REQUESTS[:1] + restart),
+            ('reset request exception', dict(execute_error=ConnectionError()), MockAdapter(), restart),
+        ]
+        for name, state, adapter, expected_calls in cases:
+            with self.subTest(name):
+                runner = self.make_runner(**state)
+                await runner.reset(adapter)
+                self.assertEqual(self.calls, expected_calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
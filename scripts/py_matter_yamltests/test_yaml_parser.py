@@ -23,6 +23,7 @@ import io
 import unittest
 from unittest.mock import mock_open, patch
 
+from matter.yamltests.constraints import ConstraintMaxValueError, ConstraintPythonError
 from matter.yamltests.definitions import ParseSource, SpecDefinitions
 from matter.yamltests.errors import TestStepEnumError, TestStepEnumSpecifierNotUnknownError, TestStepEnumSpecifierWrongError
 from matter.yamltests.parser import TestParser, TestParserConfig
@@ -253,6 +254,33 @@ tests:
                 value: (myVariable +3)/7
 '''
 
+constraints_yaml = '''
+name: Test Cluster Tests
+
+config:
+    nodeId: 0x12344321
+    cluster: "Test"
+    endpoint: 1
+    maxValue: 2
+
+tests:
+    - label: "Read attribute test_enum"
+      command: "readAttribute"
+      attribute: "test_enum"
+      response:
+          saveAs: readValue
+          constraints:
+              maxValue: maxValue
+              python: value >= maxValue - 1
+
+    - label: "Read attribute test_enum again"
+      command: "readAttribute"
+      attribute: "test_enum"
+      response:
+          constraints:
+              python: value == readValue
+'''
+
 
 def mock_open_with_parameter_content(content):
     file_object = mock_open(read_data=content).return_value
@@ -343,6 +371,30 @@ class TestYamlParser(unittest.TestCase):
         self.assertRaises(TestStepEnumSpecifierNotUnknownError, TestParser,
                           enum_value_read_response_not_unknown_code_specified_yaml, parser_config)
 
+    def test_constraints(self):
+        parser_config = TestParserConfig(None, self._definitions)
+        read_value = {'endpoint': 1, 'cluster': 'Test', 'attribute': 'test_enum'}
+
+        yaml_parser = TestParser(constraints_yaml, parser_config)
+        test_steps = list(yaml_parser.tests)
+        self.assertTrue(test_steps[0].post_process_response([dict(read_value, value=2)]).is_success())
+        self.assertTrue(test_steps[1].post_process_response([dict(read_value, value=2)]).is_success())
+
+        yaml_parser = TestParser(constraints_yaml, parser_config)
+        test_steps = list(yaml_parser.tests)
+        result = test_steps[0].post_process_response([dict(read_value, value=3)])
+        errors = [entry.exception for entry in result.entries if entry.is_error()]
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ConstraintMaxValueError)
+        # The error is reported in the constraints of the step only.
+        self.assertIn('maxValue', yaml_parser.tests._tests[0].responses_with_placeholders[0]['values'][0]['constraints'])
+        self.assertNotIn('maxValue', test_steps[0].responses[0]['values'][0]['constraints'])
+
+        result = test_steps[1].post_process_response([dict(read_value, value=4)])
+        errors = [entry.exception for entry in result.entries if entry.is_error()]
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ConstraintPythonError)
+
 
 def main():
     unittest.main()
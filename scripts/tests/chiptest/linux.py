@@ -23,6 +23,7 @@ import os
 import subprocess
 import sys
 import time
+import typing
 
 from .test_definition import ApplicationPaths
 
@@ -57,6 +58,26 @@ def EnsurePrivateState():
         sys.exit(1)
 
 
+def EnsurePrivateTemporaryDirectory():
+    logging.info("Ensuring /tmp is privately accessible")
+
+    # Applications keep their state in /tmp (e.g. /tmp/chip_kvs, /tmp/chip_config.ini).
+    if subprocess.run(["mount", "-t", "tmpfs", "tmpfs", "/tmp"]).returncode != 0:
+        logging.error("Failed to mount /tmp as a temporary filesystem")
+        logging.error("Are you using --privileged if running in docker?")
+        sys.exit(1)
+
+
+def ShardWorkerCommand(index: int, count: int) -> typing.List[str]:
+    """
+    Returns the command running this script again for one shard of the
+    tests, in its own network and mount namespaces. Each worker then creates
+    its own isolated network namespaces and runs its own applications.
+    """
+    return ["unshare", "--map-root-user", "-n", "-m", "python3", sys.argv[0],
+            '--internal-inside-unshare', '--internal-shard', f'{index}/{count}'] + sys.argv[1:]
+
+
 class IsolatedNetworkNamespace:
     """Helper class to create and remove network namespaces for tests."""
 
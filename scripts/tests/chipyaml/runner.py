@@ -44,6 +44,8 @@ _DEFAULT_CONFIG_NAME = TestsFinder.get_default_configuration_name()
 _DEFAULT_CONFIG_DIR = TestsFinder.get_default_configuration_directory()
 _DEFAULT_SPECIFICATIONS_DIR = 'src/app/zap-templates/zcl/data-model/chip/*.xml'
 _DEFAULT_PICS_FILE = 'src/app/tests/suites/certification/ci-pics-values'
+_DEFAULT_SPECIFICATIONS_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                                                 'matter-yamltests')
 
 
 def get_custom_pseudo_clusters(additional_pseudo_clusters_directory: str):
@@ -68,6 +70,9 @@ def test_parser_options(f):
                      help='Path to the directory containing the tests configuration.')(f)
     f = click.option('--specifications_paths', type=click.Path(), show_default=True, default=_DEFAULT_SPECIFICATIONS_DIR,
                      help='Path to a set of files containing clusters definitions.')(f)
+    f = click.option('--specifications_cache_directory', type=click.Path(), show_default=True,
+                     default=_DEFAULT_SPECIFICATIONS_CACHE_DIR,
+                     help='Directory to cache the parsed clusters definitions in. An empty string disables the cache.')(f)
     f = click.option('--PICS', type=click.Path(exists=True), show_default=True, default=_DEFAULT_PICS_FILE,
                      help='Path to the PICS file to use.')(f)
     f = click.option('--stop_on_error', type=bool, show_default=True, default=True,
@@ -110,6 +115,8 @@ def websocket_runner_options(f):
                      help='Path to a websocket server to run at launch.')(f)
     f = click.option('--server_arguments', type=str, default=None,
                      help='Optional arguments to pass to the websocket server at launch.')(f)
+    f = click.option('--persistent_server', type=bool, default=False, show_default=True,
+                     help='Keep the websocket server running across test files instead of restarting it for each file.')(f)
     return f
 
 
@@ -255,10 +262,11 @@ CONTEXT_SETTINGS = dict(
 @click.argument('test_name')
 @test_parser_options
 @click.pass_context
-def runner_base(ctx, configuration_directory: str, test_name: str, configuration_name: str, pics: str, specifications_paths: str, stop_on_error: bool, use_default_pseudo_clusters: bool, additional_pseudo_clusters_directory: str, **kwargs):
+def runner_base(ctx, configuration_directory: str, test_name: str, configuration_name: str, pics: str, specifications_paths: str, specifications_cache_directory: str, stop_on_error: bool, use_default_pseudo_clusters: bool, additional_pseudo_clusters_directory: str, **kwargs):
     pseudo_clusters = get_custom_pseudo_clusters(
         additional_pseudo_clusters_directory) if use_default_pseudo_clusters else PseudoClusters([])
-    specifications = SpecDefinitionsFromPaths(specifications_paths.split(','), pseudo_clusters)
+    specifications = SpecDefinitionsFromPaths(specifications_paths.split(','), pseudo_clusters,
+                                              specifications_cache_directory or None)
     tests_finder = TestsFinder(configuration_directory, configuration_name)
 
     test_list = tests_finder.get(test_name)
@@ -314,12 +322,13 @@ def run(parser_group: ParserGroup, adapter: str, stop_on_error: bool, stop_on_wa
 @test_runner_options
 @websocket_runner_options
 @pass_parser_group
-def websocket(parser_group: ParserGroup, adapter: str, stop_on_error: bool, stop_on_warning: bool, stop_at_number: int, show_adapter_logs: bool, show_adapter_logs_on_error: bool, use_test_harness_log_format: bool, delay_in_ms: int, server_address: str, server_port: int, server_path: str, server_name: str, server_arguments: str):
+def websocket(parser_group: ParserGroup, adapter: str, stop_on_error: bool, stop_on_warning: bool, stop_at_number: int, show_adapter_logs: bool, show_adapter_logs_on_error: bool, use_test_harness_log_format: bool, delay_in_ms: int, server_address: str, server_port: int, server_path: str, server_name: str, server_arguments: str, persistent_server: bool):
     """Run the test suite using websockets."""
     adapter = __import__(adapter, fromlist=[None]).Adapter(parser_group.builder_config.parser_config.definitions)
     runner_options = TestRunnerOptions(stop_on_error, stop_on_warning, stop_at_number, delay_in_ms)
     runner_hooks = TestRunnerLogger(show_adapter_logs, show_adapter_logs_on_error, use_test_harness_log_format)
-    runner_config = TestRunnerConfig(adapter, parser_group.pseudo_clusters, runner_options, runner_hooks)
+    runner_config = TestRunnerConfig(adapter, parser_group.pseudo_clusters, runner_options, runner_hooks,
+                                     auto_start_stop=not persistent_server)
 
     if server_path is None and server_name:
         paths_finder = PathsFinder()
@@ -327,11 +336,16 @@ def websocket(parser_group: ParserGroup, adapter: str, stop_on_error: bool, stop
 
     websocket_runner_hooks = WebSocketRunnerLogger()
     websocket_runner_config = WebSocketRunnerConfig(
-        server_address, server_port, server_path, server_arguments, websocket_runner_hooks)
+        server_address, server_port, server_path, server_arguments, websocket_runner_hooks, persistent_server)
 
     runner = WebSocketRunner(websocket_runner_config)
     loop = asyncio.get_event_loop()
-    return loop.run_until_complete(runner.run(parser_group.builder_config, runner_config))
+    try:
+        return loop.run_until_complete(runner.run(parser_group.builder_config, runner_config))
+    finally:
+        if persistent_server:
+            # The server is started before the first test file by reset, and kept running until here.
+            loop.run_until_complete(runner.stop())
 
 
 @runner_base.command()
@@ -17,7 +17,11 @@
 import enum
 import logging
 import os
+import re
+import signal
+import subprocess
 import sys
+import threading
 import time
 import typing
 from dataclasses import dataclass, field
@@ -65,6 +69,10 @@ class RunContext:
     # If not empty, exclude tests tagged with these tags
     exclude_tags: set(TestTag) = field(default_factory={})
 
+    # When running as one of several workers, the index of this worker and
+    # the count of workers: this worker only runs every count-th test.
+    shard: typing.Optional[typing.Tuple[int, int]] = None
+
 
 @click.group(chain=True)
 @click.option(
@@ -109,6 +117,12 @@ class RunContext:
     default=False,
     help='Internal flag for running inside a unshared environment'
 )
+@click.option(
+    '--internal-shard',
+    hidden=True,
+    default=None,
+    help='Internal flag for running a shard of the tests, as INDEX/COUNT'
+)
 @click.option(
     '--include-tags',
     type=click.Choice(TestTag.__members__.keys(), case_sensitive=False),
@@ -131,7 +145,7 @@ class RunContext:
     help='Binary path of chip tool app to use to run the test')
 @click.pass_context
 def main(context, dry_run, log_level, target, target_glob, target_skip_glob,
-         no_log_timestamps, root, internal_inside_unshare, include_tags, exclude_tags, runner, chip_tool):
+         no_log_timestamps, root, internal_inside_unshare, internal_shard, include_tags, exclude_tags, runner, chip_tool):
     # Ensures somewhat pretty logging of what is going on
     log_fmt = '%(asctime)s.%(msecs)03d %(levelname)-7s %(message)s'
     if no_log_timestamps:
@@ -212,7 +226,8 @@ def main(context, dry_run, log_level, target, target_glob, target_skip_glob,
                              chip_tool=chip_tool, dry_run=dry_run,
                              runtime=runtime,
                              include_tags=include_tags,
-                             exclude_tags=exclude_tags)
+                             exclude_tags=exclude_tags,
+                             shard=tuple(map(int, internal_shard.split('/'))) if internal_shard else None)
 
 
 @main.command(
@@ -304,15 +319,31 @@ def cmd_list(context):
     default=0,
     show_default=True,
     help='Number of tests that are expected to fail in each iteration.  Overall test will pass if the number of failures matches this.  Nonzero values require --keep-going')
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help=('Number of tests to run in parallel (linux only). Each worker runs its share of the tests with its own '
+          'applications, in its own network namespaces and with its own /tmp.'))
 @click.pass_context
 def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, ota_requestor_app,
             fabric_bridge_app, tv_app, bridge_app, lit_icd_app, microwave_oven_app, rvc_app, network_manager_app,
             energy_gateway_app, energy_management_app, closure_app, chip_repl_yaml_tester,
-            chip_tool_with_python, pics_file, keep_going, test_timeout_seconds, expected_failures):
+            chip_tool_with_python, pics_file, keep_going, test_timeout_seconds, expected_failures, workers):
     if expected_failures != 0 and not keep_going:
         logging.exception(f"'--expected-failures {expected_failures}' used without '--keep-going'")
         sys.exit(2)
 
+    if workers > 1 and context.obj.shard is None and not context.obj.dry_run:
+        if sys.platform != 'linux':
+            logging.error("'--workers' is only supported on linux")
+            sys.exit(2)
+        if expected_failures != 0:
+            logging.error("'--workers' can not be used with '--expected-failures'")
+            sys.exit(2)
+        sys.exit(run_workers(workers, keep_going))
+
     runner = chiptest.runner.Runner()
 
     paths_finder = PathsFinder()
@@ -393,6 +424,8 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
         ns = chiptest.linux.IsolatedNetworkNamespace(
             unshared=context.obj.in_unshare)
         paths = chiptest.linux.PathsWithNetworkNamespaces(paths)
+        if context.obj.shard is not None:
+            chiptest.linux.EnsurePrivateTemporaryDirectory()
 
     logging.info("Each test will be executed %d times" % iterations)
 
@@ -407,6 +440,7 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
     for i in range(iterations):
         logging.info("Starting iteration %d" % (i+1))
         observed_failures = 0
+        selected = 0
         for test in context.obj.tests:
             if context.obj.include_tags:
                 if not (test.tags & context.obj.include_tags):
@@ -418,6 +452,12 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
                     logging.debug("Test %s excluded" % test.name)
                     continue
 
+            selected += 1
+            if context.obj.shard is not None:
+                index, count = context.obj.shard
+                if (selected - 1) % count != index:
+                    continue
+
             test_start = time.monotonic()
             try:
                 if context.obj.dry_run:
@@ -448,6 +488,69 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
     cleanup()
 
 
+def run_workers(count: int, keep_going: bool) -> int:
+    """
+    Runs the tests in count workers, and forwards their output prefixed with
+    the name of the worker. Without keep_going, the other workers are
+    interrupted as soon as one fails, as if with Ctrl-C.
+    """
+    start = time.monotonic()
+    lock = threading.Lock()
+    failed_tests = []
+
+    def forward(name, stream):
+        for line in stream:
+            line = line.rstrip('\n')
+            failure = re.search(r'(\S+)\s+- FAILED in', line)
+            with lock:
+                if failure:
+                    failed_tests.append(failure.group(1))
+                sys.stderr.write(f'[{name}] {line}\n')
+                sys.stderr.flush()
+
+    workers = {}
+    forwarders = []
+    for index in range(count):
+        name = f'worker {index}'
+        process = subprocess.Popen(chiptest.linux.ShardWorkerCommand(index, count), stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, errors='replace', start_new_session=True)
+        workers[name] = process
+        forwarder = threading.Thread(target=forward, args=(name, process.stdout), daemon=True)
+        forwarder.start()
+        forwarders.append(forwarder)
+
+    failed_workers = []
+    interrupted_workers = []
+    running = dict(workers)
+    while running:
+        for name, process in list(running.items()):
+            if process.poll() is None:
+                continue
+            del running[name]
+            if process.returncode != 0 and name not in interrupted_workers:
+                failed_workers.append(name)
+                if not keep_going:
+                    # The workers stop their applications when interrupted.
+                    for other_name, other in running.items():
+                        if other_name not in interrupted_workers:
+                            interrupted_workers.append(other_name)
+                            os.killpg(other.pid, signal.SIGINT)
+        time.sleep(0.1)
+
+    for forwarder in forwarders:
+        forwarder.join()
+
+    logging.info('%d workers completed in %0.2f seconds' % (count, time.monotonic() - start))
+    if interrupted_workers:
+        logging.warning('Interrupted workers: %s' % ', '.join(interrupted_workers))
+    if failed_workers:
+        logging.error('Failed workers: %s' % ', '.join(failed_workers))
+        if failed_tests:
+            logging.error('Failed tests: %s' % ', '.join(failed_tests))
+        return 2
+    return 0
+
+
 # On linux, allow an execution shell to be prepared
 if sys.platform == 'linux':
     @main.command(
@@ -31,6 +31,7 @@ from __future__ import absolute_import, annotations, print_function
 import asyncio
 import builtins
 import concurrent.futures
+import contextlib
 import copy
 import ctypes
 import enum
@@ -38,6 +39,7 @@ import json
 import logging
 import secrets
 import threading
+import time
 import typing
 from ctypes import (CDLL, CFUNCTYPE, POINTER, Structure, byref, c_bool, c_char, c_char_p, c_int, c_int32, c_size_t, c_uint8,
                     c_uint16, c_uint32, c_uint64, c_void_p, cast, create_string_buffer, pointer, py_object, string_at)
@@ -52,10 +54,12 @@ from .bdx import Bdx
 from .clusters import Attribute as ClusterAttribute
 from .clusters import ClusterObjects as ClusterObjects
 from .clusters import Command as ClusterCommand
+from .clusters.AttributeCacheStore import AttributeCacheStore
 from .clusters.CHIPClusters import ChipClusters
 from .crypto import p256keypair
-from .interaction_model import SessionParameters, SessionParametersStruct
+from .interaction_model import InteractionModelError, SessionParameters, SessionParametersStruct
 from .native import PyChipError
+from .tracing import latency
 
 __all__ = ["ChipDeviceController", "CommissioningParameters"]
 
@@ -98,6 +102,33 @@ class TransportPayloadCapability(ctypes.c_int):
     MRP_OR_TCP_PAYLOAD = 2
 
 
+@dataclass
+class NodeReadResult:
+    ''' The outcome of the read or subscription of one node in ReadMany or SubscribeMany.
+
+        response is what Read returns for the node (a ReadResponse, or a SubscriptionTransaction), error the exception
+        raised instead. latencySeconds covers establishing the session and the transaction, not the time spent waiting
+        for a free slot.
+    '''
+    nodeid: int
+    response: typing.Any = None
+    error: typing.Optional[Exception] = None
+    latencySeconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class DeviceProxyCacheStats:
+    ''' Counters of the device proxy cache of a controller, see GetConnectedDevice.
+    '''
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
 @dataclass
 class CommissioningParameters:
     setupPinCode: int
@@ -276,16 +307,19 @@ class CallbackContext:
 class CommissioningContext(CallbackContext):
     """A context manager for handling commissioning callbacks that are expected to be called exactly once.
 
-    This context also resets commissioning related device controller state.
+    This context also resets commissioning related device controller state, and records when the
+    stages of the commissioning which are reported to the controller completed (see stageTimes).
     """
 
     def __init__(self, devCtrl: ChipDeviceControllerBase, lock: asyncio.Lock) -> None:
         super().__init__(lock)
         self._devCtrl = devCtrl
+        self.stageTimes: typing.Dict[str, float] = {}
 
     async def __aenter__(self):
         await super().__aenter__()
         self._devCtrl._fabricCheckNodeId = -1
+        self.stageTimes = {'start': time.monotonic()}
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
@@ -466,6 +500,19 @@ class ChipDeviceControllerBase():
         self._open_window_context: CallbackContext = CallbackContext(asyncio.Lock())
         self._unpair_device_context: CallbackContext = CallbackContext(asyncio.Lock())
         self._pase_establishment_context: CallbackContext = CallbackContext(self._commissioning_lock)
+        # Read/subscribe transactions started by ReadMany in flight per node, across all the calls to ReadMany.
+        self._readManyInFlight: typing.Dict[int, int] = {}
+        self._readManyCondition: typing.Optional[typing.Tuple[asyncio.AbstractEventLoop, asyncio.Condition]] = None
+        # Operational device proxies with a live session per (node id, payload capability), see GetConnectedDevice.
+        self._deviceProxyCache: typing.Dict[typing.Tuple[int, int], DeviceProxyWrapper] = {}
+        self._deviceProxyCacheStats = DeviceProxyCacheStats()
+        # Commissioning completion invalidates the cache from the CHIP thread.
+        self._deviceProxyCacheLock = threading.Lock()
+        # Views of the attributes read by ReadIncremental, see there for the key.
+        self._incrementalReadCaches: typing.Dict[typing.Tuple, ClusterAttribute.AttributeCache] = {}
+        self._attributeCacheStore: typing.Optional[AttributeCacheStore] = None
+        self._invokeCoalescer: typing.Optional[ClusterCommand.InvokeCoalescer] = None
+        self._writeCoalescer: typing.Optional[ClusterAttribute.WriteCoalescer] = None
 
     def _set_dev_ctrl(self, devCtrl, pairingDelegate):
         def HandleCommissioningComplete(nodeId: int, err: PyChipError):
@@ -479,6 +526,8 @@ class ChipDeviceControllerBase():
             if self._dmLib.pychip_TestCommissionerUsed():
                 err = self._dmLib.pychip_GetCompletionError()
 
+            self.InvalidateDeviceProxyCache(nodeId)
+
             if self._commissioning_context.future is None:
                 LOGGER.exception("HandleCommissioningComplete called unexpectedly")
                 return
@@ -536,6 +585,8 @@ class ChipDeviceControllerBase():
                 # Only complete the future if PASE session establishment failed.
                 if not err.is_success:
                     self._commissioning_context.future.set_exception(err.to_exception())
+                else:
+                    self._commissioning_context.stageTimes['pase'] = time.monotonic()
                 return
 
             if self._pase_establishment_context.future is None:
@@ -610,6 +661,13 @@ class ChipDeviceControllerBase():
     def isActive(self) -> bool:
         return self._isActive
 
+    @property
+    def commissioningStageTimes(self) -> typing.Dict[str, float]:
+        ''' The time.monotonic() at which the stages of the latest commissioning completed: 'start' and, once the
+            PASE session is established, 'pase'.
+        '''
+        return dict(self._commissioning_context.stageTimes)
+
     def Shutdown(self):
         '''
         Shuts down this controller and reclaims any used resources, including the bound
@@ -624,6 +682,8 @@ class ChipDeviceControllerBase():
         if not self._isActive:
             return
 
+        self.InvalidateDeviceProxyCache()
+
         if self.devCtrl is not None:
             self._ChipStack.Call(
                 lambda: self._dmLib.pychip_DeviceController_DeleteDeviceController(
@@ -722,6 +782,10 @@ class ChipDeviceControllerBase():
             None.
         '''
         self.CheckIsActive()
+        self.InvalidateDeviceProxyCache(nodeid)
+        self.ClearIncrementalReadCache(nodeid)
+        if self._attributeCacheStore is not None:
+            self._attributeCacheStore.Delete(nodeid)
 
         async with self._unpair_device_context as ctx:
             await self._ChipStack.CallAsync(
@@ -761,6 +825,7 @@ class ChipDeviceControllerBase():
             ChipStackError: On failure.
         '''
         self.CheckIsActive()
+        self.InvalidateDeviceProxyCache(nodeid)
 
         self._ChipStack.Call(lambda: self._dmLib.pychip_ExpireSessions(self.devCtrl, nodeid)).raise_on_error()
 
@@ -784,6 +849,7 @@ class ChipDeviceControllerBase():
             PyChipError: If the operation fails.
         '''
         self.CheckIsActive()
+        self.InvalidateDeviceProxyCache(nodeid)
 
         self._ChipStack.Call(
             lambda: self._dmLib.pychip_DeviceController_MarkSessionDefunct(
@@ -807,6 +873,7 @@ class ChipDeviceControllerBase():
             PyChipError: If the operation fails.
         '''
         self.CheckIsActive()
+        self.InvalidateDeviceProxyCache(nodeid)
 
         self._ChipStack.Call(
             lambda: self._dmLib.pychip_DeviceController_MarkSessionForEviction(
@@ -829,6 +896,8 @@ class ChipDeviceControllerBase():
 
     async def _establishPASESession(self, callFunct):
         self.CheckIsActive()
+        # A commissionee proxy takes precedence over the operational one of the same node, see GetConnectedDevice.
+        self.InvalidateDeviceProxyCache()
 
         async with self._pase_establishment_context as ctx:
             self._enablePairingCompleteCallback(True)
@@ -1401,6 +1470,12 @@ class ChipDeviceControllerBase():
         '''
         Gets an OperationalDeviceProxy or CommissioneeDeviceProxy for the specified Node.
 
+        Operational device proxies are cached per node: as long as the session of the cached proxy is active, it is
+        returned after a single session check on the CHIP thread, without looking up a PASE session and a connected
+        device. The cache is invalidated by ExpireSessions, MarkSessionDefunct, MarkSessionForEviction, UnpairDevice,
+        PASE session establishment, commissioning, a failed read, write or invoke, or explicitly by
+        InvalidateDeviceProxyCache.
+
         Args:
             nodeId (int): Target's Node ID.
             allowPASE (bool): Get a device proxy of a device being commissioned.
@@ -1411,6 +1486,21 @@ class ChipDeviceControllerBase():
         '''
         self.CheckIsActive()
 
+        cacheKey = (nodeid, int(payloadCapability))
+        with self._deviceProxyCacheLock:
+            cachedDevice = self._deviceProxyCache.get(cacheKey)
+        if cachedDevice is not None:
+            isActiveSession = c_bool(False)
+            res = await self._ChipStack.CallAsyncWithResult(
+                lambda: self._dmLib.pychip_IsActiveSession(cachedDevice.deviceProxy, pointer(isActiveSession)))
+            if res.is_success and isActiveSession.value:
+                with self._deviceProxyCacheLock:
+                    self._deviceProxyCacheStats.hits += 1
+                return cachedDevice
+            self.InvalidateDeviceProxyCache(nodeid)
+        with self._deviceProxyCacheLock:
+            self._deviceProxyCacheStats.misses += 1
+
         if allowPASE:
             returnDevice = c_void_p(None)
             res = await self._ChipStack.CallAsyncWithResult(lambda: self._dmLib.pychip_GetDeviceBeingCommissioned(
@@ -1457,7 +1547,42 @@ class ChipDeviceControllerBase():
         else:
             await future
 
-        return DeviceProxyWrapper(future.result(), DeviceProxyWrapper.DeviceProxyType.OPERATIONAL, self._dmLib)
+        device = DeviceProxyWrapper(future.result(), DeviceProxyWrapper.DeviceProxyType.OPERATIONAL, self._dmLib)
+        with self._deviceProxyCacheLock:
+            self._deviceProxyCache[cacheKey] = device
+        return device
+
+    def InvalidateDeviceProxyCache(self, nodeid: typing.Optional[int] = None):
+        '''
+        Drops the cached operational device proxies of `nodeid`, or of all nodes if `nodeid` is None, see GetConnectedDevice.
+
+        Can be called from any thread.
+        '''
+        with self._deviceProxyCacheLock:
+            for key in [key for key in self._deviceProxyCache if nodeid is None or key[0] == nodeid]:
+                del self._deviceProxyCache[key]
+                self._deviceProxyCacheStats.invalidations += 1
+
+    @contextlib.contextmanager
+    def _invalidateDeviceProxyOnError(self, nodeid: int):
+        '''
+        Drops the cached device proxies of `nodeid` when the interaction fails for another reason than a status
+        returned by the node, e.g. a timeout, as the session may be gone.
+        '''
+        try:
+            yield
+        except InteractionModelError:
+            raise
+        except Exception:
+            self.InvalidateDeviceProxyCache(nodeid)
+            raise
+
+    @property
+    def deviceProxyCacheStats(self) -> DeviceProxyCacheStats:
+        ''' Returns a copy of the hit, miss and invalidation counters of the device proxy cache.
+        '''
+        with self._deviceProxyCacheLock:
+            return copy.copy(self._deviceProxyCacheStats)
 
     def ComputeRoundTripTimeout(self, nodeid, upperLayerProcessingTimeoutMs: int = 0):
         '''
@@ -1486,11 +1611,12 @@ class ChipDeviceControllerBase():
         Returns:
             Optional[SessionParameters]: The session parameters.
         '''
+        return self._getRemoteSessionParameters(self.GetConnectedDeviceSync(nodeid))
 
+    def _getRemoteSessionParameters(self, device: DeviceProxyWrapper) -> SessionParameters:
         # First creating the struct to make building the ByteArray to be sent to CFFI easier.
         sessionParametersStruct = SessionParametersStruct.parse(b'\x00' * SessionParametersStruct.sizeof())
         sessionParametersByteArray = SessionParametersStruct.build(sessionParametersStruct)
-        device = self.GetConnectedDeviceSync(nodeid)
         self._ChipStack.Call(lambda: self._dmLib.pychip_DeviceProxy_GetRemoteSessionParameters(
             device.deviceProxy, ctypes.c_char_p(sessionParametersByteArray))).raise_on_error()
 
@@ -1573,6 +1699,8 @@ class ChipDeviceControllerBase():
         interactionTimeoutMs: Overall timeout for the interaction. Omit or set to 'None' to have the SDK automatically compute the
                               right timeout value based on transport characteristics as well as the responsiveness of the target.
 
+        With EnableInvokeCoalescing, the command may be sent in a batched invoke along with other commands to the node.
+
         Returns:
             command response. The type of the response is defined by the command.
 
@@ -1584,17 +1712,24 @@ class ChipDeviceControllerBase():
         eventLoop = asyncio.get_running_loop()
         future = eventLoop.create_future()
 
-        device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
-        allow_large_payload = payloadCapability == TransportPayloadCapability.LARGE_PAYLOAD or payloadCapability == TransportPayloadCapability.MRP_OR_TCP_PAYLOAD
-        res = await ClusterCommand.SendCommand(
-            future, eventLoop, responseType, device.deviceProxy, ClusterCommand.CommandPath(
-                EndpointId=endpoint,
-                ClusterId=payload.cluster_id,
-                CommandId=payload.command_id,
-            ), payload, timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse, allowLargePayload=allow_large_payload)
-        res.raise_on_error()
-        return await future
+        with latency.Trace('invoke', nodeid, [payload.cluster_id]) as span, self._invalidateDeviceProxyOnError(nodeid):
+            if self._invokeCoalescer is not None and busyWaitMs is None and not suppressResponse:
+                return await self._invokeCoalescer.SendCommand(
+                    nodeid, endpoint, payload, responseType, timedRequestTimeoutMs=timedRequestTimeoutMs,
+                    interactionTimeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
+            with latency.Phase(span, 'session'):
+                device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
+            allow_large_payload = payloadCapability == TransportPayloadCapability.LARGE_PAYLOAD or payloadCapability == TransportPayloadCapability.MRP_OR_TCP_PAYLOAD
+            res = await ClusterCommand.SendCommand(
+                future, eventLoop, responseType, device.deviceProxy, ClusterCommand.CommandPath(
+                    EndpointId=endpoint,
+                    ClusterId=payload.cluster_id,
+                    CommandId=payload.command_id,
+                ), payload, timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse,
+                allowLargePayload=allow_large_payload, span=span)
+            res.raise_on_error()
+            return await future
 
     async def SendBatchCommands(self, nodeid: int, commands: typing.List[ClusterCommand.InvokeRequestInfo],
                                 timedRequestTimeoutMs: typing.Optional[int] = None,
@@ -1628,14 +1763,40 @@ class ChipDeviceControllerBase():
         eventLoop = asyncio.get_running_loop()
         future = eventLoop.create_future()
 
-        device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
+        with self._invalidateDeviceProxyOnError(nodeid):
+            device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
 
-        res = await ClusterCommand.SendBatchCommands(
-            future, eventLoop, device.deviceProxy, commands,
-            timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
-        res.raise_on_error()
-        return await future
+            res = await ClusterCommand.SendBatchCommands(
+                future, eventLoop, device.deviceProxy, commands,
+                timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, suppressResponse=suppressResponse)
+            res.raise_on_error()
+            return await future
+
+    def EnableInvokeCoalescing(self, windowSeconds: float = 0.005):
+        '''
+        Makes SendCommand gather the commands sent to the same node within windowSeconds into batched invokes, of up
+        to the MaxPathsPerInvoke of the node, instead of sending each command in its own invoke interaction. Each
+        caller still gets the response (or error) of its own command. See ClusterCommand.InvokeCoalescer.
+
+        Commands sent with busyWaitMs or suppressResponse are not coalesced.
+        '''
+        self._invokeCoalescer = ClusterCommand.InvokeCoalescer(self._connectInvokeTarget, windowSeconds)
+
+    def DisableInvokeCoalescing(self):
+        '''
+        Makes SendCommand send every command in its own invoke interaction again (the default).
+        '''
+        self._invokeCoalescer = None
+
+    async def _connectInvokeTarget(self, nodeid: int, interactionTimeoutMs: typing.Optional[int],
+                                   payloadCapability: int) -> ClusterCommand.InvokeTarget:
+        device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
+        sessionParameters = self._getRemoteSessionParameters(device)
+        return ClusterCommand.InvokeTarget(
+            deviceProxy=device.deviceProxy, maxPathsPerInvoke=sessionParameters.maxPathsPerInvoke or 1,
+            allowLargePayload=payloadCapability in (TransportPayloadCapability.LARGE_PAYLOAD,
+                                                    TransportPayloadCapability.MRP_OR_TCP_PAYLOAD))
 
     def SendGroupCommand(self, groupid: int, payload: ClusterObjects.ClusterCommand, busyWaitMs: typing.Optional[int] = None):
         '''
@@ -1675,6 +1836,9 @@ class ChipDeviceControllerBase():
             (1, Clusters.UnitTesting.Attributes.XYZAttribute('hello')) -- Write 'hello'
             to the XYZ attribute on the test cluster to endpoint 1
 
+        With EnableWriteCoalescing, the attributes may be written in the same WriteRequest as the attributes of other
+        writes to the node.
+
         Returns:
             [AttributeStatus] (list - one for each path).
 
@@ -1701,8 +1865,6 @@ class ChipDeviceControllerBase():
         eventLoop = asyncio.get_running_loop()
         future = eventLoop.create_future()
 
-        device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
-
         attrs = []
         for v in attributes:
             if len(v) == 2:
@@ -1712,10 +1874,48 @@ class ChipDeviceControllerBase():
                 attrs.append(ClusterAttribute.AttributeWriteRequest(
                     v[0], v[1], v[2], 1, v[1].value))
 
-        ClusterAttribute.WriteAttributes(
-            future, eventLoop, device.deviceProxy, attrs, timedRequestTimeoutMs=timedRequestTimeoutMs,
-            interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, forceLegacyListEncoding=forceLegacyListEncoding).raise_on_error()
-        return await future
+        clusterIds = [v[1].cluster_id for v in attributes]
+        with latency.Trace('write', nodeid, clusterIds) as span, self._invalidateDeviceProxyOnError(nodeid):
+            if self._writeCoalescer is not None and busyWaitMs is None and not forceLegacyListEncoding:
+                return await self._writeCoalescer.WriteAttributes(
+                    nodeid, attrs, timedRequestTimeoutMs=timedRequestTimeoutMs, interactionTimeoutMs=interactionTimeoutMs,
+                    payloadCapability=payloadCapability)
+            if self._writeCoalescer is not None:
+                # Not coalesced, applied after the coalesced writes issued before it.
+                await self._writeCoalescer.Drain(nodeid)
+            with latency.Phase(span, 'session'):
+                device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
+
+            ClusterAttribute.WriteAttributes(
+                future, eventLoop, device.deviceProxy, attrs, timedRequestTimeoutMs=timedRequestTimeoutMs,
+                interactionTimeoutMs=interactionTimeoutMs, busyWaitMs=busyWaitMs, forceLegacyListEncoding=forceLegacyListEncoding,
+                span=span).raise_on_error()
+            return await future
+
+    def EnableWriteCoalescing(self, windowSeconds: float = 0.005):
+        '''
+        Makes WriteAttribute merge the writes to the same node issued within windowSeconds into a single WriteRequest,
+        instead of sending a WriteRequest per call. Each caller still gets the statuses of the paths it wrote. See
+        ClusterAttribute.WriteCoalescer.
+
+        Writes with busyWaitMs and writes with the legacy list encoding (TestOnlyWriteAttributeWithLegacyList) are not
+        coalesced: they are sent on their own, once the coalesced writes to the node issued before them are complete.
+
+        Writes are applied in the order they were issued when they use the same timeouts and payload capability, i.e.
+        within a coalescing window. Writes with different ones may be applied in a different order, see
+        ClusterAttribute.WriteCoalescer.
+        '''
+        self._writeCoalescer = ClusterAttribute.WriteCoalescer(self._connectDeviceProxy, windowSeconds)
+
+    def DisableWriteCoalescing(self):
+        '''
+        Makes WriteAttribute send a WriteRequest per call again (the default).
+        '''
+        self._writeCoalescer = None
+
+    async def _connectDeviceProxy(self, nodeid: int, interactionTimeoutMs: typing.Optional[int], payloadCapability: int):
+        device = await self.GetConnectedDevice(nodeid, timeoutMs=interactionTimeoutMs, payloadCapability=payloadCapability)
+        return device.deviceProxy
 
     async def TestOnlyWriteAttributeWithLegacyList(self, nodeid: int,
                                                    attributes: typing.List[typing.Tuple[int, ClusterObjects.ClusterAttributeDescriptor]],
@@ -1970,7 +2170,8 @@ class ChipDeviceControllerBase():
         eventNumberFilter: typing.Optional[int] = None,
         returnClusterObject: bool = False, reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, lazyDecode: bool = False,
+        eventStore: typing.Optional[ClusterAttribute.EventStore] = None, deferTLVDecode: bool = False
     ):
         '''
         Read a list of attributes and/or events from a target node
@@ -2020,6 +2221,13 @@ class ChipDeviceControllerBase():
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        lazyDecode: Only decode cluster objects (or attribute values, if returnClusterObject is False) when they are indexed
+            into, instead of decoding everything in the response up front. See AttributeCache.
+        eventStore: Where to keep the events received, e.g. an EventStore with a capacity or age limit for long-lived
+            subscriptions. When it already holds events from the node (e.g. from a previous subscription) and no
+            eventNumberFilter is given, only the events following the last one received are requested.
+        deferTLVDecode: Keep the attribute payloads as received and only decode their TLV when looked up, so that the
+            CHIP thread does not spend time decoding data which may never be used. See AttributeCache.
 
         Returns:
             - AsyncReadTransaction.ReadResponse. Please see ReadAttribute and ReadEvent for examples of how to access data.
@@ -2035,31 +2243,239 @@ class ChipDeviceControllerBase():
         # These mismatches are intentional and safe within the current logic.
         # TODO:  Explore proper typing for dynamic attributes in ChipDeviceCtrl.py #618
 
-        eventLoop = asyncio.get_running_loop()
-        future = eventLoop.create_future()
+        attributePaths, clusterDataVersionFilters, eventPaths = self._parseReadPaths(attributes, dataVersionFilters, events)
+        return await self._ReadParsedPaths(nodeid, payloadCapability, attributePaths, clusterDataVersionFilters, eventPaths,
+                                           eventNumberFilter, returnClusterObject, reportInterval, fabricFiltered,
+                                           keepSubscriptions, autoResubscribe, lazyDecode, eventStore=eventStore,
+                                           deferTLVDecode=deferTLVDecode)
 
-        device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
+    def _parseReadPaths(self, attributes, dataVersionFilters, events):
         attributePaths = [self._parseAttributePathTuple(
             v) for v in attributes] if attributes else None
         clusterDataVersionFilters = [self._parseDataVersionFilterTuple(
             v) for v in dataVersionFilters] if dataVersionFilters else None  # type: ignore[arg-type]
         eventPaths = [self._parseEventPathTuple(
             v) for v in events] if events else None
-
-        transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject)
-        ClusterAttribute.Read(transaction, device=device.deviceProxy,
-                              attributes=attributePaths, dataVersionFilters=clusterDataVersionFilters, events=eventPaths,
-                              eventNumberFilter=eventNumberFilter,
-                              subscriptionParameters=ClusterAttribute.SubscriptionParameters(
-                                  reportInterval[0], reportInterval[1]) if reportInterval else None,
-                              fabricFiltered=fabricFiltered,
-                              keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe).raise_on_error()
-        await future
+        return attributePaths, clusterDataVersionFilters, eventPaths
+
+    async def _ReadParsedPaths(self, nodeid, payloadCapability, attributePaths, clusterDataVersionFilters, eventPaths,
+                               eventNumberFilter, returnClusterObject, reportInterval, fabricFiltered, keepSubscriptions,
+                               autoResubscribe, lazyDecode, cache=None, eventStore=None, deferTLVDecode=False):
+        if eventNumberFilter is None and eventStore is not None:
+            eventNumberFilter = eventStore.nextEventNumber
+        clusterIds = [path.ClusterId for path in (attributePaths or []) + (eventPaths or [])]
+        interaction = 'subscribe' if reportInterval else 'read'
+        with latency.Trace(interaction, nodeid, clusterIds) as span, self._invalidateDeviceProxyOnError(nodeid):
+            with latency.Phase(span, 'session'):
+                device = await self.GetConnectedDevice(nodeid, payloadCapability=payloadCapability)
+
+            eventLoop = asyncio.get_running_loop()
+            future = eventLoop.create_future()
+
+            transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject, lazyDecode, cache,
+                                                                span, eventStore, deferTLVDecode)
+            ClusterAttribute.Read(transaction, device=device.deviceProxy,
+                                  attributes=attributePaths, dataVersionFilters=clusterDataVersionFilters, events=eventPaths,
+                                  eventNumberFilter=eventNumberFilter,
+                                  subscriptionParameters=ClusterAttribute.SubscriptionParameters(
+                                      reportInterval[0], reportInterval[1]) if reportInterval else None,
+                                  fabricFiltered=fabricFiltered,
+                                  keepSubscriptions=keepSubscriptions, autoResubscribe=autoResubscribe).raise_on_error()
+            try:
+                await future
+            except asyncio.CancelledError:
+                # Timed out or cancelled, do not leave the read or subscription running on the CHIP thread.
+                transaction.Abort()
+                raise
 
         if result := transaction.GetSubscriptionHandler():
             return result
         return transaction.GetReadResponse()
 
+    async def ReadMany(
+        self,
+        nodeids: typing.Iterable[int],
+        attributes: typing.Optional[typing.List[typing.Any]] = None,
+        dataVersionFilters: typing.Optional[typing.List[typing.Tuple[int, typing.Type[ClusterObjects.Cluster], int]]] = None,
+        events: typing.Optional[typing.List[typing.Any]] = None,
+        eventNumberFilter: typing.Optional[int] = None,
+        returnClusterObject: bool = False, reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
+        fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, lazyDecode: bool = False,
+        maxInFlight: int = 32, maxInFlightPerNode: int = 1, timeoutSeconds: typing.Optional[float] = None
+    ) -> typing.Dict[int, NodeReadResult]:
+        '''
+        Read the same attributes and/or events from several nodes.
+
+        nodeids: Target Node IDs, duplicates are read once.
+        attributes, dataVersionFilters, events, eventNumberFilter, returnClusterObject, reportInterval, fabricFiltered,
+        keepSubscriptions, autoResubscribe, payloadCapability, lazyDecode: Applied to every node, see Read. The paths are
+            only parsed once.
+        maxInFlight: Maximum number of nodes being read at the same time by this call.
+        maxInFlightPerNode: Maximum number of transactions in flight to the same node, across all the concurrent
+            ReadMany and SubscribeMany calls on this controller.
+        timeoutSeconds: Timeout for each node, covering the session establishment and the transaction, or None to
+            wait for the transactions to complete or fail.
+
+        Returns:
+            - A dictionary of NodeReadResult per Node ID. A node failing (e.g. it is unreachable, times out or returns
+              an error) does not fail the others: its NodeReadResult holds the exception instead of a response.
+        '''
+        self.CheckIsActive()
+
+        if maxInFlight < 1 or maxInFlightPerNode < 1:
+            raise ValueError("maxInFlight and maxInFlightPerNode must be at least 1")
+
+        attributePaths, clusterDataVersionFilters, eventPaths = self._parseReadPaths(attributes, dataVersionFilters, events)
+        inFlight = asyncio.Semaphore(maxInFlight)
+
+        async def readNode(nodeid: int) -> typing.Any:
+            return await self._ReadParsedPaths(nodeid, payloadCapability, attributePaths, clusterDataVersionFilters, eventPaths,
+                                               eventNumberFilter, returnClusterObject, reportInterval, fabricFiltered,
+                                               keepSubscriptions, autoResubscribe, lazyDecode)
+
+        async def readNodeWithLimits(nodeid: int) -> NodeReadResult:
+            # Take the node slot first, so that no global slot is held while waiting for another transaction to the node.
+            await self._acquireReadManySlot(nodeid, maxInFlightPerNode)
+            try:
+                async with inFlight:
+                    start = time.monotonic()
+                    try:
+                        response = await asyncio.wait_for(readNode(nodeid), timeoutSeconds)
+                    except Exception as ex:
+                        LOGGER.warning(f"Failed to read node {nodeid}: {ex!r}")
+                        return NodeReadResult(nodeid=nodeid, error=ex, latencySeconds=time.monotonic() - start)
+                    return NodeReadResult(nodeid=nodeid, response=response, latencySeconds=time.monotonic() - start)
+            finally:
+                # Shielded, so that the slot is released even if this call is being cancelled.
+                await asyncio.shield(self._releaseReadManySlot(nodeid))
+
+        results = await asyncio.gather(*(readNodeWithLimits(nodeid) for nodeid in dict.fromkeys(nodeids)))
+        return {result.nodeid: result for result in results}
+
+    async def SubscribeMany(
+        self,
+        nodeids: typing.Iterable[int],
+        reportInterval: typing.Tuple[int, int],
+        attributes: typing.Optional[typing.List[typing.Any]] = None,
+        events: typing.Optional[typing.List[typing.Any]] = None,
+        **kwargs
+    ) -> typing.Dict[int, NodeReadResult]:
+        '''
+        Subscribe to the same attributes and/or events on several nodes, see ReadMany. The response of every node
+        that succeeded is its SubscriptionTransaction.
+
+        reportInterval: A tuple of two int-s for (MinIntervalFloor, MaxIntervalCeiling).
+        kwargs: Any other ReadMany argument.
+        '''
+        return await self.ReadMany(nodeids, attributes=attributes, events=events, reportInterval=reportInterval, **kwargs)
+
+    def _readManyConditionForLoop(self) -> asyncio.Condition:
+        # asyncio primitives are bound to the loop they are first used on.
+        loop = asyncio.get_running_loop()
+        if self._readManyCondition is None or self._readManyCondition[0] is not loop:
+            self._readManyCondition = (loop, asyncio.Condition())
+        return self._readManyCondition[1]
+
+    async def _acquireReadManySlot(self, nodeid: int, maxInFlightPerNode: int):
+        condition = self._readManyConditionForLoop()
+        async with condition:
+            await condition.wait_for(lambda: self._readManyInFlight.get(nodeid, 0) < maxInFlightPerNode)
+            self._readManyInFlight[nodeid] = self._readManyInFlight.get(nodeid, 0) + 1
+
+    async def _releaseReadManySlot(self, nodeid: int):
+        condition = self._readManyConditionForLoop()
+        async with condition:
+            self._readManyInFlight[nodeid] -= 1
+            if self._readManyInFlight[nodeid] == 0:
+                del self._readManyInFlight[nodeid]
+            condition.notify_all()
+
+    async def ReadIncremental(
+        self,
+        nodeid: int,
+        attributes: typing.List[typing.Any],
+        returnClusterObject: bool = False,
+        fabricFiltered: bool = True,
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD,
+        lazyDecode: bool = False
+    ) -> ClusterAttribute.AsyncReadTransaction.ReadResponse:
+        '''
+        Read attributes from a target node, only transferring the clusters that changed since the previous
+        ReadIncremental of the same attributes from the node.
+
+        The data and data versions of every read are cached per node and per set of attribute paths (and
+        returnClusterObject, fabricFiltered and lazyDecode). Later reads send a DataVersionFilter for every cached
+        cluster instance, so that the node only reports the clusters whose data version changed, and merge them into
+        the cached view.
+
+        With an AttributeCacheStore (see SetAttributeCacheStore), the cached data is also saved to disk after every
+        read, and loaded from there on the first read of a node, e.g. after a restart.
+
+        nodeid: Target's Node ID
+        attributes, returnClusterObject, fabricFiltered, payloadCapability, lazyDecode: See Read.
+
+        Returns:
+            - AsyncReadTransaction.ReadResponse with the complete cached view of the attributes. The view is shared
+              with, and updated in place by, the later incremental reads of the same attributes. Cluster instances that
+              disappear from the node stay in the view until ClearIncrementalReadCache is called.
+
+        Raises:
+            - InteractionModelError (chip.interaction_model) on error. The cached view is then dropped, so that the
+              next read transfers everything again.
+        '''
+        self.CheckIsActive()
+
+        attributePaths, _, _ = self._parseReadPaths(attributes, None, None)
+        # The view identifies what is read, the data of a view does not depend on how it is decoded.
+        view = ';'.join(sorted({str(path) for path in attributePaths or ()})) + f"|fabricFiltered={fabricFiltered}"
+        cacheKey = (nodeid, view, returnClusterObject, lazyDecode)
+        cache = self._incrementalReadCaches.pop(cacheKey, None)
+        if cache is None and self._attributeCacheStore is not None:
+            # The database is only accessed in an executor, a large snapshot would otherwise stall the event loop.
+            cache = await asyncio.get_running_loop().run_in_executor(
+                None, self._attributeCacheStore.Load, nodeid, view, returnClusterObject, lazyDecode)
+        if cache is None:
+            cache = ClusterAttribute.AttributeCache(returnClusterObject=returnClusterObject, lazyDecode=lazyDecode)
+        previousVersions = {(endpointId, clusterId): dataVersion for endpointId, clusterVersions in cache.versionList.items()
+                            for clusterId, dataVersion in clusterVersions.items()}
+
+        clusterDataVersionFilters = [
+            ClusterAttribute.DataVersionFilter(EndpointId=endpointId, ClusterId=clusterId, DataVersion=dataVersion)
+            for endpointId, clusterVersions in cache.versionList.items()
+            for clusterId, dataVersion in clusterVersions.items()] or None
+
+        response = await self._ReadParsedPaths(nodeid, payloadCapability, attributePaths, clusterDataVersionFilters, None,
+                                               None, returnClusterObject, None, fabricFiltered, False, True, lazyDecode, cache)
+        self._incrementalReadCaches[cacheKey] = cache
+
+        if self._attributeCacheStore is not None:
+            # Clusters without a data version (e.g. only error statuses) can't be told apart, always save them.
+            changedClusters = [(endpointId, clusterId) for endpointId, clusterVersions in cache.versionList.items()
+                               for clusterId, dataVersion in clusterVersions.items()
+                               if not dataVersion or previousVersions.get((endpointId, clusterId)) != dataVersion]
+            try:
+                # The snapshot is taken on the event loop, where the cache is updated, and written in an executor.
+                snapshot = self._attributeCacheStore.Snapshot(nodeid, view, cache, changedClusters)
+                await asyncio.get_running_loop().run_in_executor(None, self._attributeCacheStore.Write, snapshot)
+            except Exception as ex:
+                LOGGER.error(f"Could not save the attribute cache of node {nodeid}: {ex}")
+        return response
+
+    def SetAttributeCacheStore(self, store: typing.Optional[AttributeCacheStore]):
+        '''
+        Sets the store in which ReadIncremental saves the data it reads, and from which it loads the data of nodes not
+        read yet since the controller started, or None to only keep the data in memory.
+        '''
+        self._attributeCacheStore = store
+
+    def ClearIncrementalReadCache(self, nodeid: typing.Optional[int] = None):
+        '''
+        Drops the views cached by ReadIncremental for `nodeid`, or for all nodes if `nodeid` is None.
+        '''
+        for key in [key for key in self._incrementalReadCaches if nodeid is None or key[0] == nodeid]:
+            del self._incrementalReadCaches[key]
+
     async def ReadAttribute(
         self,
         nodeid: int,
@@ -2080,7 +2496,7 @@ class ChipDeviceControllerBase():
         returnClusterObject: bool = False,
         reportInterval: typing.Optional[typing.Tuple[int, int]] = None,
         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD, lazyDecode: bool = False
     ):
         '''
         Read a list of attributes from a target node, this is a wrapper of DeviceController.Read()
@@ -2115,6 +2531,8 @@ class ChipDeviceControllerBase():
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        lazyDecode: Only decode cluster objects (or attribute values, if returnClusterObject is False) when they are indexed
+            into, instead of decoding everything in the response up front. See AttributeCache.
 
         Returns:
             - subscription request: ClusterAttribute.SubscriptionTransaction
@@ -2144,7 +2562,8 @@ class ChipDeviceControllerBase():
                               fabricFiltered=fabricFiltered,
                               keepSubscriptions=keepSubscriptions,
                               autoResubscribe=autoResubscribe,
-                              payloadCapability=payloadCapability)
+                              payloadCapability=payloadCapability,
+                              lazyDecode=lazyDecode)
         if isinstance(res, ClusterAttribute.SubscriptionTransaction):
             return res
         else:
@@ -2283,6 +2702,9 @@ class ChipDeviceControllerBase():
                 c_void_p, c_void_p]
             self._dmLib.pychip_DeviceController_DeleteDeviceController.restype = PyChipError
 
+            self._dmLib.pychip_IsActiveSession.argtypes = [c_void_p, POINTER(c_bool)]
+            self._dmLib.pychip_IsActiveSession.restype = PyChipError
+
             self._dmLib.pychip_DeviceController_ConnectBLE.argtypes = [
                 c_void_p, c_uint16, c_bool, c_uint32, c_uint64]
             self._dmLib.pychip_DeviceController_ConnectBLE.restype = PyChipError
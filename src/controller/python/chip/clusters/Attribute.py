@@ -18,27 +18,32 @@
 # Needed to use types in type hints before they are fully defined.
 from __future__ import annotations
 
+import asyncio
 import builtins
 import ctypes
-import inspect
+import functools
 import logging
-import sys
+import struct
+import threading
+import time
 from asyncio.futures import Future
+from collections import deque
+from collections.abc import MutableMapping
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_size_t, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p, cast, py_object
 from dataclasses import dataclass, field
 from enum import Enum, unique
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
 import construct  # type: ignore
 from rich.pretty import pprint  # type: ignore
 
-from ..interaction_model import (AttributePathIBstruct, DataVersionFilterIBstruct, EventPathIBstruct, InteractionModelError,
-                                 PyWriteAttributeData)
+from ..interaction_model import InteractionModelError, PyWriteAttributeData
 from ..interaction_model import Status as InteractionModelStatus
 from ..native import ErrorSDKPart, GetLibraryHandle, NativeLibraryHandleMethodArguments, PyChipError
 from ..tlv import TLVReader
-from . import Objects as GeneratedObjects  # noqa: F401
-from .ClusterObjects import Cluster, ClusterAttributeDescriptor, ClusterEvent
+from ..tracing.latency import InteractionSpan
+from . import Objects as GeneratedObjects
+from .ClusterObjects import Cluster, ClusterAttributeDescriptor, ClusterEvent, GetCompiledDescriptor
 
 LOGGER = logging.getLogger(__name__)
 
@@ -121,23 +126,15 @@ class TypedAttributePath:
 
         # If Path is provided, derive ClusterType and AttributeType from it
         if self.Path is not None:
-            for cluster, attribute in _AttributeIndex:
-                attributeType = _AttributeIndex[(cluster, attribute)][0]
-                clusterType = _AttributeIndex[(cluster, attribute)][1]
-
-                if clusterType.id == self.Path.ClusterId and attributeType.attribute_id == self.Path.AttributeId:
-                    self.ClusterType = clusterType
-                    self.AttributeType = attributeType
-                    break
+            self.ClusterType = _GetClusterType(self.Path.ClusterId)
+            self.AttributeType = _GetAttributeType(self.Path.ClusterId, self.Path.AttributeId)
 
             if self.ClusterType is None or self.AttributeType is None:
                 raise KeyError(f"No Schema found for Attribute {self.Path}")
 
         # Next, let's figure out the label.
-        for c_field in self.ClusterType.descriptor.Fields:
-            if c_field.Tag != self.AttributeType.attribute_id:
-                continue
-
+        c_field = GetCompiledDescriptor(self.ClusterType).GetFieldByTag(self.AttributeType.attribute_id)
+        if c_field is not None:
             self.AttributeName = c_field.Label
 
         if self.AttributeName is None:
@@ -244,41 +241,22 @@ class EventReadResult(EventStatus):
     Data: Any = None
 
 
-_AttributeIndex = {}
-_EventIndex = {}
-_ClusterIndex = {}
+@functools.lru_cache(maxsize=None)
+def _GetClusterType(clusterId: int) -> Optional[type]:
+    ''' Returns the generated cluster object of a cluster id, or None if the cluster is unknown.
 
-
-def _BuildAttributeIndex():
-    ''' Build internal attribute index for locating the corresponding cluster object by path in the future.
-        We do this because this operation will take a long time when there are lots of attributes,
-        it takes about 300ms for a single query.
-        This is acceptable during init, but unacceptable when the server returns lots of attributes at the same time.
+        The ids are resolved through the index generated in chip.clusters.Objects along with the cluster
+        definitions, which are only imported the first time one of their ids is looked up, so only the clusters
+        that are actually used get loaded.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Attributes') in str(subclass)):
-                    for attributeName, attribute in inspect.getmembers(subclass):
-                        if inspect.isclass(attribute):
-                            base_classes = inspect.getmro(attribute)
-
-                            # Only match on classes that extend the ClusterAttributeDescriptor class
-                            matched = [
-                                value for value in base_classes if 'ClusterAttributeDescriptor' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _AttributeIndex[(attribute.cluster_id, attribute.attribute_id)] = (eval(
-                                'GeneratedObjects.' + clusterName + '.Attributes.' + attributeName), obj)
-
-
-def _BuildClusterIndex():
-    ''' Build internal cluster index for locating the corresponding cluster object by path in the future.
+    return GeneratedObjects.GetClusterType(clusterId)
+
+
+@functools.lru_cache(maxsize=None)
+def _GetAttributeType(clusterId: int, attributeId: int) -> Optional[type]:
+    ''' Returns the generated attribute object of an attribute path, or None if the attribute is unknown.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj) and issubclass(obj, Cluster):
-            _ClusterIndex[obj.id] = obj
+    return GeneratedObjects.GetAttributeType(clusterId, attributeId)
 
 
 @dataclass
@@ -294,6 +272,79 @@ class DataVersion:
     pass
 
 
+class _DeferredValue:
+    __slots__ = ('decode', 'raw')
+
+    def __init__(self, decode: Callable[[], Any], raw: Optional[bytes] = None):
+        self.decode = decode
+        # The payload the value is decoded from, when there is one.
+        self.raw = raw
+
+
+def _DecodeTLV(raw: bytes) -> Any:
+    try:
+        return TLVReader(raw, valuesOnly=True).get().get("Any", {})
+    except Exception as ex:
+        return ValueDecodeFailure(None, ex)
+
+
+class LazyDecodeDict(MutableMapping):
+    ''' A dictionary whose values can be set as deferred decoders. A deferred value is only
+        decoded the first time it is looked up, and the result replaces it.
+
+        Iterating over keys, membership tests and len() do not decode anything.
+    '''
+
+    def __init__(self):
+        self._data: Dict[Any, Any] = {}
+
+    def SetDeferred(self, key, decode: Callable[[], Any], raw: Optional[bytes] = None):
+        self._data[key] = _DeferredValue(decode, raw)
+
+    def IsDecoded(self, key) -> bool:
+        return not isinstance(self._data[key], _DeferredValue)
+
+    def GetRaw(self, key) -> Optional[memoryview]:
+        ''' Returns a read-only view of the payload a value not decoded yet will be decoded from, or None.
+        '''
+        value = self._data[key]
+        if isinstance(value, _DeferredValue) and value.raw is not None:
+            return memoryview(value.raw)
+        return None
+
+    def Peek(self, key) -> Any:
+        ''' Returns the value, or its deferred decoder if it is not decoded yet, without decoding it.
+        '''
+        return self._data[key]
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if isinstance(value, _DeferredValue):
+            deferred, value = value, value.decode()
+            # The entry may have been replaced while it was being decoded, keep the newer one then.
+            if self._data.get(key) is deferred:
+                self._data[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
 @dataclass
 class AttributeCache:
     ''' A cache that stores data & errors returned in read/subscribe reports, but organizes it topologically
@@ -312,8 +363,18 @@ class AttributeCache:
                 Clusters.UnitTesting.Attributes.Int16u is the listeral key for indexing an attribute in the test cluster.
 
         This strongly typed keys permit a more natural and safer form of indexing.
+
+        With lazyDecode=True, cluster objects (cluster-view) or attribute values (attribute-view) are not
+        decoded when the cache is updated, but only once a caller indexes into them. The nested
+        dictionaries are then LazyDecodeDict instances instead of plain dicts.
+
+        With deferTLVDecode=True, the clusters of attributeTLVCache are LazyDecodeDict instances holding the
+        payloads as received: the TLV of an attribute is only decoded the first time it is looked up, and
+        LazyDecodeDict.GetRaw gives a read-only view of the payload until then.
     '''
     returnClusterObject: bool = False
+    lazyDecode: bool = False
+    deferTLVDecode: bool = False
     attributeTLVCache: Dict[int, Dict[int, Dict[int, bytes]]] = field(
         default_factory=lambda: {})
     versionList: Dict[int, Dict[int, Dict[int, int]]] = field(
@@ -337,21 +398,38 @@ class AttributeCache:
         endpointCache = self.attributeTLVCache[path.EndpointId]
         endpointVersion = self.versionList[path.EndpointId]
         if (path.ClusterId not in endpointCache):
-            endpointCache[path.ClusterId] = {}
+            endpointCache[path.ClusterId] = LazyDecodeDict() if self.deferTLVDecode else {}
 
         # All attributes from the same cluster instance should have the same dataVersion,
         # so we can set the dataVersion of the cluster to the dataVersion with a random attribute.
         endpointVersion[path.ClusterId] = dataVersion
 
         clusterCache = endpointCache[path.ClusterId]
-        if (path.AttributeId not in clusterCache):
-            clusterCache[path.AttributeId] = None
-
-        clusterCache[path.AttributeId] = data
+        if isinstance(data, _DeferredValue):
+            if isinstance(clusterCache, LazyDecodeDict):
+                clusterCache.SetDeferred(path.AttributeId, data.decode, data.raw)
+            else:
+                clusterCache[path.AttributeId] = data.decode()
+        else:
+            clusterCache[path.AttributeId] = data
 
         # For this path the attribute cache still requires an update.
         self._attributeCacheUpdateNeeded.add(path)
 
+    def ClearCluster(self, endpointId: int, clusterId: int):
+        ''' Drops the data and data version of a cluster instance, e.g. before it is reported again in full.
+        '''
+        self.attributeTLVCache.get(endpointId, {}).pop(clusterId, None)
+        self.versionList.get(endpointId, {}).pop(clusterId, None)
+
+        clusterType = _GetClusterType(clusterId)
+        if clusterType is not None:
+            self._attributeCache.get(endpointId, {}).pop(clusterType, None)
+
+        if self._attributeCacheUpdateNeeded:
+            self._attributeCacheUpdateNeeded = {path for path in self._attributeCacheUpdateNeeded
+                                                if path.EndpointId != endpointId or path.ClusterId != clusterId}
+
     def GetUpdatedAttributeCache(self) -> Dict[int, List[Cluster]]:
         ''' This converts the raw TLV data into a cluster object format.
 
@@ -373,8 +451,7 @@ class AttributeCache:
 
         def handle_cluster_view(endpointId, clusterId, clusterType):
             try:
-                decodedData = clusterType.FromDict(
-                    data=clusterType.descriptor.TagDictToLabelDict([], self.attributeTLVCache[endpointId][clusterId]))
+                decodedData = clusterType.FromTagDict(self.attributeTLVCache[endpointId][clusterId])
                 decodedData.SetDataVersion(
                     self.versionList.get(endpointId, {}).get(clusterId))
                 return decodedData
@@ -390,46 +467,325 @@ class AttributeCache:
             except Exception as ex:
                 return ValueDecodeFailure(value, ex)
 
+        def new_dict():
+            return LazyDecodeDict() if self.lazyDecode else {}
+
+        # Group the changed paths per cluster instance, so that each cluster which needs an update is
+        # only visited (and in the cluster-view, decoded) once, regardless of how many of its attributes
+        # changed.
+        dirtyClusters: Dict[Tuple[int, int], List[int]] = {}
         for attributePath in self._attributeCacheUpdateNeeded:
-            endpointId, clusterId, attributeId = attributePath.EndpointId, attributePath.ClusterId, attributePath.AttributeId
+            dirtyClusters.setdefault((attributePath.EndpointId, attributePath.ClusterId), []).append(attributePath.AttributeId)
 
+        for (endpointId, clusterId), attributeIds in dirtyClusters.items():
             if endpointId not in self._attributeCache:
-                self._attributeCache[endpointId] = {}
+                self._attributeCache[endpointId] = new_dict()
             endpointCache = self._attributeCache[endpointId]
 
-            if clusterId not in _ClusterIndex:
+            clusterType = _GetClusterType(clusterId)
+            if clusterType is None:
                 #
                 # #22599 tracks dealing with unknown clusters more
                 # gracefully so that clients can still access this data.
                 #
                 continue
 
-            clusterType = _ClusterIndex[clusterId]
-
             if self.returnClusterObject:
-                endpointCache[clusterType] = handle_cluster_view(
-                    endpointId, clusterId, clusterType)
+                if self.lazyDecode:
+                    endpointCache.SetDeferred(clusterType, functools.partial(
+                        handle_cluster_view, endpointId, clusterId, clusterType))
+                else:
+                    endpointCache[clusterType] = handle_cluster_view(
+                        endpointId, clusterId, clusterType)
             else:
                 if clusterType not in endpointCache:
-                    endpointCache[clusterType] = {}
+                    endpointCache[clusterType] = new_dict()
                 clusterCache = endpointCache[clusterType]
                 clusterCache[DataVersion] = self.versionList.get(
                     endpointId, {}).get(clusterId)
 
-                if (clusterId, attributeId) not in _AttributeIndex:
-                    #
-                    # #22599 tracks dealing with unknown clusters more
-                    # gracefully so that clients can still access this data.
-                    #
-                    continue
-
-                attributeType = _AttributeIndex[(clusterId, attributeId)][0]
-                clusterCache[attributeType] = handle_attribute_view(
-                    endpointId, clusterId, attributeId, attributeType)
+                for attributeId in attributeIds:
+                    attributeType = _GetAttributeType(clusterId, attributeId)
+                    if attributeType is None:
+                        #
+                        # #22599 tracks dealing with unknown clusters more
+                        # gracefully so that clients can still access this data.
+                        #
+                        continue
+                    if self.lazyDecode:
+                        clusterCache.SetDeferred(attributeType, functools.partial(
+                            handle_attribute_view, endpointId, clusterId, attributeId, attributeType))
+                    else:
+                        clusterCache[attributeType] = handle_attribute_view(
+                            endpointId, clusterId, attributeId, attributeType)
         self._attributeCacheUpdateNeeded.clear()
         return self._attributeCache
 
 
+class EventStore:
+    ''' Stores the events received by a read or subscription, in the order they were received.
+
+        By default every event is kept. With a capacity and/or a maxAgeSeconds the store is a ring buffer: the oldest
+        events are dropped once there are more than capacity of them, or once they were received more than
+        maxAgeSeconds ago, so that the memory held by a long-lived subscription stays bounded.
+
+        Events are indexed by event number, priority and (endpoint, cluster, event), see Get and Query. An event
+        received again (same event number) while still stored is ignored. The highest event number received is kept
+        after its event is dropped: a new subscription given the store (see ChipDeviceControllerBase.Read) only asks
+        the node for the events that follow it.
+
+        Events are appended from the CHIP thread while the store is read from the asyncio thread, every access to
+        the indexes is made under a lock.
+    '''
+
+    def __init__(self, capacity: Optional[int] = None, maxAgeSeconds: Optional[float] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._maxAgeSeconds = maxAgeSeconds
+        # (time received, event)
+        self._events: Deque[Tuple[float, EventReadResult]] = deque()
+        self._byNumber: Dict[int, EventReadResult] = {}
+        self._byPriority: Dict[EventPriority, Deque[EventReadResult]] = {}
+        self._byPath: Dict[Tuple[int, int, int], Deque[EventReadResult]] = {}
+        self.highestEventNumber: Optional[int] = None
+        self.droppedEvents = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nextEventNumber(self) -> Optional[int]:
+        ''' The event number to resume from, i.e. past every event received, or None if none was received.
+        '''
+        return None if self.highestEventNumber is None else self.highestEventNumber + 1
+
+    def Append(self, event: EventReadResult) -> bool:
+        ''' Stores an event, returns False if it is already stored.
+        '''
+        header = event.Header
+        with self._lock:
+            if header is not None:
+                if header.EventNumber is not None:
+                    if header.EventNumber in self._byNumber:
+                        return False
+                    self._byNumber[header.EventNumber] = event
+                    if self.highestEventNumber is None or header.EventNumber > self.highestEventNumber:
+                        self.highestEventNumber = header.EventNumber
+                self._byPriority.setdefault(header.Priority, deque()).append(event)
+                self._byPath.setdefault((header.EndpointId, header.ClusterId, header.EventId), deque()).append(event)
+            self._events.append((time.monotonic(), event))
+            self._Evict()
+        return True
+
+    def _Evict(self):
+        # Must be called with the lock held.
+        if self._maxAgeSeconds is not None:
+            expiry = time.monotonic() - self._maxAgeSeconds
+        while self._events and ((self._capacity is not None and len(self._events) > self._capacity) or
+                                (self._maxAgeSeconds is not None and self._events[0][0] < expiry)):
+            _, event = self._events.popleft()
+            self.droppedEvents += 1
+            header = event.Header
+            if header is None:
+                continue
+            # Events are dropped in the order they were stored, so they are first of their index entries.
+            self._byNumber.pop(header.EventNumber, None)
+            for index, key in ((self._byPriority, header.Priority),
+                               (self._byPath, (header.EndpointId, header.ClusterId, header.EventId))):
+                entries = index[key]
+                entries.popleft()
+                if not entries:
+                    del index[key]
+
+    def Get(self, eventNumber: int) -> Optional[EventReadResult]:
+        with self._lock:
+            self._Evict()
+            return self._byNumber.get(eventNumber)
+
+    def Query(self, endpointId: Optional[int] = None, clusterId: Optional[int] = None, eventId: Optional[int] = None,
+              priority: Optional[EventPriority] = None, minEventNumber: Optional[int] = None) -> List[EventReadResult]:
+        ''' Returns the stored events matching all the given criteria, in the order they were received. Event
+            statuses (errors) are only returned when no criteria is given.
+        '''
+        # Events are appended from the CHIP thread, filter copies taken under the lock.
+        with self._lock:
+            self._Evict()
+            if endpointId is not None and clusterId is not None and eventId is not None:
+                candidates = list(self._byPath.get((endpointId, clusterId, eventId), ()))
+            elif priority is not None:
+                candidates = list(self._byPriority.get(priority, ()))
+            else:
+                candidates = [event for _, event in self._events]
+        if endpointId is None and clusterId is None and eventId is None and priority is None and minEventNumber is None:
+            return candidates
+        return [event for event in candidates if event.Header is not None and
+                (endpointId is None or event.Header.EndpointId == endpointId) and
+                (clusterId is None or event.Header.ClusterId == clusterId) and
+                (eventId is None or event.Header.EventId == eventId) and
+                (priority is None or event.Header.Priority == priority) and
+                (minEventNumber is None or (event.Header.EventNumber or 0) >= minEventNumber)]
+
+    def Clear(self):
+        ''' Drops every stored event, the highest event number received is kept.
+        '''
+        with self._lock:
+            self._events.clear()
+            self._byNumber.clear()
+            self._byPriority.clear()
+            self._byPath.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._Evict()
+            return len(self._events)
+
+    def __iter__(self):
+        with self._lock:
+            self._Evict()
+            events = [event for _, event in self._events]
+        return iter(events)
+
+
+@unique
+class ReportOverflowPolicy(Enum):
+    ''' What a SubscriptionReportStream does with a new report once its queue is full.
+    '''
+    # Discard the oldest queued report to make room for the new one.
+    DROP_OLDEST = 0
+    # Discard the new report.
+    DROP_NEWEST = 1
+    # Merge the new report into the newest queued one, keeping the latest value per attribute path.
+    COALESCE = 2
+
+
+@dataclass
+class SubscriptionReport:
+    ''' A batch of changes received on a subscription.
+
+        attributes holds the latest value of every attribute path that changed, decoded like the attribute-view
+        of the AttributeCache (a ValueDecodeFailure is present for error statuses and values that could not be
+        decoded). events holds the events in the order they were received.
+
+        reportCount is the number of reports merged into this batch, droppedReports the number of reports
+        discarded by the overflow policy since the previous batch was handed out.
+    '''
+    attributes: Dict[AttributePath, Any] = field(default_factory=dict)
+    events: List[EventReadResult] = field(default_factory=list)
+    reportCount: int = 1
+    droppedReports: int = 0
+
+
+class _PendingReport:
+    __slots__ = ('attributes', 'events', 'reportCount')
+
+    def __init__(self, attributes: Dict[AttributePath, Any], events: List[EventReadResult]):
+        # The reports are shared between all the streams of a subscription, so take copies before merging into them.
+        self.attributes = dict(attributes)
+        self.events = list(events)
+        self.reportCount = 1
+
+    def Merge(self, attributes: Dict[AttributePath, Any], events: List[EventReadResult]):
+        self.attributes.update(attributes)
+        self.events.extend(events)
+        self.reportCount += 1
+
+
+def _PeekTLV(clusterCache: Dict[int, Any], attributeId: int) -> Any:
+    if isinstance(clusterCache, LazyDecodeDict):
+        return clusterCache.Peek(attributeId)
+    return clusterCache[attributeId]
+
+
+def _DecodeAttributeValue(path: AttributePath, value: Any) -> Any:
+    if isinstance(value, _DeferredValue):
+        value = value.decode()
+    if isinstance(value, ValueDecodeFailure):
+        return value
+    attributeType = _GetAttributeType(path.ClusterId, path.AttributeId)
+    if attributeType is None:
+        return ValueDecodeFailure(value, LookupError("attribute schema not found"))
+    try:
+        return attributeType.FromTagDictOrRawValue(value)
+    except Exception as ex:
+        return ValueDecodeFailure(value, ex)
+
+
+class SubscriptionReportStream:
+    ''' An asynchronous iterator over the reports of a subscription, see SubscriptionTransaction.reports().
+
+        The CHIP thread only hands the raw TLV of the changed attributes over to the event loop; values are
+        decoded when a batch is taken out of the queue. The iteration ends once the stream is closed or the
+        subscription is shut down.
+    '''
+
+    def __init__(self, subscription: SubscriptionTransaction, eventLoop, maxQueueSize: int,
+                 overflowPolicy: ReportOverflowPolicy, coalesce: bool):
+        if maxQueueSize < 1:
+            raise ValueError("maxQueueSize must be at least 1")
+        self._subscription = subscription
+        self._event_loop = eventLoop
+        self._maxQueueSize = maxQueueSize
+        self._overflowPolicy = overflowPolicy
+        self._coalesce = coalesce
+        self._queue: Deque[_PendingReport] = deque()
+        self._droppedReports = 0
+        self._waiter: Optional[Future] = None
+        self._isDone = False
+
+    def _Put(self, attributes: Dict[AttributePath, Any], events: List[EventReadResult]):
+        ''' Queues a report, called on the event loop.
+        '''
+        if self._isDone:
+            return
+        if self._queue and (self._coalesce or (len(self._queue) >= self._maxQueueSize and
+                                               self._overflowPolicy == ReportOverflowPolicy.COALESCE)):
+            self._queue[-1].Merge(attributes, events)
+        elif len(self._queue) >= self._maxQueueSize and self._overflowPolicy == ReportOverflowPolicy.DROP_NEWEST:
+            self._droppedReports += 1
+            return
+        else:
+            if len(self._queue) >= self._maxQueueSize:
+                self._queue.popleft()
+                self._droppedReports += 1
+            self._queue.append(_PendingReport(attributes, events))
+        self._Wake()
+
+    def _Finish(self):
+        ''' Ends the iteration once the queued reports have been consumed.
+        '''
+        self._isDone = True
+        self._Wake()
+
+    def _Wake(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def Close(self):
+        ''' Stops receiving reports and discards the queued ones.
+        '''
+        self._queue.clear()
+        self._subscription._RemoveReportStream(self)
+        self._Finish()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> SubscriptionReport:
+        while not self._queue:
+            if self._isDone:
+                raise StopAsyncIteration
+            self._waiter = self._event_loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        pending = self._queue.popleft()
+        droppedReports, self._droppedReports = self._droppedReports, 0
+        return SubscriptionReport(
+            attributes={path: _DecodeAttributeValue(path, value) for path, value in pending.attributes.items()},
+            events=pending.events, reportCount=pending.reportCount, droppedReports=droppedReports)
+
+
 class SubscriptionTransaction:
     def __init__(self, transaction: AsyncReadTransaction, subscriptionId, devCtrl):
         self._onResubscriptionAttemptedCb: Callable[[SubscriptionTransaction,
@@ -448,6 +804,7 @@ class SubscriptionTransaction:
             SubscriptionTransaction], None]] = None
         self._onResubscriptionSucceededCb_isAsync = False
         self._onResubscriptionAttemptedCb_isAsync = False
+        self._reportStreams: Tuple[SubscriptionReportStream, ...] = ()
         builtins.chipStack.RegisterSubscription(self)
 
     def GetAttributes(self):
@@ -461,13 +818,19 @@ class SubscriptionTransaction:
         data = self._readTransaction._cache.GetUpdatedAttributeCache()
 
         if (self._readTransaction._cache.returnClusterObject):
-            return eval(f'data[path.Path.EndpointId][path.ClusterType].{path.AttributeName}')
+            return getattr(data[path.Path.EndpointId][path.ClusterType], path.AttributeName)
         else:
             return data[path.Path.EndpointId][path.ClusterType][path.AttributeType]
 
     def GetEvents(self):
         return self._readTransaction.GetAllEventValues()
 
+    @property
+    def eventStore(self) -> EventStore:
+        ''' The events received by the subscription, see EventStore.
+        '''
+        return self._readTransaction._events
+
     def OverrideLivenessTimeoutMs(self, timeoutMs: int):
         handle = GetLibraryHandle()
         builtins.chipStack.Call(
@@ -562,6 +925,38 @@ class SubscriptionTransaction:
         if callback is not None:
             self._onErrorCb = callback
 
+    def reports(self, maxQueueSize: int = 16, overflowPolicy: ReportOverflowPolicy = ReportOverflowPolicy.DROP_OLDEST,
+                coalesce: bool = False) -> SubscriptionReportStream:
+        '''
+        Returns an asynchronous iterator yielding one SubscriptionReport per report received from now on:
+
+            async for report in sub.reports():
+                for path, value in report.attributes.items():
+                    ...
+
+        Up to maxQueueSize reports are queued while the consumer is busy, once full overflowPolicy decides which
+        report is dropped or merged. With coalesce=True, reports received while a batch is still queued are merged
+        into it, so the consumer always gets the latest value per attribute path in a single batch.
+
+        This must be called on the event loop the subscription was established on. While a stream is open, the
+        default attribute and event callbacks (which print every change) are not invoked, callbacks set through
+        SetAttributeUpdateCallback and SetEventUpdateCallback still are.
+        '''
+        stream = SubscriptionReportStream(self, self._readTransaction._event_loop, maxQueueSize, overflowPolicy, coalesce)
+        if self._isDone:
+            stream._Finish()
+        else:
+            self._reportStreams = self._reportStreams + (stream,)
+        return stream
+
+    def _RemoveReportStream(self, stream: SubscriptionReportStream):
+        self._reportStreams = tuple(s for s in self._reportStreams if s is not stream)
+
+    def _FinishReportStreams(self):
+        streams, self._reportStreams = self._reportStreams, ()
+        for stream in streams:
+            stream._Finish()
+
     @property
     def OnAttributeChangeCb(self) -> Callable[[TypedAttributePath, SubscriptionTransaction], None]:
         return self._onAttributeChangeCb
@@ -590,6 +985,7 @@ class SubscriptionTransaction:
             lambda: handle.pychip_ReadClient_ShutdownSubscription(
                 self._readTransaction._pReadClient))
         self._isDone = True
+        self._FinishReportStreams()
 
     def __repr__(self):
         return f'<Subscription (Id={self._subscriptionId})>'
@@ -622,27 +1018,11 @@ def DefaultErrorCallback(chipError: int, transaction: SubscriptionTransaction):
     print(f"Error during Subscription: Matter Stack Error {chipError}")
 
 
-def _BuildEventIndex():
-    ''' Build internal event index for locating the corresponding cluster object by path in the future.
-    We do this because this operation will take a long time when there are lots of events, it takes about 300ms for a single query.
-    This is acceptable during init, but unacceptable when the server returns lots of events at the same time.
+@functools.lru_cache(maxsize=None)
+def _GetEventType(clusterId: int, eventId: int) -> Optional[type]:
+    ''' Returns the generated event object of an event path, or None if the event is unknown, see _GetClusterType.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Events' == objName)):
-                    for eventName, event in inspect.getmembers(subclass):
-                        if inspect.isclass(event):
-                            base_classes = inspect.getmro(event)
-
-                            # Only match on classes that extend the ClusterEvent class
-                            matched = [
-                                value for value in base_classes if 'ClusterEvent' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _EventIndex[str(EventPath(ClusterId=event.cluster_id, EventId=event.event_id))] = eval(
-                                'GeneratedObjects.' + clusterName + '.Events.' + eventName)
+    return GeneratedObjects.GetEventType(clusterId, eventId)
 
 
 class AsyncReadTransaction:
@@ -652,28 +1032,63 @@ class AsyncReadTransaction:
         events: list[ClusterEvent]
         tlvAttributes: dict[int, Any]
 
-    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool):
+    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool, lazyDecode: bool = False,
+                 cache: Optional[AttributeCache] = None, span: Optional[InteractionSpan] = None,
+                 eventStore: Optional[EventStore] = None, deferTLVDecode: bool = False):
+        ''' When a cache is provided, the response is merged into it instead of a new one: every cluster instance
+            reported replaces the data previously cached for it, the others are left untouched.
+
+            Events are kept in eventStore, or in an unbounded EventStore if none is provided. Events already in the
+            store are not reported again to the subscription callbacks. The read response only holds the events
+            received by this transaction, not the ones the store already held.
+
+            With deferTLVDecode, the attribute payloads are handed over from the CHIP thread as received, and only
+            decoded once looked up (see AttributeCache). It does not apply to a provided cache.
+
+            When a span is provided (see chip.tracing.latency), the phases of the transaction are timed in it until
+            the read completes or the subscription is established.
+        '''
         self._event_loop = eventLoop
         self._future = future
         self._subscription_handler = None
-        self._events: List[EventReadResult] = []
+        self._events = EventStore() if eventStore is None else eventStore
+        # The events received before the subscription is established (or by a read), see GetReadResponse.
+        self._readEvents: List[EventReadResult] = []
         self._devCtrl = devCtrl
-        self._cache = AttributeCache(returnClusterObject=returnClusterObject)
+        if cache is None:
+            self._cache = AttributeCache(returnClusterObject=returnClusterObject, lazyDecode=lazyDecode,
+                                         deferTLVDecode=deferTLVDecode)
+            self._reportedClusters: Optional[Set[Tuple[int, int]]] = None
+        else:
+            self._cache = cache
+            self._reportedClusters = set()
         self._changedPathSet: Set[AttributePath] = set()
+        self._reportEvents: List[EventReadResult] = []
         self._pReadClient = None
         self._resultError: Optional[PyChipError] = None
+        self._span = span
+        self._handOffTime = 0.0
 
     def SetClientObjPointers(self, pReadClient):
         self._pReadClient = pReadClient
 
-    def GetAllEventValues(self):
-        return self._events
+    def Abort(self):
+        ''' Shuts the read or subscription down, including a subscription that is not established yet or is
+            resubscribing, once the caller has stopped waiting for it (e.g. it timed out). Nothing is done if the
+            transaction is already done.
+        '''
+        handle = GetLibraryHandle()
+        # The read is identified by this transaction, see pychip_ReadClient_Abort.
+        builtins.chipStack.Call(lambda: handle.pychip_ReadClient_Abort(ctypes.py_object(self)))
+
+    def GetAllEventValues(self) -> List[EventReadResult]:
+        return list(self._events)
 
     def GetReadResponse(self) -> AsyncReadTransaction.ReadResponse:
         """Prepares and returns the ReadResponse object."""
         return self.ReadResponse(
             attributes=self._cache.GetUpdatedAttributeCache(),
-            events=self._events,
+            events=list(self._readEvents),
             tlvAttributes=self._cache.attributeTLVCache
         )
 
@@ -688,9 +1103,20 @@ class AsyncReadTransaction:
             if (imStatus != InteractionModelStatus.Success):
                 attributeValue = ValueDecodeFailure(
                     None, InteractionModelError(imStatus))
-            else:
-                tlvData = TLVReader(data).get().get("Any", {})
+            elif self._cache.deferTLVDecode:
+                attributeValue = _DeferredValue(functools.partial(_DecodeTLV, data), data)
+            elif self._span is None:
+                tlvData = TLVReader(data, valuesOnly=True).get().get("Any", {})
                 attributeValue = tlvData
+            else:
+                self._span.Mark('firstReport')
+                start = time.perf_counter()
+                attributeValue = TLVReader(data, valuesOnly=True).get().get("Any", {})
+                self._span.Add('decode', time.perf_counter() - start)
+
+            if self._reportedClusters is not None and (path.EndpointId, path.ClusterId) not in self._reportedClusters:
+                self._reportedClusters.add((path.EndpointId, path.ClusterId))
+                self._cache.ClearCluster(path.EndpointId, path.ClusterId)
 
             self._cache.UpdateTLV(path, dataVersion, attributeValue)
             self._changedPathSet.add(path)
@@ -700,19 +1126,22 @@ class AsyncReadTransaction:
 
     def handleEventData(self, header: EventHeader, path: EventPath, data: bytes, status: int):
         try:
-            eventType = _EventIndex.get(str(path), None)
+            if self._span is not None:
+                self._span.Mark('firstReport')
+                start = time.perf_counter()
+            eventType = _GetEventType(path.ClusterId, path.EventId)
             eventValue = None
 
             if data:
                 # data will be an empty buffer when we received an EventStatusIB instead of an EventDataIB.
-                tlvData = TLVReader(data).get().get("Any", {})
+                tlvData = TLVReader(data, valuesOnly=True).get().get("Any", {})
 
                 if eventType is None:
                     eventValue = ValueDecodeFailure(
                         tlvData, LookupError("event schema not found"))
                 else:
                     try:
-                        eventValue = eventType.FromTLV(data)
+                        eventValue = eventType.FromTagDict(tlvData)
                     except Exception as ex:
                         LOGGER.error(
                             f"Error convering TLV to Cluster Object for path: Endpoint = {path.EndpointId}/"
@@ -729,9 +1158,18 @@ class AsyncReadTransaction:
 
             eventResult = EventReadResult(
                 Header=header, Data=eventValue, Status=InteractionModelStatus(status))
-            self._events.append(eventResult)
+            if self._subscription_handler is None:
+                self._readEvents.append(eventResult)
+            if not self._events.Append(eventResult):
+                return
+            if self._span is not None:
+                self._span.Add('decode', time.perf_counter() - start)
 
             if (self._subscription_handler is not None):
+                if self._subscription_handler._reportStreams:
+                    self._reportEvents.append(eventResult)
+                    if self._subscription_handler.OnEventChangeCb is DefaultEventChangeCallback:
+                        return
                 self._subscription_handler.OnEventChangeCb(
                     eventResult, self._subscription_handler)
 
@@ -746,9 +1184,13 @@ class AsyncReadTransaction:
 
     def _handleSubscriptionEstablished(self, subscriptionId):
         if not self._future.done():
+            self._ReleaseSpan()
             self._subscription_handler = SubscriptionTransaction(
                 self, subscriptionId, self._devCtrl)
             self._future.set_result(self)
+        elif self._subscription_handler is None:
+            # The caller stopped waiting for the subscription (the future was cancelled), it is being aborted.
+            return
         else:
             self._subscription_handler._subscriptionId = subscriptionId
             if self._subscription_handler._onResubscriptionSucceededCb is not None:
@@ -760,6 +1202,7 @@ class AsyncReadTransaction:
                         self._subscription_handler)
 
     def handleSubscriptionEstablished(self, subscriptionId):
+        self._handOffTime = time.perf_counter()
         self._event_loop.call_soon_threadsafe(
             self._handleSubscriptionEstablished, subscriptionId)
 
@@ -779,7 +1222,20 @@ class AsyncReadTransaction:
 
     def _handleReportEnd(self):
         if self._subscription_handler is not None:
-            for change in self._changedPathSet:
+            streams = self._subscription_handler._reportStreams
+            if streams:
+                # Only hand references to the raw TLV over to the event loop, the streams decode the values there.
+                tlvCache = self._cache.attributeTLVCache
+                attributes = {path: _PeekTLV(tlvCache[path.EndpointId][path.ClusterId], path.AttributeId)
+                              for path in self._changedPathSet}
+                for stream in streams:
+                    self._event_loop.call_soon_threadsafe(stream._Put, attributes, self._reportEvents)
+                self._reportEvents = []
+
+            changedPathSet = self._changedPathSet
+            if streams and self._subscription_handler.OnAttributeChangeCb is DefaultAttributeChangeCallback:
+                changedPathSet = set()
+            for change in changedPathSet:
                 try:
                     attribute_path = TypedAttributePath(Path=change)
                 except (KeyError, ValueError) as err:
@@ -800,11 +1256,15 @@ class AsyncReadTransaction:
         # move on, possibly invalidating the provided _event_loop.
         #
         if not self._future.done():
+            self._ReleaseSpan()
             if self._resultError is not None:
                 self._future.set_exception(self._resultError.to_exception())
             else:
                 self._future.set_result(self)
 
+        if self._subscription_handler is not None:
+            self._subscription_handler._FinishReportStreams()
+
         #
         # Decrement the ref on ourselves to match the increment that happened at allocation.
         # This happens synchronously as part of handling done to ensure the object remains valid
@@ -820,8 +1280,15 @@ class AsyncReadTransaction:
         # pReadClient will be referenced, causing a crash
         #
         self._pReadClient = None
+        self._handOffTime = time.perf_counter()
         self._event_loop.call_soon_threadsafe(self._handleDone)
 
+    def _ReleaseSpan(self):
+        # The span is ended by the caller once the future is done, stop timing the later reports in it.
+        if self._span is not None:
+            self._span.Add('loopHop', time.perf_counter() - self._handOffTime)
+            self._span = None
+
     def handleReportBegin(self):
         pass
 
@@ -831,11 +1298,13 @@ class AsyncReadTransaction:
 
 
 class AsyncWriteTransaction:
-    def __init__(self, future: Future, eventLoop):
+    def __init__(self, future: Future, eventLoop, span: Optional[InteractionSpan] = None):
         self._event_loop = eventLoop
         self._future = future
         self._resultData: List[AttributeWriteResult] = []
         self._resultError: Optional[PyChipError] = None
+        self._span = span
+        self._handOffTime = 0.0
 
     def handleResponse(self, path: AttributePath, status: int):
         try:
@@ -854,6 +1323,8 @@ class AsyncWriteTransaction:
         # since doing so earlier would result in the callers awaiting the result to
         # move on, possibly invalidating the provided _event_loop.
         #
+        if self._span is not None:
+            self._span.Add('loopHop', time.perf_counter() - self._handOffTime)
         if self._resultError is not None:
             if self._resultError.sdk_part is ErrorSDKPart.IM_GLOBAL_STATUS:
                 im_status = InteractionModelStatus(
@@ -873,6 +1344,7 @@ class AsyncWriteTransaction:
         ctypes.pythonapi.Py_DecRef(ctypes.py_object(self))
 
     def handleDone(self):
+        self._handOffTime = time.perf_counter()
         self._event_loop.call_soon_threadsafe(self._handleDone)
 
 
@@ -895,9 +1367,10 @@ _OnReportEndCallbackFunct = CFUNCTYPE(
 
 @_OnReadAttributeDataCallbackFunct
 def _OnReadAttributeDataCallback(closure, dataVersion: int, endpoint: int, cluster: int, attribute: int, status, data, len):
+    # The native buffer only lives for the duration of the callback: this is the one copy of the payload.
     dataBytes = ctypes.string_at(data, len)
     closure.handleAttributeData(AttributePath(
-        EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute), dataVersion, status, dataBytes[:])
+        EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute), dataVersion, status, dataBytes)
 
 
 @_OnReadEventDataCallbackFunct
@@ -911,7 +1384,7 @@ def _OnReadEventDataCallback(closure, endpoint: int, cluster: int, event: c_uint
     if status == InteractionModelStatus.Success.value:
         eventHeader = EventHeader(
             EndpointId=endpoint, ClusterId=cluster, EventId=event, EventNumber=number, Priority=EventPriority(priority), Timestamp=timestamp, TimestampType=EventTimestampType(timestampType))
-    closure.handleEventData(eventHeader, path, dataBytes[:], status)
+    closure.handleEventData(eventHeader, path, dataBytes, status)
 
 
 @_OnSubscriptionEstablishedCallbackFunct
@@ -971,9 +1444,11 @@ def _OnWriteDoneCallback(closure):
 
 def WriteAttributes(future: Future, eventLoop, device,
                     attributes: List[AttributeWriteRequest], timedRequestTimeoutMs: Union[None, int] = None,
-                    interactionTimeoutMs: Union[None, int] = None, busyWaitMs: Union[None, int] = None, forceLegacyListEncoding: bool = False) -> PyChipError:
+                    interactionTimeoutMs: Union[None, int] = None, busyWaitMs: Union[None, int] = None, forceLegacyListEncoding: bool = False,
+                    span: Optional[InteractionSpan] = None) -> PyChipError:
     handle = GetLibraryHandle()
 
+    encodeStart = time.perf_counter()
     numberOfAttributes = len(attributes)
     pyWriteAttributesArrayType = PyWriteAttributeData * numberOfAttributes
     pyWriteAttributes = pyWriteAttributesArrayType()
@@ -998,7 +1473,9 @@ def WriteAttributes(future: Future, eventLoop, device,
             ctypes.c_char_p(bytes(tlv)), c_void_p)
         pyWriteAttributes[idx].tlvLength = c_size_t(len(tlv))
 
-    transaction = AsyncWriteTransaction(future, eventLoop)
+    if span is not None:
+        span.Add('encode', time.perf_counter() - encodeStart)
+    transaction = AsyncWriteTransaction(future, eventLoop, span)
     ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
     res = builtins.chipStack.Call(
         lambda: handle.pychip_WriteClient_WriteAttributes(
@@ -1016,6 +1493,143 @@ def WriteAttributes(future: Future, eventLoop, device,
     return res
 
 
+@dataclass
+class _PendingWrite:
+    attributes: List[AttributeWriteRequest]
+    paths: Set[Tuple[int, int, int]]
+    future: Future
+
+
+class WriteCoalescer:
+    ''' Merges the writes to the same node issued within a short window into a single WriteRequest.
+
+        The attributes written with WriteAttributes are held for windowSeconds, then written along with the attributes
+        of the other writes to the node that use the same timed request and interaction timeouts and payload
+        capability. The native WriteClient chunks the merged request over several messages when it does not fit in
+        one, e.g. for large lists. Each caller gets the statuses of its own paths, as if it had written them alone.
+
+        The attributes of a write are always sent in the same WriteRequest. A write touching a path already written
+        by a pending write goes to the next WriteRequest, sent after the previous one completed, so that the writes
+        to a path are applied in order.
+
+        The WriteRequests to a node are sent one at a time, in the order their windows close. Writes with the same
+        timeouts and payload capability share a window, and are applied in the order they were issued. Writes with
+        different ones are in different windows, and are applied in the order those windows close, which may differ
+        from the order they were issued in. Writes that are not coalesced (see Drain) are only ordered after the
+        writes issued before them if Drain is awaited first.
+
+        connect is called with (nodeid, interactionTimeoutMs, payloadCapability) when a WriteRequest is due, and
+        returns the device proxy of the node.
+    '''
+
+    def __init__(self, connect: Callable[[int, Optional[int], int], Awaitable[Any]], windowSeconds: float = 0.005):
+        self._connect = connect
+        self._windowSeconds = windowSeconds
+        self._pending: Dict[Tuple, List[_PendingWrite]] = {}
+        self._timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        # The sending tasks, with the node they send to.
+        self._tasks: Dict[asyncio.Task, int] = {}
+        self._nodeLocks: Dict[int, asyncio.Lock] = {}
+
+    async def WriteAttributes(self, nodeid: int, attributes: List[AttributeWriteRequest],
+                              timedRequestTimeoutMs: Optional[int] = None, interactionTimeoutMs: Optional[int] = None,
+                              payloadCapability: int = 0) -> List[AttributeWriteResult]:
+        ''' Writes the attributes as part of the next WriteRequest to the node, and returns their statuses. Errors
+            of the whole WriteRequest are raised to every write merged in it.
+        '''
+        # Checked here rather than for the whole WriteRequest, so that the other writes are still sent.
+        for attr in attributes:
+            if attr.Attribute.must_use_timed_write and timedRequestTimeoutMs is None or timedRequestTimeoutMs == 0:
+                raise InteractionModelError(InteractionModelStatus.NeedsTimedInteraction)
+
+        eventLoop = asyncio.get_running_loop()
+        key = (nodeid, timedRequestTimeoutMs, interactionTimeoutMs, payloadCapability)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = []
+            self._timers[key] = eventLoop.call_later(self._windowSeconds, self._Flush, key)
+
+        entry = _PendingWrite(attributes, {(attr.EndpointId, attr.Attribute.cluster_id, attr.Attribute.attribute_id)
+                                           for attr in attributes}, eventLoop.create_future())
+        pending.append(entry)
+        return await entry.future
+
+    async def Drain(self, nodeid: int):
+        ''' Sends the pending writes to the node right away, and returns once every WriteRequest to the node issued
+            so far is complete. Awaited before a write to the node that is not coalesced, so that it is applied after
+            the coalesced writes issued before it.
+        '''
+        for key in [key for key in self._pending if key[0] == nodeid]:
+            self._timers[key].cancel()
+            self._Flush(key)
+        tasks = [task for task, taskNodeid in self._tasks.items() if taskNodeid == nodeid]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _Flush(self, key: Tuple):
+        pending = self._pending.pop(key)
+        del self._timers[key]
+        task = asyncio.ensure_future(self._Send(key, pending))
+        self._tasks[task] = key[0]
+        task.add_done_callback(lambda task: self._tasks.pop(task, None))
+
+    async def _Send(self, key: Tuple, entries: List[_PendingWrite]):
+        nodeid = key[0]
+        lock = self._nodeLocks.get(nodeid)
+        if lock is None:
+            lock = self._nodeLocks[nodeid] = asyncio.Lock()
+        # The tasks are started in the order the windows close, and the lock is handed over in the same order.
+        async with lock:
+            await self._SendLocked(key, entries)
+
+    async def _SendLocked(self, key: Tuple, entries: List[_PendingWrite]):
+        nodeid, timedRequestTimeoutMs, interactionTimeoutMs, payloadCapability = key
+        try:
+            device = await self._connect(nodeid, interactionTimeoutMs, payloadCapability)
+        except Exception as ex:
+            self._Fail(entries, ex)
+            return
+
+        for batch in self._Split(entries):
+            eventLoop = asyncio.get_running_loop()
+            future = eventLoop.create_future()
+            try:
+                WriteAttributes(future, eventLoop, device, [attr for entry in batch for attr in entry.attributes],
+                                timedRequestTimeoutMs=timedRequestTimeoutMs,
+                                interactionTimeoutMs=interactionTimeoutMs).raise_on_error()
+                results = await future
+            except Exception as ex:
+                self._Fail(batch, ex)
+                continue
+
+            for entry in batch:
+                if not entry.future.done():
+                    entry.future.set_result([result for result in results if (
+                        result.Path.EndpointId, result.Path.ClusterId, result.Path.AttributeId) in entry.paths])
+
+    @staticmethod
+    def _Split(entries: List[_PendingWrite]) -> List[List[_PendingWrite]]:
+        batches: List[List[_PendingWrite]] = []
+        batch: List[_PendingWrite] = []
+        paths: Set[Tuple[int, int, int]] = set()
+        for entry in entries:
+            if batch and not paths.isdisjoint(entry.paths):
+                batches.append(batch)
+                batch = []
+                paths = set()
+            batch.append(entry)
+            paths |= entry.paths
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _Fail(entries: List[_PendingWrite], exception: Exception):
+        for entry in entries:
+            if not entry.future.done():
+                entry.future.set_exception(exception)
+
+
 def WriteGroupAttributes(groupId: int, devCtrl: c_void_p, attributes: List[AttributeWriteRequest], busyWaitMs: Union[None, int] = None) -> PyChipError:
     handle = GetLibraryHandle()
 
@@ -1048,6 +1662,31 @@ def WriteGroupAttributes(groupId: int, devCtrl: c_void_p, attributes: List[Attri
     )
 
 
+# Layouts of the packed python::AttributePath, python::DataVersionFilter and python::EventPath structs in
+# attribute.cpp, the same as AttributePathIBstruct, DataVersionFilterIBstruct and EventPathIBstruct.
+_AttributePathLayout = struct.Struct("<HLLLB")
+_DataVersionFilterLayout = struct.Struct("<HLL")
+_EventPathLayout = struct.Struct("<HLLB")
+
+
+def _Wildcard(value: Optional[int], wildcard: int) -> int:
+    return wildcard if value is None else value
+
+
+def _PackPaths(layout: struct.Struct, rows: List[Tuple[int, ...]]) -> Tuple[ctypes.Array, ctypes.Array]:
+    ''' Packs the rows of path fields into a single contiguous buffer, laid out as an array of layout.
+
+        Returns the buffer and an array of pointers to each of its entries, which is what the native read
+        client takes. The buffer must be kept alive for as long as the pointers are used.
+    '''
+    pack = layout.pack
+    data = b''.join([pack(*row) for row in rows])
+    buffer = (ctypes.c_char * len(data)).from_buffer_copy(data)
+    base = ctypes.addressof(buffer)
+    pointers = (c_void_p * len(rows))(*range(base, base + len(data), layout.size))
+    return buffer, pointers
+
+
 # This struct matches the PyReadAttributeParams in attribute.cpp, for passing various params together.
 _ReadParams = construct.Struct(
     "MinInterval" / construct.Int16ul,
@@ -1070,71 +1709,33 @@ def Read(transaction: AsyncReadTransaction, device,
 
     handle = GetLibraryHandle()
 
-    attributePathsForCffi = None
+    attributePathsBuffer, attributePathsForCffi = None, None
     if attributes is not None:
-        numberOfAttributePaths = len(attributes)
-        attributePathsForCffiArrayType = c_void_p * numberOfAttributePaths
-        attributePathsForCffi = attributePathsForCffiArrayType()
-        for idx, attr in enumerate(attributes):
-            path = AttributePathIBstruct.parse(
-                b'\xff' * AttributePathIBstruct.sizeof())
-            if attr.EndpointId is not None:
-                path.EndpointId = attr.EndpointId
-            if attr.ClusterId is not None:
-                path.ClusterId = attr.ClusterId
-            if attr.AttributeId is not None:
-                path.AttributeId = attr.AttributeId
-            path = AttributePathIBstruct.build(path)
-            attributePathsForCffi[idx] = cast(ctypes.c_char_p(path), c_void_p)
-
-    dataVersionFiltersForCffi = None
+        attributePathsBuffer, attributePathsForCffi = _PackPaths(_AttributePathLayout, [
+            (_Wildcard(attr.EndpointId, 0xFFFF), _Wildcard(attr.ClusterId, 0xFFFFFFFF), _Wildcard(attr.AttributeId, 0xFFFFFFFF),
+             0xFFFFFFFF, 0xFF) for attr in attributes])
+
+    dataVersionFiltersBuffer, dataVersionFiltersForCffi = None, None
     if dataVersionFilters is not None:
-        numberOfDataVersionFilters = len(dataVersionFilters)
-        dataVersionFiltersForCffiArrayType = c_void_p * numberOfDataVersionFilters
-        dataVersionFiltersForCffi = dataVersionFiltersForCffiArrayType()
-        for idx, f in enumerate(dataVersionFilters):
-            filter = DataVersionFilterIBstruct.parse(
-                b'\xff' * DataVersionFilterIBstruct.sizeof())
-            if f.EndpointId is not None:
-                filter.EndpointId = f.EndpointId
-            else:
+        for f in dataVersionFilters:
+            if f.EndpointId is None:
                 raise ValueError(
                     "DataVersionFilter must provide EndpointId.")
-            if f.ClusterId is not None:
-                filter.ClusterId = f.ClusterId
-            else:
+            if f.ClusterId is None:
                 raise ValueError(
                     "DataVersionFilter must provide ClusterId.")
-            if f.DataVersion is not None:
-                filter.DataVersion = f.DataVersion
-            else:
+            if f.DataVersion is None:
                 raise ValueError(
                     "DataVersionFilter must provide DataVersion.")
-            filter = DataVersionFilterIBstruct.build(
-                filter)
-            dataVersionFiltersForCffi[idx] = cast(
-                ctypes.c_char_p(filter), c_void_p)
+        dataVersionFiltersBuffer, dataVersionFiltersForCffi = _PackPaths(_DataVersionFilterLayout, [
+            (f.EndpointId, f.ClusterId, f.DataVersion) for f in dataVersionFilters])
 
-    eventPathsForCffi = None
+    eventPathsBuffer, eventPathsForCffi = None, None
     if events is not None:
-        numberOfEvents = len(events)
-        eventPathsForCffiArrayType = c_void_p * numberOfEvents
-        eventPathsForCffi = eventPathsForCffiArrayType()
-        for idx, event in enumerate(events):
-            path = EventPathIBstruct.parse(
-                b'\xff' * EventPathIBstruct.sizeof())
-            if event.EndpointId is not None:
-                path.EndpointId = event.EndpointId
-            if event.ClusterId is not None:
-                path.ClusterId = event.ClusterId
-            if event.EventId is not None:
-                path.EventId = event.EventId
-            if event.Urgent is not None and subscriptionParameters is not None:
-                path.Urgent = event.Urgent
-            else:
-                path.Urgent = 0
-            path = EventPathIBstruct.build(path)
-            eventPathsForCffi[idx] = cast(ctypes.c_char_p(path), c_void_p)
+        isSubscription = subscriptionParameters is not None
+        eventPathsBuffer, eventPathsForCffi = _PackPaths(_EventPathLayout, [
+            (_Wildcard(event.EndpointId, 0xFFFF), _Wildcard(event.ClusterId, 0xFFFFFFFF), _Wildcard(event.EventId, 0xFFFFFFFF),
+             event.Urgent if event.Urgent is not None and isSubscription else 0) for event in events])
 
     readClientObj = ctypes.POINTER(c_void_p)()
 
@@ -1202,6 +1803,7 @@ def Init():
         setter.Set('pychip_WriteClient_InitCallbacks', None, [
                    _OnWriteResponseCallbackFunct, _OnWriteErrorCallbackFunct, _OnWriteDoneCallbackFunct])
         handle.pychip_ReadClient_Read.restype = PyChipError
+        setter.Set('pychip_ReadClient_Abort', None, [py_object])
         setter.Set('pychip_ReadClient_InitCallbacks', None, [
                    _OnReadAttributeDataCallbackFunct, _OnReadEventDataCallbackFunct,
                    _OnSubscriptionEstablishedCallbackFunct, _OnResubscriptionAttemptedCallbackFunct,
@@ -1214,7 +1816,3 @@ def Init():
         _OnReadAttributeDataCallback, _OnReadEventDataCallback,
         _OnSubscriptionEstablishedCallback, _OnResubscriptionAttemptedCallback, _OnReadErrorCallback, _OnReadDoneCallback,
         _OnReportBeginCallback, _OnReportEndCallback)
-
-    _BuildAttributeIndex()
-    _BuildClusterIndex()
-    _BuildEventIndex()
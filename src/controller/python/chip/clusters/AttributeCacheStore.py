@@ -0,0 +1,211 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import functools
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from ..interaction_model import InteractionModelError
+from ..interaction_model import Status as InteractionModelStatus
+from ..tlv import TLVReader, TLVWriter
+from .Attribute import AttributeCache, AttributePath, LazyDecodeDict, ValueDecodeFailure, _DecodeTLV, _DeferredValue
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _NodeKey(nodeid: int) -> str:
+    # Node IDs are 64-bit unsigned, which does not fit SQLite (signed) integers.
+    return f'{nodeid:016X}'
+
+
+@dataclass
+class AttributeCacheSnapshot:
+    ''' The rows of a snapshot taken by AttributeCacheStore.Snapshot, to be written by AttributeCacheStore.Write.
+    '''
+    node: str
+    view: str
+    clusters: List[Tuple[int, int]]
+    replaceAll: bool
+    attributeRows: List[Tuple]
+    versionRows: List[Tuple]
+
+
+class AttributeCacheStore:
+    ''' Stores snapshots of the AttributeCache of nodes in an SQLite database, so that a controller can start from
+        the data read before a restart instead of reading every node in full again.
+
+        A snapshot holds the raw TLV of every attribute, keyed by (endpoint, cluster, attribute), along with the data
+        version of every cluster instance, which is what is needed to only read the clusters that changed since (see
+        ChipDeviceControllerBase.ReadIncremental). Snapshots are stored per node and per view, a string identifying
+        what was read (e.g. the attribute paths), and are only loaded when asked for.
+
+        Attributes read with an error status are stored as their status.
+    '''
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS attributes (node TEXT NOT NULL, view TEXT NOT NULL, endpoint INTEGER NOT NULL, '
+                'cluster INTEGER NOT NULL, attribute INTEGER NOT NULL, status INTEGER NOT NULL, value BLOB, '
+                'PRIMARY KEY (node, view, endpoint, cluster, attribute)) WITHOUT ROWID')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS versions (node TEXT NOT NULL, view TEXT NOT NULL, endpoint INTEGER NOT NULL, '
+                'cluster INTEGER NOT NULL, version INTEGER NOT NULL, PRIMARY KEY (node, view, endpoint, cluster)) WITHOUT ROWID')
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def Save(self, nodeid: int, view: str, cache: AttributeCache, clusters: Optional[Iterable[Tuple[int, int]]] = None):
+        ''' Stores the snapshot of a node, replacing the stored one.
+
+            With clusters, only the given (endpoint, cluster) instances are replaced, e.g. the ones reported by an
+            incremental read; they are removed from the snapshot if they are not in the cache anymore.
+        '''
+        self.Write(self.Snapshot(nodeid, view, cache, clusters))
+
+    def Snapshot(self, nodeid: int, view: str, cache: AttributeCache,
+                 clusters: Optional[Iterable[Tuple[int, int]]] = None) -> AttributeCacheSnapshot:
+        ''' Returns the snapshot Save would store, without touching the database, see Write.
+
+            The cache is only read here, so this must run where the cache is updated (e.g. on the event loop), while
+            Write can run in another thread.
+        '''
+        node = _NodeKey(nodeid)
+        if clusters is None:
+            clusters = [(endpointId, clusterId) for endpointId, endpointCache in cache.attributeTLVCache.items()
+                        for clusterId in endpointCache]
+            replaceAll = True
+        else:
+            clusters = list(clusters)
+            replaceAll = False
+
+        attributeRows = []
+        versionRows = []
+        for endpointId, clusterId in clusters:
+            attributes = cache.attributeTLVCache.get(endpointId, {}).get(clusterId)
+            if attributes is None:
+                continue
+            for attributeId in attributes:
+                raw = attributes.GetRaw(attributeId) if isinstance(attributes, LazyDecodeDict) else None
+                if raw is not None:
+                    # Not decoded yet, the payload is stored as received.
+                    attributeRows.append((node, view, endpointId, clusterId, attributeId, int(InteractionModelStatus.Success),
+                                          bytes(raw)))
+                    continue
+                value = attributes[attributeId]
+                if isinstance(value, ValueDecodeFailure):
+                    if not isinstance(value.Reason, InteractionModelError):
+                        continue
+                    attributeRows.append((node, view, endpointId, clusterId, attributeId, int(value.Reason.status), None))
+                else:
+                    writer = TLVWriter()
+                    writer.put(None, value)
+                    attributeRows.append((node, view, endpointId, clusterId, attributeId, int(InteractionModelStatus.Success),
+                                          bytes(writer.encoding)))
+            version = cache.versionList.get(endpointId, {}).get(clusterId)
+            if version is not None:
+                versionRows.append((node, view, endpointId, clusterId, version))
+
+        return AttributeCacheSnapshot(node, view, clusters, replaceAll, attributeRows, versionRows)
+
+    def Write(self, snapshot: AttributeCacheSnapshot):
+        ''' Stores a snapshot taken by Snapshot, in a single transaction. Can be called from any thread.
+        '''
+        node, view = snapshot.node, snapshot.view
+        with self._lock, self._connection:
+            if snapshot.replaceAll:
+                self._connection.execute('DELETE FROM attributes WHERE node = ? AND view = ?', (node, view))
+                self._connection.execute('DELETE FROM versions WHERE node = ? AND view = ?', (node, view))
+            else:
+                clusterRows = [(node, view, endpointId, clusterId) for endpointId, clusterId in snapshot.clusters]
+                self._connection.executemany(
+                    'DELETE FROM attributes WHERE node = ? AND view = ? AND endpoint = ? AND cluster = ?', clusterRows)
+                self._connection.executemany(
+                    'DELETE FROM versions WHERE node = ? AND view = ? AND endpoint = ? AND cluster = ?', clusterRows)
+            self._connection.executemany('INSERT INTO attributes VALUES (?, ?, ?, ?, ?, ?, ?)', snapshot.attributeRows)
+            self._connection.executemany('INSERT INTO versions VALUES (?, ?, ?, ?, ?)', snapshot.versionRows)
+
+    def Load(self, nodeid: int, view: str, returnClusterObject: bool = False,
+             lazyDecode: bool = False, deferTLVDecode: bool = False) -> Optional[AttributeCache]:
+        ''' Returns an AttributeCache filled with the snapshot of a node, or None if there is none.
+
+            With deferTLVDecode, the stored TLV of an attribute is only decoded once looked up (see AttributeCache).
+        '''
+        node = _NodeKey(nodeid)
+        with self._lock:
+            versions = self._connection.execute(
+                'SELECT endpoint, cluster, version FROM versions WHERE node = ? AND view = ?', (node, view)).fetchall()
+            attributes = self._connection.execute(
+                'SELECT endpoint, cluster, attribute, status, value FROM attributes WHERE node = ? AND view = ?',
+                (node, view)).fetchall()
+        if not versions and not attributes:
+            return None
+
+        clusterVersions = {(endpointId, clusterId): version for endpointId, clusterId, version in versions}
+        cache = AttributeCache(returnClusterObject=returnClusterObject, lazyDecode=lazyDecode,
+                               deferTLVDecode=deferTLVDecode)
+        for endpointId, clusterId, attributeId, status, value in attributes:
+            if status != InteractionModelStatus.Success:
+                data = ValueDecodeFailure(None, InteractionModelError(InteractionModelStatus(status)))
+            elif deferTLVDecode:
+                data = _DeferredValue(functools.partial(_DecodeTLV, value), value)
+            else:
+                data = TLVReader(value, valuesOnly=True).get().get("Any", {})
+            cache.UpdateTLV(AttributePath(EndpointId=endpointId, ClusterId=clusterId, AttributeId=attributeId),
+                            clusterVersions.get((endpointId, clusterId)), data)
+
+        # UpdateTLV records a version for every cluster with attributes, only keep the stored ones.
+        for endpointId, endpointVersions in cache.versionList.items():
+            for clusterId in [clusterId for clusterId, version in endpointVersions.items() if version is None]:
+                del endpointVersions[clusterId]
+        return cache
+
+    def Delete(self, nodeid: Optional[int] = None, view: Optional[str] = None):
+        ''' Deletes the snapshots of a node (in a single view, or in all views), or of all nodes if nodeid is None.
+        '''
+        where = []
+        args = []
+        if nodeid is not None:
+            where.append('node = ?')
+            args.append(_NodeKey(nodeid))
+            if view is not None:
+                where.append('view = ?')
+                args.append(view)
+        condition = f" WHERE {' AND '.join(where)}" if where else ''
+        with self._lock, self._connection:
+            self._connection.execute(f'DELETE FROM attributes{condition}', args)
+            self._connection.execute(f'DELETE FROM versions{condition}', args)
+
+    def Nodes(self) -> List[int]:
+        ''' Returns the Node IDs with a stored snapshot.
+        '''
+        with self._lock:
+            rows = self._connection.execute('SELECT DISTINCT node FROM versions UNION SELECT DISTINCT node FROM attributes')
+            return sorted(int(node, 16) for node, in rows)
+
+    def Close(self):
+        with self._lock:
+            self._connection.close()
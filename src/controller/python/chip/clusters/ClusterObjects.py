@@ -15,9 +15,11 @@
 #    limitations under the License.
 #
 
+from __future__ import annotations
+
 import enum
 import typing
-from dataclasses import asdict, dataclass, field, make_dataclass
+from dataclasses import dataclass, field, make_dataclass
 from typing import Any, ClassVar, Dict, List, Mapping, Union
 
 from dacite import from_dict  # type: ignore
@@ -50,19 +52,88 @@ def GetUnionUnderlyingType(typeToCheck, matchingType=None):
     return None
 
 
+_ENCODERS = {
+    bool: tlv.TLVWriter.putBool,
+    tlv.uint: tlv.TLVWriter.putUnsignedInt,
+    int: tlv.TLVWriter.putSignedInt,
+    tlv.float32: tlv.TLVWriter.putFloat,
+    float: tlv.TLVWriter.putDouble,
+    str: tlv.TLVWriter.putString,
+    bytes: tlv.TLVWriter.putBytes,
+}
+
+
+class _FieldPlan:
+    ''' The type information of a ClusterObjectFieldDescriptor resolved once, so that encoding and
+        decoding values do not need to walk typing constructs (Optional, Nullable, List) every time.
+    '''
+    __slots__ = ('nullable', 'optional', 'valueType', 'isList', 'elementType', 'isStruct', 'isEnum', 'encoder')
+
+    def __init__(self, fieldType):
+        self.nullable = GetUnionUnderlyingType(fieldType, Nullable) is not None
+        self.optional = GetUnionUnderlyingType(fieldType, type(None)) is not None
+
+        # For unions, valueType is the 'real' type behind Optional / Nullable. It stays None if there
+        # is no such type, which is reported as an error when a value is decoded for this field.
+        if typing.get_origin(fieldType) == typing.Union:
+            self.valueType = GetUnionUnderlyingType(fieldType)
+        else:
+            self.valueType = fieldType
+
+        self.isList = typing.get_origin(self.valueType) == list
+        self.elementType = typing.get_args(self.valueType)[0] if self.isList else self.valueType
+        self.isStruct = isinstance(self.elementType, type) and issubclass(self.elementType, ClusterObject)
+        self.isEnum = isinstance(self.elementType, type) and issubclass(self.elementType, enum.Enum)
+        # The TLVWriter method TLVWriter.put would pick for an element once converted to elementType.
+        self.encoder = tlv.TLVWriter.putUnsignedInt if self.isEnum else _ENCODERS.get(self.elementType, tlv.TLVWriter.put)
+
+    def ConvertElement(self, debugPath: str, value: Any, construct: bool = False) -> Any:
+        ''' Converts a single decoded TLV element. Structs are converted to label dicts, or straight
+            into instances of their cluster object class if construct is True.
+        '''
+        elementType = self.elementType
+        if self.isStruct:
+            if not isinstance(value, Mapping):
+                raise ValueError(
+                    f"Failed to decode field {debugPath}, struct expected.")
+            if construct:
+                return GetCompiledDescriptor(elementType).TagDictToObject(elementType, debugPath, value)
+            return GetCompiledDescriptor(elementType).TagDictToLabelDict(debugPath, value)
+
+        if self.isEnum:
+            value = elementType(value)
+        if not isinstance(value, elementType):
+            raise ValueError(
+                f"Failed to decode field {debugPath}, expected type {elementType}, got {type(value)}")
+        return value
+
+
 @dataclass
 class ClusterObjectFieldDescriptor:
     Label: str = ''
     Tag: typing.Optional[int] = None
     Type: type = type(None)
+    _plan: typing.Optional[_FieldPlan] = field(default=None, init=False, repr=False, compare=False)
 
-    def _PutSingleElementToTLV(self, tag, val, elementType, writer: tlv.TLVWriter, debugPath: str = '?'):
-        if issubclass(elementType, ClusterObject):
-            if not isinstance(val, dict):
+    @property
+    def plan(self) -> _FieldPlan:
+        if self._plan is None:
+            self._plan = _FieldPlan(self.Type)
+        return self._plan
+
+    def _PutSingleElementToTLV(self, tag, val, elementType, isStruct: bool, writer: tlv.TLVWriter, debugPath: str = '?',
+                               encoder=tlv.TLVWriter.put):
+        if isStruct:
+            # Structs are either cluster objects, encoded straight from their fields, or label dicts.
+            if isinstance(val, ClusterObject):
+                GetCompiledDescriptor(elementType).ObjectToTLVWithWriter(
+                    f'{debugPath}.{self.Label}', tag, val, writer)
+            elif isinstance(val, dict):
+                GetCompiledDescriptor(elementType).DictToTLVWithWriter(
+                    f'{debugPath}.{self.Label}', tag, val, writer)
+            else:
                 raise ValueError(
                     f"Field {debugPath}.{self.Label} expected a struct, but got {type(val)}")
-            elementType.descriptor.DictToTLVWithWriter(
-                f'{debugPath}.{self.Label}', tag, val, writer)
             return
 
         try:
@@ -70,17 +141,18 @@ class ClusterObjectFieldDescriptor:
         except Exception:
             raise ValueError(
                 f"Field {debugPath}.{self.Label} expected {elementType}, but got {type(val)}")
-        writer.put(tag, val)
+        encoder(writer, tag, val)
 
     def PutFieldToTLV(self, tag, val, writer: tlv.TLVWriter, debugPath: str = '?'):
-        if (val == NullValue):
-            if (GetUnionUnderlyingType(self.Type, Nullable) is None):
+        plan = self.plan
+        if isinstance(val, Nullable):
+            if not plan.nullable:
                 raise ValueError(
                     f"Field {debugPath}.{self.Label} was not nullable, but got a null")
 
-            writer.put(tag, None)
+            writer.putNull(tag)
         elif (val is None):
-            if (GetUnionUnderlyingType(self.Type, type(None)) is None):
+            if not plan.optional:
                 raise ValueError(
                     f"Field {debugPath}.{self.Label} was not optional, but encountered None")
         else:
@@ -89,93 +161,124 @@ class ClusterObjectFieldDescriptor:
             # So, let's get at the 'real' type within that union before proceeding,
             # since at this point, we're guarenteed to not get None or Null as values.
             #
-            elementType = GetUnionUnderlyingType(self.Type)
+            elementType = plan.valueType
             if (elementType is None):
                 elementType = self.Type
 
             if not isinstance(val, List):
-                self._PutSingleElementToTLV(
-                    tag, val, elementType, writer, debugPath)
+                if plan.isList:
+                    self._PutSingleElementToTLV(tag, val, elementType, False, writer, debugPath)
+                else:
+                    self._PutSingleElementToTLV(tag, val, elementType, plan.isStruct, writer, debugPath, plan.encoder)
                 return
 
+            if not plan.isList:
+                raise ValueError(
+                    f"Field {debugPath}.{self.Label} expected {elementType}, but got a list")
+
             writer.startArray(tag)
+            if plan.isStruct:
+                for i, v in enumerate(val):
+                    self._PutSingleElementToTLV(
+                        None, v, plan.elementType, True, writer, debugPath + f'[{i}]')
+            else:
+                # Scalar lists (attribute lists, subjects, ...) can be long: convert and encode the elements
+                # in place, only building the element path for error messages.
+                elementType = plan.elementType
+                encoder = plan.encoder
+                for i, v in enumerate(val):
+                    try:
+                        v = elementType(v)
+                    except Exception:
+                        raise ValueError(
+                            f"Field {debugPath}[{i}].{self.Label} expected {elementType}, but got {type(v)}")
+                    encoder(writer, None, v)
+            writer.endContainer()
 
-            # Get the type of the list. This is a generic, which has its sub-type information of the list element
-            # inside its type argument.
-            (elementType, ) = typing.get_args(elementType)
+    def DecodeValue(self, debugPath: str, value: Any, construct: bool = False) -> Any:
+        ''' Converts a value decoded from TLV into the data model representation of this field. '''
+        if (value is None):
+            return NullValue
 
-            for i, v in enumerate(val):
-                self._PutSingleElementToTLV(
-                    None, v, elementType, writer, debugPath + f'[{i}]')
-            writer.endContainer()
+        plan = self.plan
+        if (plan.valueType is None):
+            raise ValueError(
+                f"Field {debugPath}.{self.Label} has no valid underlying data model type")
+
+        if plan.isList:
+            return [plan.ConvertElement(f'{debugPath}[{i}]', v, construct) for i, v in enumerate(value)]
+        return plan.ConvertElement(f'{debugPath}.{self.Label}', value, construct)
 
 
 @dataclass
 class ClusterObjectDescriptor:
     Fields: List[ClusterObjectFieldDescriptor]
+    _fieldsByTag: typing.Optional[Dict[int, ClusterObjectFieldDescriptor]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _fieldsByLabel: typing.Optional[Dict[str, ClusterObjectFieldDescriptor]] = field(
+        default=None, init=False, repr=False, compare=False)
 
-    def GetFieldByTag(self, tag: int) -> typing.Optional[ClusterObjectFieldDescriptor]:
-        for _field in self.Fields:
-            if _field.Tag == tag:
-                return _field
-        return None
+    def Compile(self) -> ClusterObjectDescriptor:
+        ''' Builds the lookup tables and resolves the type information of all fields up front.
 
-    def GetFieldByLabel(self, label: str) -> typing.Optional[ClusterObjectFieldDescriptor]:
-        for _field in self.Fields:
-            if _field.Label == label:
-                return _field
-        return None
+            This happens lazily on first use anyway; descriptors returned by GetCompiledDescriptor
+            have already been compiled.
+        '''
+        self._fieldsByTag = {}
+        self._fieldsByLabel = {}
+        # Keep the first field for duplicated tags / labels, like the linear scan used to.
+        for _field in reversed(self.Fields):
+            self._fieldsByTag[_field.Tag] = _field
+            self._fieldsByLabel[_field.Label] = _field
+            _field.plan
+        return self
 
-    def _ConvertNonArray(self, debugPath: str, elementType, value: Any) -> Any:
-        if not issubclass(elementType, ClusterObject):
-            if (issubclass(elementType, enum.Enum)):
-                value = elementType(value)
+    def GetFieldByTag(self, tag: int) -> typing.Optional[ClusterObjectFieldDescriptor]:
+        if self._fieldsByTag is None:
+            self.Compile()
+        return self._fieldsByTag.get(tag)
 
-            if not isinstance(value, elementType):
-                raise ValueError(
-                    f"Failed to decode field {debugPath}, expected type {elementType}, got {type(value)}")
-            return value
-        if not isinstance(value, Mapping):
-            raise ValueError(
-                f"Failed to decode field {debugPath}, struct expected.")
-        return elementType.descriptor.TagDictToLabelDict(debugPath, value)
+    def GetFieldByLabel(self, label: str) -> typing.Optional[ClusterObjectFieldDescriptor]:
+        if self._fieldsByLabel is None:
+            self.Compile()
+        return self._fieldsByLabel.get(label)
 
     def TagDictToLabelDict(self, debugPath: str, tlvData: Dict[int, Any]) -> Dict[str, Any]:
+        if self._fieldsByTag is None:
+            self.Compile()
+        fieldsByTag = self._fieldsByTag
+
         ret: typing.Dict[Any, Any] = {}
         for tag, value in tlvData.items():
-            descriptor = self.GetFieldByTag(tag)
+            descriptor = fieldsByTag.get(tag)
             if not descriptor:
                 # We do not have enough information for this field.
                 ret[tag] = value
                 continue
+            ret[descriptor.Label] = descriptor.DecodeValue(debugPath, value)
+        return ret
 
-            if (value is None):
-                ret[descriptor.Label] = NullValue
-                continue
+    def TagDictToObject(self, objectType, debugPath: str, tlvData: Dict[int, Any]):
+        ''' Builds an instance of objectType (the cluster object class this descriptor belongs to)
+            straight from decoded TLV data.
 
-            if (typing.get_origin(descriptor.Type) == typing.Union):
-                realType = GetUnionUnderlyingType(descriptor.Type)
-                if (realType is None):
-                    raise ValueError(
-                        f"Field {debugPath}.{descriptor.Label} has no valid underlying data model type")
+            Values are converted and checked the same way as in TagDictToLabelDict, so this skips the
+            intermediate label dict and the reflective re-validation done by dacite.from_dict. Tags
+            unknown to the descriptor are dropped, and missing fields take their default value.
+        '''
+        if self._fieldsByTag is None:
+            self.Compile()
+        fieldsByTag = self._fieldsByTag
 
-                valueType = realType
-            else:
-                valueType = descriptor.Type
-
-            if (typing.get_origin(valueType) == list):
-                listElementType = typing.get_args(valueType)[0]
-                ret[descriptor.Label] = [
-                    self._ConvertNonArray(
-                        f'{debugPath}[{i}]', listElementType, v)
-                    for i, v in enumerate(value)]
-                continue
-            ret[descriptor.Label] = self._ConvertNonArray(
-                f'{debugPath}.{descriptor.Label}', valueType, value)
-        return ret
+        kwargs = {}
+        for tag, value in tlvData.items():
+            descriptor = fieldsByTag.get(tag)
+            if descriptor is not None:
+                kwargs[descriptor.Label] = descriptor.DecodeValue(debugPath, value, construct=True)
+        return objectType(**kwargs)
 
     def TLVToDict(self, tlvBuf: bytes) -> Dict[str, Any]:
-        tlvData = tlv.TLVReader(tlvBuf).get().get('Any', {})
+        tlvData = tlv.TLVReader(tlvBuf, valuesOnly=True).get().get('Any', {})
         return self.TagDictToLabelDict('', tlvData)
 
     def DictToTLVWithWriter(self, debugPath: str, tag, data: Mapping, writer: tlv.TLVWriter):
@@ -185,37 +288,159 @@ class ClusterObjectDescriptor:
             _field.PutFieldToTLV(_field.Tag, val, writer, debugPath + f'.{_field.Label}')
         writer.endContainer()
 
+    def ObjectToTLVWithWriter(self, debugPath: str, tag, obj, writer: tlv.TLVWriter):
+        ''' Encodes a cluster object straight from its fields, in descriptor order.
+
+            This is the same encoding as DictToTLVWithWriter(asdict(obj)), without copying the whole
+            object tree into dicts first.
+        '''
+        writer.startStructure(tag)
+        for _field in self.Fields:
+            val = getattr(obj, _field.Label, None)
+            _field.PutFieldToTLV(_field.Tag, val, writer, debugPath + f'.{_field.Label}')
+        writer.endContainer()
+
     def DictToTLV(self, data: dict) -> bytes:
         tlvwriter = tlv.TLVWriter(bytearray())
         self.DictToTLVWithWriter('', None, data, tlvwriter)
         return bytes(tlvwriter.encoding)
 
 
+def GetCompiledDescriptor(objectType) -> ClusterObjectDescriptor:
+    ''' Returns the descriptor of a ClusterObject subclass.
+
+        The generated descriptor classproperties build a new descriptor on every access, so the
+        compiled descriptor is built once and cached on the class itself.
+    '''
+    descriptor = objectType.__dict__.get('_compiledDescriptor')
+    if descriptor is None:
+        descriptor = objectType.descriptor.Compile()
+        setattr(objectType, '_compiledDescriptor', descriptor)
+    return descriptor
+
+
+_strictDecoding = False
+
+
+def SetStrictDecoding(enabled: bool):
+    ''' Sets whether cluster objects decoded from TLV are built through dacite.from_dict by default.
+
+        By default, objects are constructed directly from the decoded TLV. In strict mode, values are
+        first turned into a label dict and dacite re-validates every field against the dataclass type
+        hints. This is considerably slower, and mostly useful when debugging schema mismatches.
+
+        The default can be overridden for individual calls with the strict argument of FromTLV,
+        FromTagDict and FromTagDictOrRawValue.
+    '''
+    global _strictDecoding
+    _strictDecoding = enabled
+
+
+def IsStrictDecoding(strict: typing.Optional[bool] = None) -> bool:
+    return _strictDecoding if strict is None else strict
+
+
 class ClusterObject:
     def ToTLV(self):
-        return self.descriptor.DictToTLV(asdict(self))
+        writer = tlv.TLVWriter()
+        GetCompiledDescriptor(type(self)).ObjectToTLVWithWriter('', None, self, writer)
+        return bytes(writer.encoding)
 
     @classmethod
     def FromDict(cls, data: dict):
         return from_dict(data_class=cls, data=data)
 
     @classmethod
-    def FromTLV(cls, data: bytes):
-        return cls.FromDict(data=cls.descriptor.TLVToDict(data))
+    def FromTagDict(cls, data: Mapping, strict: typing.Optional[bool] = None):
+        ''' Builds an object from TLV data already decoded by TLVReader (a dict keyed by tags). '''
+        descriptor = GetCompiledDescriptor(cls)
+        if IsStrictDecoding(strict):
+            return cls.FromDict(data=descriptor.TagDictToLabelDict('', data))
+        return descriptor.TagDictToObject(cls, '', data)
+
+    @classmethod
+    def FromTLV(cls, data: bytes, strict: typing.Optional[bool] = None):
+        return cls.FromTagDict(tlv.TLVReader(data, valuesOnly=True).get().get('Any', {}), strict)
 
     @ChipUtility.classproperty
     def descriptor(cls):
         raise NotImplementedError()
 
 
+_loadCluster: typing.Optional[typing.Callable[[int], bool]] = None
+_loadAllClusters: typing.Optional[typing.Callable[[], None]] = None
+
+
+def SetClusterLoader(loadCluster: typing.Callable[[int], bool], loadAllClusters: typing.Callable[[], None]):
+    ''' Sets the functions importing the generated cluster definitions on demand.
+
+        loadCluster imports the definitions of a cluster id and returns False if the cluster id is unknown,
+        loadAllClusters imports the definitions of all the clusters.
+    '''
+    global _loadCluster, _loadAllClusters
+    _loadCluster = loadCluster
+    _loadAllClusters = loadAllClusters
+
+
+class ClusterRegistry(dict):
+    ''' A dictionary keyed by cluster id, filled as the cluster objects are defined.
+
+        The generated cluster definitions are only imported the first time they are used, so looking up a
+        cluster id that is not in the dictionary yet imports the definitions of that cluster, and enumerating
+        the dictionary imports all of them.
+    '''
+
+    def _Load(self, clusterId) -> bool:
+        return _loadCluster is not None and _loadCluster(clusterId) and dict.__contains__(self, clusterId)
+
+    def _LoadAll(self):
+        if _loadAllClusters is not None:
+            _loadAllClusters()
+
+    def __missing__(self, clusterId):
+        if self._Load(clusterId):
+            return dict.__getitem__(self, clusterId)
+        raise KeyError(clusterId)
+
+    def __contains__(self, clusterId) -> bool:
+        return dict.__contains__(self, clusterId) or self._Load(clusterId)
+
+    def get(self, clusterId, default=None):
+        return self[clusterId] if clusterId in self else default
+
+    def __iter__(self):
+        self._LoadAll()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._LoadAll()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._LoadAll()
+        return dict.keys(self)
+
+    def values(self):
+        self._LoadAll()
+        return dict.values(self)
+
+    def items(self):
+        self._LoadAll()
+        return dict.items(self)
+
+    def __repr__(self) -> str:
+        self._LoadAll()
+        return dict.__repr__(self)
+
+
 # The below dictionaries will be filled dynamically
 # and are used for quick lookup/mapping from cluster/attribute id to the correct class
-ALL_CLUSTERS: typing.Dict = {}
-ALL_ATTRIBUTES: typing.Dict = {}
+ALL_CLUSTERS: typing.Dict = ClusterRegistry()
+ALL_ATTRIBUTES: typing.Dict = ClusterRegistry()
 # These need to be separate because there can be overlap in command ids for commands and responses.
-ALL_ACCEPTED_COMMANDS: typing.Dict = {}
-ALL_GENERATED_COMMANDS: typing.Dict = {}
-ALL_EVENTS: typing.Dict = {}
+ALL_ACCEPTED_COMMANDS: typing.Dict = ClusterRegistry()
+ALL_GENERATED_COMMANDS: typing.Dict = ClusterRegistry()
+ALL_EVENTS: typing.Dict = ClusterRegistry()
 
 
 class ClusterCommand(ClusterObject):
@@ -224,13 +449,9 @@ class ClusterCommand(ClusterObject):
         super().__init_subclass__(*args, **kwargs)
         try:
             if cls.is_client:
-                if cls.cluster_id not in ALL_ACCEPTED_COMMANDS:
-                    ALL_ACCEPTED_COMMANDS[cls.cluster_id] = {}
-                ALL_ACCEPTED_COMMANDS[cls.cluster_id][cls.command_id] = cls
+                ALL_ACCEPTED_COMMANDS.setdefault(cls.cluster_id, {})[cls.command_id] = cls
             else:
-                if cls.cluster_id not in ALL_GENERATED_COMMANDS:
-                    ALL_GENERATED_COMMANDS[cls.cluster_id] = {}
-                ALL_GENERATED_COMMANDS[cls.cluster_id][cls.command_id] = cls
+                ALL_GENERATED_COMMANDS.setdefault(cls.cluster_id, {})[cls.command_id] = cls
         except NotImplementedError:
             # handle case where the ClusterAttribute class is not (fully) subclassed
             # and accessing the id property throws a NotImplementedError.
@@ -299,29 +520,25 @@ class ClusterAttributeDescriptor:
         """Register a subclass."""
         super().__init_subclass__(*args, **kwargs)
         if cls.standard_attribute:
-            if cls.cluster_id not in ALL_ATTRIBUTES:
-                ALL_ATTRIBUTES[cls.cluster_id] = {}
             # register this clusterattribute in the ALL_ATTRIBUTES dict for quick lookups
-            ALL_ATTRIBUTES[cls.cluster_id][cls.attribute_id] = cls
+            ALL_ATTRIBUTES.setdefault(cls.cluster_id, {})[cls.attribute_id] = cls
 
     @classmethod
     def ToTLV(cls, tag: Union[int, None], value):
         writer = tlv.TLVWriter()
-        wrapped_value = cls._cluster_object(Value=value)
-        cls.attribute_type.PutFieldToTLV(tag,
-                                         asdict(wrapped_value)['Value'], writer, '')
+        cls._compiled_attribute_type.PutFieldToTLV(tag, value, writer, '')
         return writer.encoding
 
     @classmethod
-    def FromTLV(cls, tlvBuffer: bytes):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(
-            obj_class.descriptor.TagDictToLabelDict('', {0: tlv.TLVReader(tlvBuffer).get().get('Any', {})})).Value
+    def FromTLV(cls, tlvBuffer: bytes, strict: typing.Optional[bool] = None):
+        return cls.FromTagDictOrRawValue(tlv.TLVReader(tlvBuffer, valuesOnly=True).get().get('Any', {}), strict)
 
     @classmethod
-    def FromTagDictOrRawValue(cls, val: Any):
+    def FromTagDictOrRawValue(cls, val: Any, strict: typing.Optional[bool] = None):
         obj_class = cls._cluster_object
-        return obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict('', {0: val})).Value
+        if IsStrictDecoding(strict):
+            return obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict('', {0: val})).Value
+        return obj_class.descriptor.Fields[0].DecodeValue('', val, construct=True)
 
     @ChipUtility.classproperty
     def cluster_id(self) -> int:
@@ -343,22 +560,39 @@ class ClusterAttributeDescriptor:
     def standard_attribute(cls) -> bool:
         return True
 
+    @ChipUtility.classproperty
+    def _compiled_attribute_type(cls) -> ClusterObjectFieldDescriptor:
+        # attribute_type builds a new field descriptor on every access; keep one per attribute class
+        # so its type information is only resolved once.
+        attribute_type = cls.__dict__.get('_compiledAttributeType')
+        if attribute_type is None:
+            attribute_type = cls.attribute_type
+            setattr(cls, '_compiledAttributeType', attribute_type)
+        return attribute_type
+
     @ChipUtility.classproperty
     def _cluster_object(cls) -> ClusterObject:
-        return make_dataclass('InternalClass',
-                              [
-                                  ('Value', cls.attribute_type.Type,
-                                   field(default=None)),
-                                  ('descriptor', ClassVar[ClusterObjectDescriptor],
-                                   field(
-                                      default=ClusterObjectDescriptor(
-                                          Fields=[ClusterObjectFieldDescriptor(
-                                              Label='Value', Tag=0, Type=cls.attribute_type.Type)]
-                                      )
-                                  )
-                                  )
-                              ],
-                              bases=(ClusterObject,))
+        obj_class = cls.__dict__.get('_clusterObjectClass')
+        if obj_class is not None:
+            return obj_class
+
+        attribute_type = cls._compiled_attribute_type.Type
+        obj_class = make_dataclass('InternalClass',
+                                   [
+                                       ('Value', attribute_type,
+                                        field(default=None)),
+                                       ('descriptor', ClassVar[ClusterObjectDescriptor],
+                                        field(
+                                           default=ClusterObjectDescriptor(
+                                               Fields=[ClusterObjectFieldDescriptor(
+                                                   Label='Value', Tag=0, Type=attribute_type)]
+                                           ).Compile()
+                                       )
+                                       )
+                                   ],
+                                   bases=(ClusterObject,))
+        setattr(cls, '_clusterObjectClass', obj_class)
+        return obj_class
 
 
 class ClusterEvent(ClusterObject):
@@ -366,10 +600,8 @@ class ClusterEvent(ClusterObject):
         """Register a subclass."""
         super().__init_subclass__(*args, **kwargs)
 
-        if cls.cluster_id not in ALL_EVENTS:
-            ALL_EVENTS[cls.cluster_id] = {}
         # register this clusterattribute in the ALL_ATTRIBUTES dict for quick lookups
-        ALL_EVENTS[cls.cluster_id][cls.event_id] = cls
+        ALL_EVENTS.setdefault(cls.cluster_id, {})[cls.event_id] = cls
 
     @ChipUtility.classproperty
     def cluster_id(self) -> int:
@@ -15,22 +15,24 @@
 #    limitations under the License.
 #
 
+import asyncio
 import builtins
 import ctypes
-import inspect
 import logging
-import sys
+import time
 from asyncio.futures import Future
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char_p, c_size_t, c_uint8, c_uint16, c_uint32, c_void_p, cast, py_object
 from dataclasses import dataclass
-from typing import List, Optional, Type, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 from ..interaction_model import InteractionModelError, PyInvokeRequestData
 from ..interaction_model import Status as InteractionModelStatus
 from ..interaction_model import TestOnlyPyBatchCommandsOverrides, TestOnlyPyOnDoneInfo
 from ..native import GetLibraryHandle, NativeLibraryHandleMethodArguments, PyChipError
+from ..tracing.latency import InteractionSpan, Phase
 from . import Objects as GeneratedObjects  # noqa: F401
-from .ClusterObjects import ClusterCommand
+from . import definitions as GeneratedDefinitions
+from .ClusterObjects import ALL_ACCEPTED_COMMANDS, ALL_GENERATED_COMMANDS, ClusterCommand
 
 logger = logging.getLogger('chip.cluster.Command')
 logger.setLevel(logging.ERROR)
@@ -70,27 +72,24 @@ def FindCommandClusterObject(isClientSideCommand: bool, path: CommandPath):
 
         Returns the type of the cluster object if one is found. Otherwise, returns None.
     '''
-    for clusterName, obj in inspect.getmembers(sys.modules['chip.clusters.Objects']):
-        if ('chip.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Commands') in str(subclass)):
-                    for commandName, command in inspect.getmembers(subclass):
-                        if inspect.isclass(command):
-                            for name, field in inspect.getmembers(command):
-                                if ('__dataclass_fields__' in name):
-                                    if (field['cluster_id'].default == path.ClusterId) and (field['command_id'].default ==
-                                                                                            path.CommandId) and (field['is_client'].default == isClientSideCommand):
-                                        return eval('GeneratedObjects.' + clusterName + '.Commands.' + commandName)
-    return None
+    registry = ALL_ACCEPTED_COMMANDS if isClientSideCommand else ALL_GENERATED_COMMANDS
+    command = registry.get(path.ClusterId, {}).get(path.CommandId)
+    if command is None or not command.__module__.startswith(GeneratedDefinitions.__name__ + '.'):
+        return None
+    return command
 
 
 class AsyncCommandTransaction:
-    def __init__(self, future: Future, eventLoop, expectType: Type):
+    def __init__(self, future: Future, eventLoop, expectType: Type, span: Optional[InteractionSpan] = None):
         self._event_loop = eventLoop
         self._future = future
         self._expect_type = expectType
+        self._span = span
+        self._handOffTime = 0.0
 
     def _handleResponse(self, path: CommandPath, status: Status, response: bytes):
+        if self._span is not None:
+            self._span.Add('loopHop', time.perf_counter() - self._handOffTime)
         if (len(response) == 0):
             self._future.set_result(None)
         else:
@@ -100,8 +99,9 @@ class AsyncCommandTransaction:
 
             if self._expect_type:
                 try:
-                    self._future.set_result(
-                        self._expect_type.FromTLV(response))
+                    with Phase(self._span, 'decode'):
+                        result = self._expect_type.FromTLV(response)
+                    self._future.set_result(result)
                 except Exception as ex:
                     self._handleError(
                         status, 0, ex)
@@ -113,6 +113,7 @@ class AsyncCommandTransaction:
         # checking `index`. We just share a callback API with batch commands. If we ever get a
         # second call to `handleResponse` we will see a different error on trying to set future
         # that has already been set.
+        self._handOffTime = time.perf_counter()
         self._event_loop.call_soon_threadsafe(
             self._handleResponse, path, status, response)
 
@@ -293,7 +294,8 @@ def TestOnlySendCommandTimedRequestFlagWithNoTimedInvoke(future: Future, eventLo
 
 async def SendCommand(future: Future, eventLoop, responseType: Type, device, commandPath: CommandPath, payload: ClusterCommand,
                       timedRequestTimeoutMs: Union[None, int] = None, interactionTimeoutMs: Union[None, int] = None,
-                      busyWaitMs: Union[None, int] = None, suppressResponse: Union[None, bool] = None, allowLargePayload: Union[None, bool] = None) -> PyChipError:
+                      busyWaitMs: Union[None, int] = None, suppressResponse: Union[None, bool] = None, allowLargePayload: Union[None, bool] = None,
+                      span: Optional[InteractionSpan] = None) -> PyChipError:
     ''' Send a cluster-object encapsulated command to a device and does the following:
             - On receipt of a successful data response, returns the cluster-object equivalent through the provided future.
             - None (on a successful response containing no data)
@@ -312,9 +314,10 @@ async def SendCommand(future: Future, eventLoop, responseType: Type, device, com
         raise InteractionModelError(InteractionModelStatus.NeedsTimedInteraction)
 
     handle = GetLibraryHandle()
-    transaction = AsyncCommandTransaction(future, eventLoop, responseType)
+    transaction = AsyncCommandTransaction(future, eventLoop, responseType, span)
 
-    payloadTLV = payload.ToTLV()
+    with Phase(span, 'encode'):
+        payloadTLV = payload.ToTLV()
     ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
     return await builtins.chipStack.CallAsyncWithResult(
         lambda: handle.pychip_CommandSender_SendCommand(
@@ -443,6 +446,166 @@ def TestOnlySendBatchCommands(future: Future, eventLoop, device, commands: List[
     )
 
 
+@dataclass
+class InvokeTarget:
+    ''' Where InvokeCoalescer sends the commands for a node: the device proxy, and the limits of its session.
+    '''
+    deviceProxy: Any
+    maxPathsPerInvoke: int = 1
+    allowLargePayload: bool = False
+
+
+@dataclass
+class _PendingInvoke:
+    endpointId: int
+    payload: ClusterCommand
+    responseType: Optional[Type]
+    future: Future
+    size: int
+
+
+class InvokeCoalescer:
+    ''' Gathers the commands sent to the same node within a short window into batched invokes.
+
+        The commands sent with SendCommand are held for windowSeconds, and then sent in as few InvokeRequests as the
+        node allows: up to its MaxPathsPerInvoke commands each, without repeating a command path (the node would
+        reject the request), and over MRP, within the size of a single message. Commands are only gathered with
+        commands using the same timed request and interaction timeouts and payload capability. The batches are sent
+        concurrently, and their responses are handed back to each caller as if the command had been sent on its own.
+
+        A node reporting a MaxPathsPerInvoke of 1 (e.g. nodes predating batched commands) gets the commands one per
+        InvokeRequest, as without coalescing.
+
+        connect is called with (nodeid, interactionTimeoutMs, payloadCapability) when a batch is due, and returns the
+        InvokeTarget of the node.
+    '''
+
+    # Budget for the fields of the commands of a batch sent over MRP, leaving room in the 1280 bytes IPv6 MTU for
+    # the message, exchange and InvokeRequestMessage headers, and the security overhead.
+    _MRP_BATCH_BYTES = 900
+    # Size of the CommandDataIB wrapping the fields of each command: path, CommandRef and containers.
+    _COMMAND_OVERHEAD_BYTES = 24
+
+    def __init__(self, connect: Callable[[int, Optional[int], int], Awaitable[InvokeTarget]], windowSeconds: float = 0.005):
+        self._connect = connect
+        self._windowSeconds = windowSeconds
+        self._pending: Dict[Tuple, List[_PendingInvoke]] = {}
+        # MaxPathsPerInvoke of the nodes last sent to, so that a full batch is sent without waiting for the window.
+        self._maxPathsPerInvoke: Dict[Tuple, int] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def SendCommand(self, nodeid: int, endpoint: int, payload: ClusterCommand, responseType: Optional[Type] = None,
+                          timedRequestTimeoutMs: Optional[int] = None, interactionTimeoutMs: Optional[int] = None,
+                          payloadCapability: int = 0):
+        ''' Sends a command as part of the next batch to the node, and returns its response. Errors specific to
+            the command and errors of the whole batch are both raised.
+        '''
+        if (responseType is not None) and (not issubclass(responseType, ClusterCommand)):
+            raise ValueError("responseType must be a ClusterCommand or None")
+        # Checked here rather than for the whole batch, so that the other commands are still sent.
+        if payload.must_use_timed_invoke and timedRequestTimeoutMs is None or timedRequestTimeoutMs == 0:
+            raise InteractionModelError(InteractionModelStatus.NeedsTimedInteraction)
+
+        eventLoop = asyncio.get_running_loop()
+        key = (nodeid, timedRequestTimeoutMs, interactionTimeoutMs, payloadCapability)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = []
+            eventLoop.call_later(self._windowSeconds, self._Flush, key, pending)
+
+        entry = _PendingInvoke(endpoint, payload, responseType, eventLoop.create_future(),
+                               len(payload.ToTLV()) + self._COMMAND_OVERHEAD_BYTES)
+        pending.append(entry)
+        if len(pending) >= self._maxPathsPerInvoke.get(key, len(pending) + 1):
+            self._Flush(key, pending)
+        return await entry.future
+
+    def _Flush(self, key: Tuple, pending: List[_PendingInvoke]):
+        # The window timer of a batch already sent because it was full finds a newer batch, or none.
+        if self._pending.get(key) is not pending:
+            return
+        del self._pending[key]
+        task = asyncio.ensure_future(self._Send(key, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _Send(self, key: Tuple, entries: List[_PendingInvoke]):
+        nodeid, timedRequestTimeoutMs, interactionTimeoutMs, payloadCapability = key
+        try:
+            target = await self._connect(nodeid, interactionTimeoutMs, payloadCapability)
+        except Exception as ex:
+            self._Fail(entries, ex)
+            return
+
+        maxPathsPerInvoke = max(1, target.maxPathsPerInvoke)
+        self._maxPathsPerInvoke[key] = maxPathsPerInvoke
+        maxBytes = None if target.allowLargePayload else self._MRP_BATCH_BYTES
+        await asyncio.gather(*(self._SendBatch(target, timedRequestTimeoutMs, interactionTimeoutMs, batch)
+                               for batch in self._Split(entries, maxPathsPerInvoke, maxBytes)))
+
+    @staticmethod
+    def _Split(entries: List[_PendingInvoke], maxPathsPerInvoke: int, maxBytes: Optional[int]) -> List[List[_PendingInvoke]]:
+        batches: List[List[_PendingInvoke]] = []
+        batch: List[_PendingInvoke] = []
+        paths: Set[Tuple[int, int, int]] = set()
+        size = 0
+        for entry in entries:
+            path = (entry.endpointId, entry.payload.cluster_id, entry.payload.command_id)
+            if batch and (len(batch) == maxPathsPerInvoke or path in paths or
+                          (maxBytes is not None and size + entry.size > maxBytes)):
+                batches.append(batch)
+                batch = []
+                paths = set()
+                size = 0
+            batch.append(entry)
+            paths.add(path)
+            size += entry.size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _SendBatch(self, target: InvokeTarget, timedRequestTimeoutMs: Optional[int], interactionTimeoutMs: Optional[int],
+                         batch: List[_PendingInvoke]):
+        eventLoop = asyncio.get_running_loop()
+        future = eventLoop.create_future()
+        try:
+            if len(batch) == 1:
+                entry = batch[0]
+                res = await SendCommand(
+                    future, eventLoop, entry.responseType, target.deviceProxy,
+                    CommandPath(EndpointId=entry.endpointId, ClusterId=entry.payload.cluster_id,
+                                CommandId=entry.payload.command_id), entry.payload,
+                    timedRequestTimeoutMs=timedRequestTimeoutMs, interactionTimeoutMs=interactionTimeoutMs,
+                    allowLargePayload=target.allowLargePayload)
+                res.raise_on_error()
+                responses = [await future]
+            else:
+                res = await SendBatchCommands(
+                    future, eventLoop, target.deviceProxy,
+                    [InvokeRequestInfo(EndpointId=entry.endpointId, Command=entry.payload, ResponseType=entry.responseType)
+                     for entry in batch],
+                    timedRequestTimeoutMs=timedRequestTimeoutMs, interactionTimeoutMs=interactionTimeoutMs)
+                res.raise_on_error()
+                responses = await future
+        except Exception as ex:
+            self._Fail(batch, ex)
+            return
+
+        for entry, response in zip(batch, responses):
+            if entry.future.done():
+                continue
+            if isinstance(response, InteractionModelError):
+                entry.future.set_exception(response)
+            else:
+                entry.future.set_result(response)
+
+    @staticmethod
+    def _Fail(entries: List[_PendingInvoke], exception: Exception):
+        for entry in entries:
+            if not entry.future.done():
+                entry.future.set_exception(exception)
+
+
 def SendGroupCommand(groupId: int, devCtrl: c_void_p, payload: ClusterCommand, busyWaitMs: Union[None, int] = None) -> PyChipError:
     ''' Send a cluster-object encapsulated group command to a device and does the following:
             - None (on a successful response containing no data)
@@ -16,4 +16,16 @@
 #
 
 from . import Attribute, CHIPClusters, Command, Objects  # noqa: F401
-from .Objects import *  # noqa: F401, F403
+
+__all__ = ["Attribute", "CHIPClusters", "Command", "Objects"] + Objects.__all__
+
+
+def __getattr__(name: str):
+    # The generated cluster objects are only imported on first access, see chip.clusters.Objects.
+    if name in Objects.__all__:
+        return getattr(Objects, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(Objects.__all__))
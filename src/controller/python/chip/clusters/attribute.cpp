@@ -31,6 +31,7 @@
 #include <controller/python/chip/native/PyChipError.h>
 #include <lib/core/Optional.h>
 #include <lib/support/CodeUtils.h>
+#include <lib/support/IntrusiveList.h>
 #include <lib/support/logging/CHIPLogging.h>
 #include <system/SystemClock.h>
 
@@ -96,7 +97,7 @@ void PythonResubscribePolicy(uint32_t aNumCumulativeRetries, uint32_t & aNextSub
     aShouldResubscribe = true;
 }
 
-class ReadClientCallback : public ReadClient::Callback
+class ReadClientCallback : public ReadClient::Callback, public IntrusiveListNodeBase<IntrusiveMode::AutoUnlink>
 {
 public:
     ReadClientCallback(PyObject * appContext) : mBufferedReadCallback(*this), mAppContext(appContext) {}
@@ -237,6 +238,18 @@ public:
 
     void AdoptReadClient(std::unique_ptr<ReadClient> apReadClient) { mReadClient = std::move(apReadClient); }
 
+    PyObject * GetAppContext() { return mAppContext; }
+
+    /**
+     * Destroys the ReadClient before it is done, which aborts its exchange and stops any subscription or resubscription.
+     * The ReadClient does not call OnDone once destroyed, so it is called here instead: this object is deleted.
+     */
+    void Abort()
+    {
+        mReadClient.reset();
+        OnDone(nullptr);
+    }
+
     void SetAutoResubscribe(bool autoResubscribe) { mAutoResubscribe = autoResubscribe; }
 
 private:
@@ -249,6 +262,9 @@ private:
     bool mAutoResubscribeNeeded = false;
 };
 
+// The callbacks of the ReadClients that are not done yet, see pychip_ReadClient_Abort. Only accessed on the CHIP thread.
+IntrusiveList<ReadClientCallback, IntrusiveMode::AutoUnlink> gReadClientCallbacks;
+
 extern "C" {
 
 struct __attribute__((packed)) PyReadAttributeParams
@@ -475,6 +491,22 @@ void pychip_ReadClient_ShutdownSubscription(ReadClient * apReadClient)
     InteractionModelEngine::GetInstance()->ShutdownSubscription(ScopedNodeId(nodeId, fabricIndex), subscriptionId.Value());
 }
 
+void pychip_ReadClient_Abort(PyObject * appContext)
+{
+    // The read is looked up by its Python transaction rather than by its ReadClient: once done, the ReadClient is
+    // freed before the transaction learns about it, and its address may already be reused by another ReadClient.
+    // A callback leaves the list as soon as it is done, so nothing is found (and nothing is done) for a transaction
+    // that is already done.
+    for (auto & callback : gReadClientCallbacks)
+    {
+        if (callback.GetAppContext() == appContext)
+        {
+            callback.Abort();
+            return;
+        }
+    }
+}
+
 void pychip_ReadClient_OverrideLivenessTimeout(ReadClient * pReadClient, uint32_t livenessTimeoutMs)
 {
     VerifyOrDie(pReadClient != nullptr);
@@ -627,6 +659,7 @@ PyChipError pychip_ReadClient_Read(void * appContext, ReadClient ** pReadClient,
     *pReadClient = readClient.get();
 
     callback->AdoptReadClient(std::move(readClient));
+    gReadClientCallbacks.PushBack(callback.get());
 
     callback.release();
 
@@ -0,0 +1,231 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Commissioning of many devices in parallel.
+
+A device controller commissions one device at a time: its commissioner, pairing delegate and commissioning
+callbacks are shared by every commissioning it runs. CommissioningPipeline commissions a queue of devices over a
+pool of controllers instead, e.g. created with FabricAdmin.NewController on the same fabric, running one
+commissioning per controller at a time:
+
+    controllers = [fabricAdmin.NewController() for _ in range(4)]
+    pipeline = CommissioningPipeline(controllers, timeout_seconds=120)
+    report = await pipeline.run([CommissioningJob(code, node_id) for node_id, code in enumerate(codes, start=100)])
+    for result in report.failed:
+        print(result.job.node_id, result.failed_stage, result.error)
+
+The commissioning parameters set through a controller (Wi-Fi or Thread credentials, time zone, ...) are global to
+the process: they apply to every controller, and should be set before running the pipeline.
+'''
+
+import asyncio
+import dataclasses
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from .. import ChipDeviceCtrl, discovery
+from ..tracing.latency import LatencyHistogram
+
+LOGGER = logging.getLogger(__name__)
+
+# Waiting for a controller to be available.
+STAGE_QUEUED = 'queued'
+# Discovering the device and establishing the PASE session.
+STAGE_PASE = 'pase'
+# From the PASE session to the end of the commissioning (attestation, credentials, network, CASE).
+STAGE_COMMISSIONING = 'commissioning'
+# From the job being queued to its end.
+STAGE_TOTAL = 'total'
+
+
+@dataclasses.dataclass
+class CommissioningJob:
+    setup_payload: str
+    node_id: int
+    discovery_type: discovery.DiscoveryType = discovery.DiscoveryType.DISCOVERY_ALL
+
+
+@dataclasses.dataclass
+class CommissioningResult:
+    job: CommissioningJob
+    # The effective node id of the commissioned device.
+    node_id: Optional[int] = None
+    error: Optional[BaseException] = None
+    # The stage which was in progress when the last attempt failed.
+    failed_stage: Optional[str] = None
+    # The duration of every stage, in seconds, for the last attempt (queued and total cover all the attempts).
+    stages: Dict[str, float] = dataclasses.field(default_factory=dict)
+    attempts: int = 0
+    controller_name: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclasses.dataclass
+class CommissioningReport:
+    results: List[CommissioningResult]
+    elapsed_seconds: float
+
+    @property
+    def succeeded(self) -> List[CommissioningResult]:
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> List[CommissioningResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    def stage_statistics(self) -> Dict[str, Dict[str, float]]:
+        ''' Returns the count, mean and percentiles of the duration of every stage, over all the jobs.
+        '''
+        histograms: Dict[str, LatencyHistogram] = {}
+        for result in self.results:
+            for stage, seconds in result.stages.items():
+                histograms.setdefault(stage, LatencyHistogram()).Record(seconds)
+        return {stage: histogram.ToDict() for stage, histogram in histograms.items()}
+
+
+class _ControllerPool:
+    ''' The controllers not commissioning, handed out in turn. Once every controller is retired, getting one
+        returns None.
+    '''
+
+    def __init__(self, controllers: List[ChipDeviceCtrl.ChipDeviceControllerBase]):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        for controller in controllers:
+            self._queue.put_nowait(controller)
+        self._live = len(controllers)
+
+    async def get(self) -> Optional[ChipDeviceCtrl.ChipDeviceControllerBase]:
+        controller = await self._queue.get()
+        if controller is None:
+            # Wake up the next waiting job as well.
+            self._queue.put_nowait(None)
+        return controller
+
+    def put(self, controller: ChipDeviceCtrl.ChipDeviceControllerBase):
+        self._queue.put_nowait(controller)
+
+    def retire(self):
+        self._live -= 1
+        if self._live == 0:
+            self._queue.put_nowait(None)
+
+
+class CommissioningPipeline:
+    def __init__(self, controllers: Sequence[ChipDeviceCtrl.ChipDeviceControllerBase], concurrency: Optional[int] = None,
+                 timeout_seconds: Optional[float] = None, retries: int = 0):
+        ''' Commissions devices over the given controllers, with at most concurrency (by default, one per controller)
+            commissionings in progress.
+
+            A commissioning taking more than timeout_seconds is stopped and fails. As its controller may still get
+            callbacks from the commissioning, it is not used for the following jobs. A failed job is attempted again
+            up to retries times, on the next available controller.
+        '''
+        if not controllers:
+            raise ValueError("At least one controller is needed")
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._controllers = list(controllers)[:concurrency]
+        self._timeout_seconds = timeout_seconds
+        self._retries = retries
+
+    async def run(self, jobs: Iterable[CommissioningJob],
+                  on_result: Optional[Callable[[CommissioningResult], None]] = None) -> CommissioningReport:
+        ''' Commissions every job, and returns the results in the order of the jobs. on_result is called with the
+            result of every job as soon as it is done.
+        '''
+        start = time.monotonic()
+        pool = _ControllerPool(self._controllers)
+
+        async def run_job(job: CommissioningJob) -> CommissioningResult:
+            result = await self._commission(pool, job)
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        results = await asyncio.gather(*(run_job(job) for job in jobs))
+        return CommissioningReport(results=list(results), elapsed_seconds=time.monotonic() - start)
+
+    async def _commission(self, pool: _ControllerPool, job: CommissioningJob) -> CommissioningResult:
+        result = CommissioningResult(job=job)
+        queued = 0.0
+        start = time.monotonic()
+        while True:
+            wait_start = time.monotonic()
+            controller = await pool.get()
+            queued += time.monotonic() - wait_start
+            if controller is None:
+                result.error = RuntimeError("No controller left to commission with")
+                result.failed_stage = STAGE_QUEUED
+                break
+
+            result.attempts += 1
+            result.controller_name = controller.name
+            attempt_start = time.monotonic()
+            timed_out = False
+            try:
+                result.node_id = await asyncio.wait_for(
+                    controller.CommissionWithCode(job.setup_payload, job.node_id, job.discovery_type), self._timeout_seconds)
+                result.error = None
+                result.failed_stage = None
+            except asyncio.TimeoutError as ex:
+                result.error = ex
+                timed_out = True
+            except Exception as ex:
+                result.error = ex
+            result.stages = self._stages(controller, attempt_start)
+
+            if result.error is not None:
+                result.failed_stage = STAGE_COMMISSIONING if STAGE_COMMISSIONING in result.stages else STAGE_PASE
+                LOGGER.warning("Commissioning of node 0x%016X failed (attempt %d, stage %s): %r", job.node_id,
+                               result.attempts, result.failed_stage, result.error)
+            if timed_out:
+                self._retire(pool, controller, job.node_id)
+            else:
+                pool.put(controller)
+            if result.error is None or result.attempts > self._retries:
+                break
+
+        result.stages[STAGE_QUEUED] = queued
+        result.stages[STAGE_TOTAL] = time.monotonic() - start
+        return result
+
+    @staticmethod
+    def _stages(controller: ChipDeviceCtrl.ChipDeviceControllerBase, attempt_start: float) -> Dict[str, float]:
+        end = time.monotonic()
+        times = controller.commissioningStageTimes
+        if times.get('start', 0.0) < attempt_start:
+            # The attempt failed before starting to commission.
+            times = {'start': attempt_start}
+        pase = times.get('pase')
+        if pase is None:
+            return {STAGE_PASE: end - times['start']}
+        return {STAGE_PASE: pase - times['start'], STAGE_COMMISSIONING: end - pase}
+
+    def _retire(self, pool: _ControllerPool, controller: ChipDeviceCtrl.ChipDeviceControllerBase, node_id: int):
+        LOGGER.warning("Commissioning of node 0x%016X timed out, no longer commissioning with controller '%s'",
+                       node_id, controller.name)
+        try:
+            # Stops the commissioning of the node.
+            controller.ExpireSessions(node_id)
+        except Exception as ex:
+            LOGGER.exception(ex)
+        pool.retire()
@@ -21,12 +21,15 @@ from __future__ import annotations
 import base64
 import copy
 import ctypes
-import json
 import logging
+import threading
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char, c_char_p, c_uint16, c_void_p, py_object
-from typing import IO, Dict, Optional
+from typing import Dict, Optional, Set
 
 from ..native import GetLibraryHandle
+from .backends import JsonFileStorageBackend, SqliteStorageBackend, StorageBackend, StorageKey
+
+__all__ = ["PersistentStorage", "StorageBackend", "JsonFileStorageBackend", "SqliteStorageBackend"]
 
 LOGGER = logging.getLogger(__name__)
 
@@ -91,46 +94,58 @@ class PersistentStorage:
         and can be passed into C++ logic that needs an instance of that interface.
 
         Object must be resident before the Matter stack starts up and last past its shutdown.
+
+        The configuration is stored by a StorageBackend: a JSON file when a path is given, or the backend passed
+        as backend, e.g. a SqliteStorageBackend. By default every change is committed right away. With
+        writeBehindSec, changes are instead committed together at most writeBehindSec seconds after the first one,
+        or when Flush() or Shutdown() is called, which avoids rewriting the whole configuration for every key while
+        commissioning.
     '''
 
-    def __init__(self, path: Optional[str] = None, jsonData: Optional[Dict] = None):
-        ''' Initializes the object with either a path to a JSON file that contains the configuration OR
-            a JSON dictionary that contains an in-memory representation of the configuration.
+    def __init__(self, path: Optional[str] = None, jsonData: Optional[Dict] = None,
+                 backend: Optional[StorageBackend] = None, writeBehindSec: Optional[float] = None):
+        ''' Initializes the object with either a path to a file that contains the configuration OR
+            a JSON dictionary that contains an in-memory representation of the configuration OR
+            a StorageBackend.
 
             In either case, if there are no valid configurations that already exist, empty Python
             and SDK configuration records will be created upon construction.
         '''
-        if (path is None and jsonData is None):
-            raise ValueError("Need to provide at least one of path or jsonData")
+        if (path is None and jsonData is None and backend is None):
+            raise ValueError("Need to provide at least one of path, jsonData or backend")
+
+        if sum(arg is not None for arg in (path, jsonData, backend)) > 1:
+            raise ValueError("Can't provide more than one of a valid path, jsonData and backend")
 
-        if (path is not None and jsonData is not None):
-            raise ValueError("Can't provide both a valid path and jsonData")
+        if (writeBehindSec is not None and writeBehindSec < 0):
+            raise ValueError("writeBehindSec can't be negative")
 
         if (path is not None):
             LOGGER.info(f"Initializing persistent storage from file: {path}")
+            backend = JsonFileStorageBackend(path)
+        elif (backend is not None):
+            LOGGER.info(f"Initializing persistent storage from {type(backend).__name__}")
         else:
             LOGGER.info("Initializing persistent storage from dict")
 
         self._handle = GetLibraryHandle()
         self._isActive = True
-        self._path = path
-
-        if (self._path):
+        self._backend = backend
+        self._writeBehindSec = writeBehindSec
+        # Guards the configuration and the pending changes, which the write-behind timer commits from its own thread.
+        self._lock = threading.Lock()
+        # Serializes the commits to the backend, so that they land in order, without holding the lock above while
+        # the backend writes (and syncs) the configuration, which would block the CHIP thread setting keys.
+        self._commitLock = threading.Lock()
+        self._changedKeys: Set[StorageKey] = set()
+        self._commitTimer: Optional[threading.Timer] = None
+
+        if (self._backend is not None):
             try:
-                self._file: Optional[IO[str]] = open(path, 'r')
-                self._file.seek(0, 2)
-                size = self._file.tell()
-                self._file.seek(0)
-
-                if (size != 0):
-                    LOGGER.info(f"Loading configuration from {path}...")
-                    self._jsonData = json.load(self._file)
-                else:
-                    self._jsonData = {}
-
+                self._jsonData = self._backend.Load()
             except Exception as ex:
                 LOGGER.error(ex)
-                LOGGER.critical(f"Could not load configuration from {path} - resetting configuration...")
+                LOGGER.critical(f"Could not load configuration from {type(self._backend).__name__} - resetting configuration...")
                 self._jsonData = {}
         else:
             self._jsonData = jsonData
@@ -143,9 +158,6 @@ class PersistentStorage:
             LOGGER.warn("No valid REPL configuration present - clearing out configuration")
             self._jsonData['repl-config'] = {}
 
-        # Clear out the file so that calling 'Commit' will re-open the file at that time in write mode.
-        self._file = None
-
         self._handle.pychip_Storage_InitializeStorageAdapter.restype = c_void_p
         self._handle.pychip_Storage_InitializeStorageAdapter.argtypes = [ctypes.py_object,
                                                                          _SyncSetKeyValueCbFunct,
@@ -161,25 +173,55 @@ class PersistentStorage:
         return self._closure
 
     def Commit(self):
-        ''' Commits the cached JSON configuration to file (if one was provided in the constructor).
-            Otherwise, this is a no-op.
+        ''' Commits the cached JSON configuration to the backend (if a path or backend was provided in the
+            constructor). Otherwise, this is a no-op.
+
+            In write-behind mode, this only schedules the commit, see Flush().
         '''
 
-        if (self._path is None):
+        if (self._backend is None):
             return
 
-        if (self._file is None):
+        if (self._writeBehindSec is None):
+            self.Flush()
+            return
+
+        with self._lock:
+            if (self._commitTimer is None):
+                self._commitTimer = threading.Timer(self._writeBehindSec, self._OnCommitTimer)
+                self._commitTimer.daemon = True
+                self._commitTimer.start()
+
+    def Flush(self):
+        ''' Commits the cached JSON configuration to the backend right away, including the changes still pending
+            in write-behind mode.
+        '''
+        if (self._backend is None):
+            return
+
+        with self._commitLock:
+            with self._lock:
+                if (self._commitTimer is not None):
+                    self._commitTimer.cancel()
+                    self._commitTimer = None
+                jsonData = copy.deepcopy(self._jsonData)
+                changedKeys = self._changedKeys
+                self._changedKeys = set()
+
             try:
-                self._file = open(self._path, 'w')
+                self._backend.Commit(jsonData, changedKeys)
             except Exception as ex:
-                LOGGER.error(
-                    f"Could not open {self._path} for writing configuration. Error: {ex}")
+                # The changes stay pending, so that the next commit retries them.
+                LOGGER.error(f"Could not commit configuration to {type(self._backend).__name__}. Error: {ex}")
+                with self._lock:
+                    self._changedKeys |= changedKeys
+
+    def _OnCommitTimer(self):
+        with self._lock:
+            if (self._commitTimer is None):
+                # Flushed in the meantime.
                 return
-
-        self._file.seek(0)
-        json.dump(self._jsonData, self._file, ensure_ascii=True, indent=4)
-        self._file.truncate()
-        self._file.flush()
+        self.Flush()
 
     def SetReplKey(self, key: str, value):
         ''' Set a REPL key to a specific value. Creates the key if one doesn't exist already.
@@ -189,10 +231,12 @@ class PersistentStorage:
         if (key is None or key == ''):
             raise ValueError("Invalid Key")
 
-        if (value is None):
-            del (self._jsonData['repl-config'][key])
-        else:
-            self._jsonData['repl-config'][key] = value
+        with self._lock:
+            if (value is None):
+                del (self._jsonData['repl-config'][key])
+            else:
+                self._jsonData['repl-config'][key] = value
+            self._changedKeys.add(('repl-config', key))
 
         self.Commit()
 
@@ -215,9 +259,11 @@ class PersistentStorage:
 
         if (value is None):
             raise ValueError('value is not expected to be None')
-        else:
-            self._jsonData['sdk-config'][key] = base64.b64encode(
-                value).decode("utf-8")
+
+        encodedValue = base64.b64encode(value).decode("utf-8")
+        with self._lock:
+            self._jsonData['sdk-config'][key] = encodedValue
+            self._changedKeys.add(('sdk-config', key))
 
         self.Commit()
 
@@ -234,7 +280,9 @@ class PersistentStorage:
         '''
         LOGGER.debug(f"DeleteSdkKey: {key}")
 
-        del (self._jsonData['sdk-config'][key])
+        with self._lock:
+            del (self._jsonData['sdk-config'][key])
+            self._changedKeys.add(('sdk-config', key))
         self.Commit()
 
     def Shutdown(self):
@@ -245,6 +293,11 @@ class PersistentStorage:
             after calling pychip_DeviceController_StackShutdown()).
         '''
         if (self._isActive):
+            if (self._backend is not None):
+                if (self._commitTimer is not None or self._changedKeys):
+                    self.Flush()
+                self._backend.Close()
+
             self._handle.pychip_Storage_ShutdownAdapter.argtypes = [c_void_p]
 
             #
@@ -259,7 +312,8 @@ class PersistentStorage:
     def jsonData(self) -> Dict:
         ''' Returns a copy of the internal cached JSON data.
         '''
-        return copy.deepcopy(self._jsonData)
+        with self._lock:
+            return copy.deepcopy(self._jsonData)
 
     def __del__(self):
         self.Shutdown()
@@ -0,0 +1,153 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, Set, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# A (section, key) pair, where section is either 'sdk-config' or 'repl-config'.
+StorageKey = Tuple[str, str]
+
+
+class StorageBackend:
+    ''' Stores the configuration of a PersistentStorage.
+
+        The configuration is a dictionary with one dictionary of key/value pairs per section ('sdk-config' and
+        'repl-config'). Values are JSON serializable (SDK values are base64 encoded by PersistentStorage).
+    '''
+
+    def Load(self) -> Dict:
+        ''' Returns the stored configuration, or an empty dictionary if there is none.
+        '''
+        raise NotImplementedError()
+
+    def Commit(self, jsonData: Dict, changedKeys: Set[StorageKey]):
+        ''' Stores the configuration. changedKeys holds the keys set or deleted since the previous commit, a
+            backend may store only those.
+        '''
+        raise NotImplementedError()
+
+    def Close(self):
+        pass
+
+
+class JsonFileStorageBackend(StorageBackend):
+    ''' Stores the configuration in a JSON file.
+
+        Each commit writes a complete snapshot to a temporary file in the same directory and atomically renames it
+        over the configuration file, so that a crash during a commit leaves either the previous or the new
+        configuration, never a truncated file.
+    '''
+
+    def __init__(self, path: str, fsync: bool = True):
+        self._path = path
+        self._fsync = fsync
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def Load(self) -> Dict:
+        try:
+            with open(self._path, 'r') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return {}
+                LOGGER.info(f"Loading configuration from {self._path}...")
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def Commit(self, jsonData: Dict, changedKeys: Set[StorageKey]):
+        directory, name = os.path.split(os.path.abspath(self._path))
+        fd, tempPath = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump(jsonData, file, ensure_ascii=True, indent=4)
+                file.flush()
+                if self._fsync:
+                    os.fsync(file.fileno())
+            # Keep the permissions of the file being replaced, mkstemp creates it readable by the owner only.
+            try:
+                os.chmod(tempPath, os.stat(self._path).st_mode)
+            except FileNotFoundError:
+                pass
+            os.replace(tempPath, self._path)
+        except BaseException:
+            os.unlink(tempPath)
+            raise
+
+
+class SqliteStorageBackend(StorageBackend):
+    ''' Stores the configuration in an SQLite database, with one row per key.
+
+        A commit only writes the keys changed since the previous commit, in a single transaction, so its cost does
+        not grow with the number of stored keys.
+    '''
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        # Commits may come from the write-behind timer thread, access is serialized by the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS config (section TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, '
+            'PRIMARY KEY (section, key)) WITHOUT ROWID')
+        self._connection.commit()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def Load(self) -> Dict:
+        jsonData: Dict = {}
+        with self._lock:
+            for section, key, value in self._connection.execute('SELECT section, key, value FROM config'):
+                jsonData.setdefault(section, {})[key] = json.loads(value)
+        return jsonData
+
+    def Commit(self, jsonData: Dict, changedKeys: Set[StorageKey]):
+        updates = []
+        deletes = []
+        for section, key in changedKeys:
+            values = jsonData.get(section, {})
+            if key in values:
+                updates.append((section, key, json.dumps(values[key], ensure_ascii=True)))
+            else:
+                deletes.append((section, key))
+
+        with self._lock, self._connection:
+            self._connection.executemany('DELETE FROM config WHERE section = ? AND key = ?', deletes)
+            self._connection.executemany('INSERT OR REPLACE INTO config (section, key, value) VALUES (?, ?, ?)', updates)
+
+    def Compact(self):
+        ''' Folds the write-ahead log back into the database and reclaims the space of deleted keys.
+        '''
+        with self._lock:
+            self._connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self._connection.execute('VACUUM')
+
+    def Close(self):
+        with self._lock:
+            self._connection.close()
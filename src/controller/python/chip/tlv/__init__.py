@@ -242,69 +242,60 @@ class TLVWriter(object):
     def putSignedInt(self, tag, val):
         """Write a value as a TLV signed integer with the specified TLV tag."""
         if val >= INT8_MIN and val <= INT8_MAX:
-            format = "<b"
+            packer = _INT8
         elif val >= INT16_MIN and val <= INT16_MAX:
-            format = "<h"
+            packer = _INT16
         elif val >= INT32_MIN and val <= INT32_MAX:
-            format = "<l"
+            packer = _INT32
         elif val >= INT64_MIN and val <= INT64_MAX:
-            format = "<q"
+            packer = _INT64
         else:
             raise ValueError("Integer value out of range")
-        val = struct.pack(format, val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_SIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
+        self._encoding += self._encodeControlAndTag(
+            TLV_TYPE_SIGNED_INTEGER, tag, lenOfLenOrVal=packer.size
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._encoding += packer.pack(val)
 
     def putUnsignedInt(self, tag, val):
         """Write a value as a TLV unsigned integer with the specified TLV tag."""
         val = self._encodeUnsignedInt(val)
-        controlAndTag = self._encodeControlAndTag(
+        self._encoding += self._encodeControlAndTag(
             TLV_TYPE_UNSIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._encoding += val
 
     def putFloat(self, tag, val):
         """Write a value as a TLV float with the specified TLV tag."""
-        val = struct.pack("f", val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
+        self._encoding += self._encodeControlAndTag(
+            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=_FLOAT.size
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._encoding += _FLOAT.pack(val)
 
     def putDouble(self, tag, val):
         """Write a value as a TLV double with the specified TLV tag."""
-        val = struct.pack("d", val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
+        self._encoding += self._encodeControlAndTag(
+            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=_DOUBLE.size
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._encoding += _DOUBLE.pack(val)
 
     def putString(self, tag, val):
         """Write a value as a TLV string with the specified TLV tag."""
         val = val.encode("utf-8")
         valLen = self._encodeUnsignedInt(len(val))
-        controlAndTag = self._encodeControlAndTag(
+        self._encoding += self._encodeControlAndTag(
             TLV_TYPE_UTF8_STRING, tag, lenOfLenOrVal=len(valLen)
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(valLen)
-        self._encoding.extend(val)
+        self._encoding += valLen
+        self._encoding += val
 
     def putBytes(self, tag, val):
         """Write a value as a TLV byte string with the specified TLV tag."""
         valLen = self._encodeUnsignedInt(len(val))
-        controlAndTag = self._encodeControlAndTag(
+        self._encoding += self._encodeControlAndTag(
             TLV_TYPE_BYTE_STRING, tag, lenOfLenOrVal=len(valLen)
         )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(valLen)
-        self._encoding.extend(val)
+        self._encoding += valLen
+        self._encoding += val
 
     def putBool(self, tag, val):
         """Write a value as a TLV boolean with the specified TLV tag."""
@@ -312,13 +303,11 @@ class TLVWriter(object):
             type = TLVBoolean_True
         else:
             type = TLVBoolean_False
-        controlAndTag = self._encodeControlAndTag(type, tag)
-        self._encoding.extend(controlAndTag)
+        self._encoding += self._encodeControlAndTag(type, tag)
 
     def putNull(self, tag):
         """Write a TLV null with the specified TLV tag."""
-        controlAndTag = self._encodeControlAndTag(TLV_TYPE_NULL, tag)
-        self._encoding.extend(controlAndTag)
+        self._encoding += self._encodeControlAndTag(TLV_TYPE_NULL, tag)
 
     def startContainer(self, tag, containerType):
         """Start writing a TLV container with the specified TLV tag.
@@ -327,9 +316,8 @@ class TLVWriter(object):
         TLV_TYPE_PATH.
         """
         self._verifyValidContainerType(containerType)
-        controlAndTag = self._encodeControlAndTag(containerType, tag)
-        self._encoding.extend(controlAndTag)
-        self._containerStack.insert(0, containerType)
+        self._encoding += self._encodeControlAndTag(containerType, tag)
+        self._containerStack.append(containerType)
 
     def startStructure(self, tag):
         """Start writing a TLV structure with the specified TLV tag."""
@@ -345,9 +333,8 @@ class TLVWriter(object):
 
     def endContainer(self):
         """End writing the current TLV container."""
-        self._containerStack.pop(0)
-        controlAndTag = self._encodeControlAndTag(TLVEndOfContainer, None)
-        self._encoding.extend(controlAndTag)
+        self._containerStack.pop()
+        self._encoding += self._encodeControlAndTag(TLVEndOfContainer, None)
 
     def _encodeControlAndTag(self, type, tag, lenOfLenOrVal=0):
         controlByte = type
@@ -360,27 +347,27 @@ class TLVWriter(object):
         if tag is None:
             if (
                 type != TLVEndOfContainer
-                and len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_STRUCTURE
+                and self._containerStack
+                and self._containerStack[-1] == TLV_TYPE_STRUCTURE
             ):
                 raise ValueError(
                     "Attempt to encode anonymous tag within TLV structure")
             controlByte |= TLV_TAG_CONTROL_ANONYMOUS
-            return struct.pack("<B", controlByte)
+            return _ANONYMOUS_TAGS[controlByte]
         if isinstance(tag, int):
             if tag < 0 or tag > UINT8_MAX:
                 raise ValueError(
                     "Context-specific TLV tag number out of range")
-            if len(self._containerStack) == 0:
+            if not self._containerStack:
                 raise ValueError(
                     "Attempt to encode context-specific TLV tag at top level"
                 )
-            if self._containerStack[0] == TLV_TYPE_ARRAY:
+            if self._containerStack[-1] == TLV_TYPE_ARRAY:
                 raise ValueError(
                     "Attempt to encode context-specific tag within TLV array"
                 )
             controlByte |= TLV_TAG_CONTROL_CONTEXT_SPECIFIC
-            return struct.pack("<BB", controlByte, tag)
+            return _CONTEXT_TAG.pack(controlByte, tag)
         if isinstance(tag, tuple):
             (profile, tagNum) = tag
             if not isinstance(tagNum, int):
@@ -393,8 +380,8 @@ class TLVWriter(object):
                 if profile < 0 or profile > UINT32_MAX:
                     raise ValueError("TLV profile id value out of range")
             if (
-                len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_ARRAY
+                self._containerStack
+                and self._containerStack[-1] == TLV_TYPE_ARRAY
             ):
                 raise ValueError(
                     "Attempt to encode profile-specific tag within TLV array"
@@ -429,16 +416,15 @@ class TLVWriter(object):
         if val < 0:
             raise ValueError("Integer value out of range")
         if val <= UINT8_MAX:
-            format = "<B"
+            return _UINT8.pack(val)
         elif val <= UINT16_MAX:
-            format = "<H"
+            return _UINT16.pack(val)
         elif val <= UINT32_MAX:
-            format = "<L"
+            return _UINT32.pack(val)
         elif val <= UINT64_MAX:
-            format = "<Q"
+            return _UINT64.pack(val)
         else:
             raise ValueError("Integer value out of range")
-        return struct.pack(format, val)
 
     @staticmethod
     def _verifyValidContainerType(containerType):
@@ -450,11 +436,197 @@ class TLVWriter(object):
             raise ValueError("Invalid TLV container type")
 
 
+_UINT8 = struct.Struct("<B")
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<L")
+_UINT64 = struct.Struct("<Q")
+_INT8 = struct.Struct("<b")
+_INT16 = struct.Struct("<h")
+_INT32 = struct.Struct("<l")
+_INT64 = struct.Struct("<q")
+_FLOAT = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+_FULLY_QUALIFIED_6Bytes = struct.Struct("<HHH")
+_FULLY_QUALIFIED_8Bytes = struct.Struct("<HHL")
+_CONTEXT_TAG = struct.Struct("<BB")
+# Control bytes of anonymous elements, indexed by the control byte itself.
+_ANONYMOUS_TAGS = tuple(bytes((controlByte,)) for controlByte in range(256))
+
+
+def _tagAnonymous(buf, pos):
+    return None, pos
+
+
+def _tagContext(buf, pos):
+    return buf[pos], pos + 1
+
+
+def _tagCommonProfile2Bytes(buf, pos):
+    return (0, _UINT16.unpack_from(buf, pos)[0]), pos + 2
+
+
+def _tagCommonProfile4Bytes(buf, pos):
+    return (0, _UINT32.unpack_from(buf, pos)[0]), pos + 4
+
+
+def _tagImplicitProfile2Bytes(buf, pos):
+    return (None, _UINT16.unpack_from(buf, pos)[0]), pos + 2
+
+
+def _tagImplicitProfile4Bytes(buf, pos):
+    return (None, _UINT32.unpack_from(buf, pos)[0]), pos + 4
+
+
+def _tagFullyQualified6Bytes(buf, pos):
+    (vendorId, profileNum, tag) = _FULLY_QUALIFIED_6Bytes.unpack_from(buf, pos)
+    return ((vendorId << 16) | profileNum, tag), pos + 6
+
+
+def _tagFullyQualified8Bytes(buf, pos):
+    (vendorId, profileNum, tag) = _FULLY_QUALIFIED_8Bytes.unpack_from(buf, pos)
+    return ((vendorId << 16) | profileNum, tag), pos + 8
+
+
+# Indexed by the tag control field of the control byte (controlByte >> 5).
+_TagDecoders = (
+    _tagAnonymous,
+    _tagContext,
+    _tagCommonProfile2Bytes,
+    _tagCommonProfile4Bytes,
+    _tagImplicitProfile2Bytes,
+    _tagImplicitProfile4Bytes,
+    _tagFullyQualified6Bytes,
+    _tagFullyQualified8Bytes,
+)
+
+
+def _valueFixed(unpacker, wrapper=None):
+    size = unpacker.size
+
+    def decode(buf, pos):
+        (val,) = unpacker.unpack_from(buf, pos)
+        if wrapper is not None:
+            val = wrapper(val)
+        return val, pos + size
+    return decode
+
+
+def _valueUnsigned8(buf, pos):
+    return uint(buf[pos]), pos + 1
+
+
+def _valueString(lenDecoder, isUtf8):
+    def decode(buf, pos):
+        (strLen, pos) = lenDecoder(buf, pos)
+        val = bytes(buf[pos: pos + strLen])
+        if isUtf8:
+            try:
+                val = str(val, "utf-8")
+            except Exception:
+                pass
+        return val, pos + strLen
+    return decode
+
+
+def _lenFixed(unpacker):
+    size = unpacker.size
+
+    def decode(buf, pos):
+        return unpacker.unpack_from(buf, pos)[0], pos + size
+    return decode
+
+
+def _len8(buf, pos):
+    return buf[pos], pos + 1
+
+
+def _valueConstant(val):
+    def decode(buf, pos):
+        return val, pos
+    return decode
+
+
+def _valueContainer(factory):
+    def decode(buf, pos):
+        val = factory()
+        pos = _decodeValues(buf, pos, val)
+        return val, pos
+    return decode
+
+
+# Indexed by the element type field of the control byte (controlByte & 0x1F). Each entry
+# decodes the length and value fields starting at a given offset and returns the value
+# together with the offset of the next element. End of container is handled in _decodeValues.
+_ValueDecoders = (
+    _valueFixed(_INT8),
+    _valueFixed(_INT16),
+    _valueFixed(_INT32),
+    _valueFixed(_INT64),
+    _valueUnsigned8,
+    _valueFixed(_UINT16, uint),
+    _valueFixed(_UINT32, uint),
+    _valueFixed(_UINT64, uint),
+    _valueConstant(False),
+    _valueConstant(True),
+    _valueFixed(_FLOAT, float32),
+    _valueFixed(_DOUBLE),
+    _valueString(_len8, True),
+    _valueString(_lenFixed(_UINT16), True),
+    _valueString(_lenFixed(_UINT32), True),
+    _valueString(_lenFixed(_UINT64), True),
+    _valueString(_len8, False),
+    _valueString(_lenFixed(_UINT16), False),
+    _valueString(_lenFixed(_UINT32), False),
+    _valueString(_lenFixed(_UINT64), False),
+    _valueConstant(None),
+    _valueContainer(dict),
+    _valueContainer(list),
+    _valueContainer(TLVList),
+) + (None,) * 8
+
+
+def _decodeValues(buf, pos, out):
+    """Decode the elements starting at pos into out until the end of the enclosing container
+    (or the end of buf), and return the offset right after the last consumed byte.
+
+    This is the values-only counterpart of TLVReader._get: it produces the same Python values
+    but does not record per-element decoding information."""
+    end = len(buf)
+    while pos < end:
+        controlByte = buf[pos]
+        (tag, pos) = _TagDecoders[controlByte >> 5](buf, pos + 1)
+        elementType = controlByte & 0x1F
+        if elementType == TLVEndOfContainer:
+            break
+        decoder = _ValueDecoders[elementType]
+        if decoder is None:
+            raise ValueError("Attempt to decode unsupported TLV type")
+        (val, pos) = decoder(buf, pos)
+
+        if isinstance(tag, tuple):
+            out[tag] = val
+        elif isinstance(out, Mapping):
+            out["Any" if tag is None else tag] = val
+        elif isinstance(out, TLVList):
+            out.append(tag, val)
+        else:
+            out.append(val)
+    return pos
+
+
 class TLVReader(object):
-    def __init__(self, tlv):
+    def __init__(self, tlv, valuesOnly: bool = False):
+        """Create a reader for the TLV encoded data in tlv.
+
+        When valuesOnly is True, get() decodes straight into Python values without building
+        the per-element decoding information exposed by the decoding property, which stays
+        empty. This is considerably cheaper and should be preferred whenever only the values
+        are of interest.
+        """
         self._tlv = tlv
         self._bytesRead = 0
         self._decodings = []
+        self._valuesOnly = valuesOnly
 
     @property
     def decoding(self):
@@ -463,7 +635,11 @@ class TLVReader(object):
     def get(self):
         """Get the dictionary representation of tlv data"""
         out = {}
-        self._get(self._tlv, self._decodings, out)
+        if self._valuesOnly:
+            with memoryview(self._tlv) as buf:
+                self._bytesRead = _decodeValues(buf, self._bytesRead, out)
+        else:
+            self._get(self._tlv, self._decodings, out)
         return out
 
     def _decodeControlByte(self, tlv, decoding):
@@ -674,7 +850,7 @@ class TLVReader(object):
     def _get(self, tlv, decodings, out):
         endOfEncoding = False
 
-        while len(tlv[self._bytesRead:]) > 0 and endOfEncoding is False:
+        while self._bytesRead < len(tlv) and endOfEncoding is False:
             decoding = {}
             self._decodeControlAndTag(tlv, decoding)
             self._decodeStrLength(tlv, decoding)
@@ -19,6 +19,8 @@ from enum import Enum, auto
 from typing import Optional
 
 from ..native import GetLibraryHandle, HandleFlags, NativeLibraryHandleMethodArguments, PyChipError
+from .latency import (GetLatencyRecorder, InteractionSpan, LatencyHistogram, LatencyRecorder, StartLatencyRecording,  # noqa: F401
+                      StopLatencyRecording)
 
 
 def _GetTracingLibraryHandle() -> ctypes.CDLL:
@@ -0,0 +1,270 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""
+Opt-in latency instrumentation of the read, subscribe, write and invoke interactions of the controller.
+
+While recording is enabled (see StartLatencyRecording), every interaction gets an InteractionSpan which
+measures how long its phases take:
+
+    session     GetConnectedDevice, i.e. finding or establishing the session.
+    encode      Encoding the request payload to TLV (write and invoke).
+    firstReport From the start of the interaction to the first attribute or event data (read and subscribe).
+    decode      Decoding the TLV of the response, summed over all the data of the interaction.
+    loopHop     From the CHIP thread handing the result over to the event loop, to the event loop running it.
+    total       The whole interaction, as seen by the caller. Subscriptions end once established.
+
+Each phase is aggregated in percentile histograms, overall and per node and per cluster, and the latest spans
+are kept so that they can be exported as trace events, which Perfetto (ui.perfetto.dev) and chrome://tracing
+can display alongside the traces of the SDK (see StartTracingTo).
+"""
+
+import collections
+import contextlib
+import json
+import math
+import threading
+import time
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class LatencyHistogram:
+    """
+    A histogram of durations in seconds with logarithmic buckets, so that percentiles are within a few percent
+    of the recorded values regardless of their magnitude, in constant memory per order of magnitude.
+    """
+
+    # Buckets per doubling, giving a relative error of at most 2^(1/16) - 1 (~4.4%).
+    _BUCKETS_PER_OCTAVE = 16
+    _MIN_VALUE = 1e-9
+
+    def __init__(self):
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def Record(self, seconds: float):
+        value = max(seconds, self._MIN_VALUE)
+        bucket = math.floor(math.log2(value) * self._BUCKETS_PER_OCTAVE)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def Percentile(self, percentile: float) -> float:
+        """ Returns the duration below which `percentile` percent of the recorded durations fall, or 0 if empty.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = percentile / 100 * self.count
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                # The middle of the bucket, clamped to the exact extremes.
+                value = 2 ** ((bucket + 0.5) / self._BUCKETS_PER_OCTAVE)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def ToDict(self, percentiles: Iterable[float] = (50, 90, 99, 99.9)) -> Dict[str, float]:
+        result = {'count': self.count, 'mean': self.mean, 'min': self.min if self.count else 0.0, 'max': self.max}
+        for percentile in percentiles:
+            result[f'p{percentile:g}'] = self.Percentile(percentile)
+        return result
+
+
+class InteractionSpan:
+    """
+    The timing of one interaction. Phases are either durations added up (Add) or the time elapsed since the
+    start of the interaction (Mark). The span is recorded once ended.
+    """
+
+    __slots__ = ('kind', 'nodeid', 'clusterIds', 'start', 'phases', 'error', '_recorder', '_startTimestamp')
+
+    def __init__(self, recorder: 'LatencyRecorder', kind: str, nodeid: Optional[int], clusterIds: Iterable[int]):
+        self._recorder = recorder
+        self.kind = kind
+        self.nodeid = nodeid
+        self.clusterIds = tuple(sorted(set(clusterIds)))
+        self.phases: Dict[str, float] = {}
+        self.error: Optional[str] = None
+        self._startTimestamp = time.time()
+        self.start = time.perf_counter()
+
+    def Add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def Mark(self, phase: str):
+        if phase not in self.phases:
+            self.phases[phase] = time.perf_counter() - self.start
+
+    def End(self, error: Optional[BaseException] = None):
+        self.phases['total'] = time.perf_counter() - self.start
+        if error is not None:
+            self.error = repr(error)
+        self._recorder._Record(self)
+
+    def ToTraceEvent(self) -> Dict[str, Any]:
+        return {
+            'name': self.kind, 'cat': 'interaction', 'ph': 'X',
+            'ts': self._startTimestamp * 1e6, 'dur': self.phases.get('total', 0.0) * 1e6,
+            'pid': 'chip-controller', 'tid': f'node 0x{self.nodeid:016X}' if self.nodeid is not None else 'group',
+            'args': {'clusters': [f'0x{clusterId:08X}' for clusterId in self.clusterIds],
+                     'error': self.error, **{f'{phase}Ms': seconds * 1e3 for phase, seconds in self.phases.items()}},
+        }
+
+
+class LatencyRecorder:
+    """
+    Aggregates the spans of the interactions into histograms per (kind, phase): overall, per node and per
+    cluster. Spans are recorded from both the event loop and the CHIP thread.
+    """
+
+    def __init__(self, maxSpans: int = 10000):
+        self._lock = threading.Lock()
+        self._overall: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._perNode: Dict[Tuple[Optional[int], str, str], LatencyHistogram] = {}
+        self._perCluster: Dict[Tuple[int, str, str], LatencyHistogram] = {}
+        self._errors: Dict[str, int] = {}
+        self._spans: Deque[InteractionSpan] = collections.deque(maxlen=maxSpans)
+
+    def _Record(self, span: InteractionSpan):
+        with self._lock:
+            self._spans.append(span)
+            if span.error is not None:
+                self._errors[span.kind] = self._errors.get(span.kind, 0) + 1
+            for phase, seconds in span.phases.items():
+                self._Histogram(self._overall, (span.kind, phase)).Record(seconds)
+                self._Histogram(self._perNode, (span.nodeid, span.kind, phase)).Record(seconds)
+                for clusterId in span.clusterIds:
+                    self._Histogram(self._perCluster, (clusterId, span.kind, phase)).Record(seconds)
+
+    @staticmethod
+    def _Histogram(histograms: Dict, key) -> LatencyHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram()
+        return histogram
+
+    def Histogram(self, kind: str, phase: str = 'total', nodeid: Optional[int] = None,
+                  clusterId: Optional[int] = None) -> Optional[LatencyHistogram]:
+        """ Returns the histogram of a phase of an interaction kind ('read', 'subscribe', 'write' or 'invoke'),
+            overall or for a given node or cluster, or None if nothing was recorded.
+        """
+        with self._lock:
+            if nodeid is not None:
+                return self._perNode.get((nodeid, kind, phase))
+            if clusterId is not None:
+                return self._perCluster.get((clusterId, kind, phase))
+            return self._overall.get((kind, phase))
+
+    @property
+    def spans(self) -> List[InteractionSpan]:
+        """ The latest spans, oldest first.
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def Snapshot(self) -> Dict[str, Any]:
+        """ Returns the statistics of every histogram, as a JSON serializable dictionary.
+        """
+        with self._lock:
+            return {
+                'overall': {f'{kind}/{phase}': histogram.ToDict() for (kind, phase), histogram in self._overall.items()},
+                'nodes': {f'0x{nodeid:016X}/{kind}/{phase}' if nodeid is not None else f'group/{kind}/{phase}': histogram.ToDict()
+                          for (nodeid, kind, phase), histogram in self._perNode.items()},
+                'clusters': {f'0x{clusterId:08X}/{kind}/{phase}': histogram.ToDict()
+                             for (clusterId, kind, phase), histogram in self._perCluster.items()},
+                'errors': dict(self._errors),
+            }
+
+    def ExportTraceEvents(self, fileName: str):
+        """ Writes the latest spans as a JSON trace (Trace Event Format).
+        """
+        with open(fileName, 'w') as file:
+            json.dump({'traceEvents': [span.ToTraceEvent() for span in self.spans]}, file)
+
+    def Reset(self):
+        with self._lock:
+            self._overall.clear()
+            self._perNode.clear()
+            self._perCluster.clear()
+            self._errors.clear()
+            self._spans.clear()
+
+
+_recorder: Optional[LatencyRecorder] = None
+
+
+def StartLatencyRecording(maxSpans: int = 10000) -> LatencyRecorder:
+    """ Starts recording the latency of the interactions, and returns the recorder. Recording again replaces the
+        previous recorder.
+    """
+    global _recorder
+    _recorder = LatencyRecorder(maxSpans)
+    return _recorder
+
+
+def StopLatencyRecording() -> Optional[LatencyRecorder]:
+    """ Stops recording the latency of the interactions, and returns the recorder, whose data can still be
+        exported.
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def GetLatencyRecorder() -> Optional[LatencyRecorder]:
+    return _recorder
+
+
+@contextlib.contextmanager
+def Trace(kind: str, nodeid: Optional[int], clusterIds: Iterable[Optional[int]] = ()) -> Iterator[Optional[InteractionSpan]]:
+    """ Times an interaction, yielding its span, or None when recording is not enabled. The span ends with the
+        context, failed if an exception is raised.
+    """
+    recorder = _recorder
+    if recorder is None:
+        yield None
+        return
+    span = InteractionSpan(recorder, kind, nodeid, (clusterId for clusterId in clusterIds if clusterId is not None))
+    try:
+        yield span
+    except BaseException as ex:
+        span.End(ex)
+        raise
+    span.End()
+
+
+@contextlib.contextmanager
+def Phase(span: Optional[InteractionSpan], phase: str) -> Iterator[None]:
+    """ Adds the time spent in the context to a phase of a span, if there is one.
+    """
+    if span is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        span.Add(phase, time.perf_counter() - start)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Benchmarks decoding and encoding of generated cluster objects.
+
+For decoding, compares the direct construction path (the default) with the strict path that goes
+through a label dict and dacite.from_dict, on representative clusters and structs.
+
+For encoding, compares encoding straight from the object fields (ClusterObject.ToTLV and
+ClusterAttributeDescriptor.ToTLV) with the former path, which first copied the object tree into
+dicts with dataclasses.asdict, on list attribute writes and command payloads.
+
+Usage:
+    python3 cluster_object_benchmark.py [--repeat N] [--entries N]
+'''
+
+import argparse
+import timeit
+from dataclasses import asdict
+
+import chip.clusters as Clusters
+from chip.clusters.ClusterObjects import Cluster, GetCompiledDescriptor
+from chip.clusters.Types import NullValue
+from chip.tlv import TLVReader, TLVWriter
+
+
+def DescriptorCluster(entries: int) -> Clusters.Descriptor:
+    return Clusters.Descriptor(
+        deviceTypeList=[Clusters.Descriptor.Structs.DeviceTypeStruct(deviceType=0x0100 + i, revision=1)
+                        for i in range(entries)],
+        serverList=list(range(entries)),
+        clientList=list(range(entries)),
+        partsList=list(range(entries)),
+        tagList=[Clusters.Descriptor.Structs.SemanticTagStruct(mfgCode=NullValue, namespaceID=7, tag=i, label=f'tag {i}')
+                 for i in range(entries)],
+        generatedCommandList=[],
+        acceptedCommandList=[],
+        attributeList=list(range(entries)),
+        featureMap=1,
+        clusterRevision=3)
+
+
+def AccessControlCluster(entries: int) -> Clusters.AccessControl:
+    ACL = Clusters.AccessControl
+    return ACL(
+        acl=[ACL.Structs.AccessControlEntryStruct(
+            privilege=ACL.Enums.AccessControlEntryPrivilegeEnum.kAdminister,
+            authMode=ACL.Enums.AccessControlEntryAuthModeEnum.kCase,
+            subjects=[0x0000000100000000 + i, 0x12345],
+            targets=[ACL.Structs.AccessControlTargetStruct(cluster=6, endpoint=1, deviceType=NullValue)],
+            fabricIndex=1) for i in range(entries)],
+        subjectsPerAccessControlEntry=4,
+        targetsPerAccessControlEntry=3,
+        accessControlEntriesPerFabric=entries,
+        generatedCommandList=[],
+        acceptedCommandList=[],
+        attributeList=list(range(8)),
+        featureMap=0,
+        clusterRevision=2)
+
+
+def UnitTestingStruct(entries: int) -> Clusters.UnitTesting.Structs.NestedStructList:
+    UT = Clusters.UnitTesting
+    simple = UT.Structs.SimpleStruct(a=23, b=True, c=UT.Enums.SimpleEnum.kValueA, d=b'1234', e='hello', f=1, g=0.5, h=0.25)
+    return UT.Structs.NestedStructList(
+        a=1, b=True, c=simple, d=[simple] * entries, e=list(range(entries)), f=[b'x'] * entries, g=list(range(entries)))
+
+
+CASES = {
+    'Descriptor': DescriptorCluster,
+    'AccessControl': AccessControlCluster,
+    'UnitTesting': UnitTestingStruct,
+}
+
+
+def GroupKeyMap(entries: int) -> list:
+    return [Clusters.GroupKeyManagement.Structs.GroupKeyMapStruct(groupId=i + 1, groupKeySetID=i % 3 + 1, fabricIndex=1)
+            for i in range(entries)]
+
+
+# Encoding cases, as (attribute, value) for attribute writes, or (None, object) for ToTLV.
+ENCODE_CASES = {
+    'Acl write': lambda entries: (Clusters.AccessControl.Attributes.Acl, AccessControlCluster(entries).acl),
+    'GroupKeyMap write': lambda entries: (Clusters.GroupKeyManagement.Attributes.GroupKeyMap, GroupKeyMap(entries)),
+    'UnitTesting': lambda entries: (None, UnitTestingStruct(entries)),
+    'OnOff.On command': lambda entries: (None, Clusters.OnOff.Commands.On()),
+    'AddGroup command': lambda entries: (None, Clusters.Groups.Commands.AddGroup(groupID=1, groupName='kitchen')),
+}
+
+
+def LegacyEncode(attribute, value) -> bytes:
+    ''' The encoding as done before, through a dict copy of the object tree. '''
+    if attribute is None:
+        return GetCompiledDescriptor(type(value)).DictToTLV(asdict(value))
+    writer = TLVWriter()
+    attribute._compiled_attribute_type.PutFieldToTLV(None, asdict(attribute._cluster_object(Value=value))['Value'], writer, '')
+    return bytes(writer.encoding)
+
+
+def Encode(attribute, value) -> bytes:
+    if attribute is None:
+        return value.ToTLV()
+    return bytes(attribute.ToTLV(None, value))
+
+
+def ToTagDict(obj) -> dict:
+    ''' Returns the data of obj as decoded by TLVReader, the way read reports hand it to decoding.
+
+        Cluster objects can not be encoded as a single TLV structure since attribute ids do not fit in
+        context tags, so each attribute is encoded on its own, like it is in attribute reports.
+    '''
+    if not isinstance(obj, Cluster):
+        return TLVReader(obj.ToTLV(), valuesOnly=True).get()['Any']
+
+    data = asdict(obj)
+    tagDict = {}
+    for field in GetCompiledDescriptor(type(obj)).Fields:
+        writer = TLVWriter()
+        field.PutFieldToTLV(None, data[field.Label], writer)
+        if writer.encoding:
+            tagDict[field.Tag] = TLVReader(writer.encoding, valuesOnly=True).get()['Any']
+    return tagDict
+
+
+def Measure(fn, repeat: int) -> float:
+    ''' Returns the best per-call time in seconds over the given number of runs. '''
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cluster object decode benchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of timing runs per case')
+    parser.add_argument('--entries', type=int, default=32, help='Number of list entries in each object')
+    args = parser.parse_args()
+
+    print(f"{'object':<16}{'strict (us)':>14}{'direct (us)':>14}{'speedup':>10}")
+    for name, builder in CASES.items():
+        obj = builder(args.entries)
+        objType = type(obj)
+        tagDict = ToTagDict(obj)
+
+        assert objType.FromTagDict(tagDict, strict=True) == objType.FromTagDict(tagDict, strict=False) == obj
+
+        strict = Measure(lambda: objType.FromTagDict(tagDict, strict=True), args.repeat)
+        direct = Measure(lambda: objType.FromTagDict(tagDict, strict=False), args.repeat)
+        print(f"{name:<16}{strict * 1e6:>14.1f}{direct * 1e6:>14.1f}{strict / direct:>9.1f}x")
+
+    print()
+    print(f"{'encode':<20}{'asdict (us)':>14}{'direct (us)':>14}{'speedup':>10}")
+    for name, builder in ENCODE_CASES.items():
+        attribute, value = builder(args.entries)
+
+        assert LegacyEncode(attribute, value) == Encode(attribute, value)
+
+        legacy = Measure(lambda: LegacyEncode(attribute, value), args.repeat)
+        direct = Measure(lambda: Encode(attribute, value), args.repeat)
+        print(f"{name:<20}{legacy * 1e6:>14.1f}{direct * 1e6:>14.1f}{legacy / direct:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
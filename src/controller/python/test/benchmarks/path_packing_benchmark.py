@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Measures the cost of preparing the attribute paths and data version filters of a large Read or
+Subscribe request for the native layer.
+
+Compares building one construct struct and one ctypes buffer per path, which is what Read() used
+to do, with packing every path into a single contiguous buffer.
+
+Usage:
+    python3 path_packing_benchmark.py [--paths N] [--number N]
+'''
+
+import argparse
+import ctypes
+import timeit
+
+from chip.clusters import Attribute
+from chip.interaction_model import AttributePathIBstruct, DataVersionFilterIBstruct
+
+
+def _LegacyPack(attributePaths, dataVersionFilters):
+    attributePathsForCffi = (ctypes.c_void_p * len(attributePaths))()
+    buffers = []
+    for idx, (endpoint, cluster, attribute) in enumerate(attributePaths):
+        path = AttributePathIBstruct.parse(b'\xff' * AttributePathIBstruct.sizeof())
+        path.EndpointId = endpoint
+        path.ClusterId = cluster
+        path.AttributeId = attribute
+        buffer = ctypes.create_string_buffer(AttributePathIBstruct.build(path))
+        buffers.append(buffer)
+        attributePathsForCffi[idx] = ctypes.cast(buffer, ctypes.c_void_p)
+
+    dataVersionFiltersForCffi = (ctypes.c_void_p * len(dataVersionFilters))()
+    for idx, (endpoint, cluster, dataVersion) in enumerate(dataVersionFilters):
+        dataVersionFilter = DataVersionFilterIBstruct.parse(b'\xff' * DataVersionFilterIBstruct.sizeof())
+        dataVersionFilter.EndpointId = endpoint
+        dataVersionFilter.ClusterId = cluster
+        dataVersionFilter.DataVersion = dataVersion
+        buffer = ctypes.create_string_buffer(DataVersionFilterIBstruct.build(dataVersionFilter))
+        buffers.append(buffer)
+        dataVersionFiltersForCffi[idx] = ctypes.cast(buffer, ctypes.c_void_p)
+    return buffers, attributePathsForCffi, dataVersionFiltersForCffi
+
+
+def _Pack(attributePaths, dataVersionFilters):
+    return (Attribute._PackPaths(Attribute._AttributePathLayout,
+                                 [(endpoint, cluster, attribute, 0xFFFFFFFF, 0xFF)
+                                  for endpoint, cluster, attribute in attributePaths]),
+            Attribute._PackPaths(Attribute._DataVersionFilterLayout, dataVersionFilters))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Read/Subscribe path packing benchmark')
+    parser.add_argument('--paths', type=int, default=500, help='Number of attribute paths and data version filters')
+    parser.add_argument('--number', type=int, default=20, help='Number of requests prepared per measurement')
+    args = parser.parse_args()
+
+    attributePaths = [(idx % 16, 6 + idx % 40, idx) for idx in range(args.paths)]
+    dataVersionFilters = [(idx % 16, 6 + idx % 40, idx * 7) for idx in range(args.paths)]
+
+    for label, pack in (('per-path construct', _LegacyPack), ('contiguous buffer', _Pack)):
+        elapsed = min(timeit.repeat(lambda: pack(attributePaths, dataVersionFilters), number=args.number, repeat=5))
+        print(f"{label:<24}{elapsed / args.number * 1e3:>10.3f} ms per request ({args.paths} paths + filters)")
+
+
+if __name__ == '__main__':
+    main()
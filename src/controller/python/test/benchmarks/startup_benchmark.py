@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Measures the start-up cost of the Python controller cluster support.
+
+Each run happens in a fresh interpreter, and reports the time taken and the peak resident memory after
+importing chip.clusters and running chip.clusters.Attribute.Init() (skipped when the native library
+can not be loaded), after resolving a couple of attribute paths through the generated index (OnOff and
+Descriptor), which only imports the definitions of those clusters, and after loading the definitions of
+every cluster, which is what importing chip.clusters used to cost before the definitions were split per
+cluster.
+
+Usage:
+    python3 startup_benchmark.py [--runs N]
+'''
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_RUN = r'''
+import json
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+try:
+    Attribute.Init()
+    native = True
+except Exception:
+    native = False
+imported = time.perf_counter()
+importedRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+assert Attribute._GetAttributeType(0x0006, 0x0000) is Clusters.OnOff.Attributes.OnOff
+assert Attribute._GetAttributeType(0x001D, 0x0003) is Clusters.Descriptor.Attributes.PartsList
+used = time.perf_counter()
+usedRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+Clusters.Objects.LoadAllClusters()
+loadedAll = time.perf_counter()
+loadedAllRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print(json.dumps({'import': (imported - start, importedRss), 'used': (used - start, usedRss),
+                  'all': (loadedAll - start, loadedAllRss), 'native': native}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description='chip.clusters start-up benchmark')
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters to measure')
+    args = parser.parse_args()
+
+    results = [json.loads(subprocess.check_output([sys.executable, '-c', _RUN], text=True)) for _ in range(args.runs)]
+
+    print(f"native library: {'loaded' if results[0]['native'] else 'not available, Attribute.Init() skipped'}")
+    print(f"{'step':<36}{'time (ms)':>12}{'peak RSS (MiB)':>16}")
+    for key, label in (('import', 'import chip.clusters + Init()'), ('used', '+ OnOff and Descriptor paths'),
+                       ('all', '+ all clusters (eager import)')):
+        elapsed = statistics.median(r[key][0] for r in results) * 1e3
+        # ru_maxrss is reported in KiB on Linux.
+        rss = statistics.median(r[key][1] for r in results) / 1024
+        print(f"{label:<36}{elapsed:>12.1f}{rss:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Measures the cost of storing the keys written by the controller while commissioning a fleet of nodes.
+
+For every simulated node, a handful of SDK keys (session resumption state, operational credentials indexes,
+...) and a REPL key are set on a PersistentStorage, followed by a final flush. The storage is measured with
+each backend, committing every change right away and in write-behind mode.
+
+The native storage adapter is not used, so this runs without the CHIP library being built.
+
+Usage:
+    python3 storage_benchmark.py [--nodes N] [--no-fsync]
+'''
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from unittest import mock
+
+import chip.storage
+from chip.storage import JsonFileStorageBackend, PersistentStorage, SqliteStorageBackend
+
+
+def _Commission(storage: PersistentStorage, nodes: int):
+    for nodeId in range(1, nodes + 1):
+        storage.SetSdkKey(f'f/1/s/{nodeId:016X}', os.urandom(64))
+        storage.SetSdkKey(f'f/1/r/{os.urandom(8).hex()}', nodeId.to_bytes(8, 'little'))
+        storage.SetSdkKey('f/1/n', os.urandom(400))
+        storage.SetSdkKey('g/sri', os.urandom(32) * ((nodeId % 32) + 1))
+        storage.SetReplKey(f'node-{nodeId}', {'name': f'node {nodeId}', 'endpoints': [0, 1]})
+    storage.Flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PersistentStorage commissioning benchmark')
+    parser.add_argument('--nodes', type=int, default=1000, help='Number of commissioned nodes to simulate')
+    parser.add_argument('--no-fsync', action='store_true', help='Do not fsync the JSON snapshots')
+    args = parser.parse_args()
+    # Every storage starts empty, don't report it.
+    logging.disable(logging.WARNING)
+
+    backends = {
+        'json': lambda path: JsonFileStorageBackend(path + '.json', fsync=not args.no_fsync),
+        'sqlite': lambda path: SqliteStorageBackend(path + '.sqlite'),
+    }
+
+    with mock.patch.object(chip.storage, 'GetLibraryHandle', mock.Mock()), tempfile.TemporaryDirectory() as directory:
+        print(f"{'backend':<10}{'mode':<16}{'time (s)':>10}{'size (KiB)':>12}")
+        for name, createBackend in backends.items():
+            for mode, writeBehindSec in (('every change', None), ('write-behind', 0.5)):
+                backend = createBackend(os.path.join(directory, f'{name}-{writeBehindSec}'))
+                storage = PersistentStorage(backend=backend, writeBehindSec=writeBehindSec)
+                start = time.perf_counter()
+                _Commission(storage, args.nodes)
+                elapsed = time.perf_counter() - start
+                storage.Shutdown()
+                size = sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory)
+                           if f.startswith(f'{name}-{writeBehindSec}'))
+                print(f"{name:<10}{mode:<16}{elapsed:>10.2f}{size / 1024:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Micro-benchmarks for chip.tlv.TLVReader.
+
+Compares the full decode (which records per-element decoding information) with the
+values-only decode on payloads shaped like large list attributes, and checks how both
+scale with the payload size.
+
+Usage:
+    python3 tlv_benchmark.py [--repeat N] [--scale N]
+'''
+
+import argparse
+import timeit
+
+from chip.tlv import TLVReader, TLVWriter
+from chip.tlv import uint as tlvUint
+
+
+def _encode(value) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+def AclList(count: int) -> bytes:
+    ''' A list of AccessControlEntryStruct-like structures. '''
+    return _encode([{
+        1: tlvUint(5),
+        2: tlvUint(2),
+        3: [tlvUint(0x0000000100000000 + i), tlvUint(0x12345)],
+        4: [{0: None, 1: tlvUint(0x0006), 2: tlvUint(1)}],
+        0xFE: tlvUint(1),
+    } for i in range(count)])
+
+
+def AttributeList(count: int) -> bytes:
+    ''' A list of attribute IDs, as found in the AttributeList global attribute. '''
+    return _encode([tlvUint(i) for i in range(count)])
+
+
+def LogList(count: int) -> bytes:
+    ''' A list of structures carrying strings and opaque blobs, like diagnostic logs. '''
+    return _encode([{
+        0: tlvUint(i),
+        1: f'log entry {i} ' * 4,
+        2: bytes(range(64)),
+    } for i in range(count)])
+
+
+PAYLOADS = {
+    'acl': AclList,
+    'attribute-list': AttributeList,
+    'logs': LogList,
+}
+
+
+def Measure(payload: bytes, valuesOnly: bool, repeat: int) -> float:
+    ''' Returns the best per-decode time in seconds over the given number of runs. '''
+    timer = timeit.Timer(lambda: TLVReader(payload, valuesOnly=valuesOnly).get())
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TLVReader micro-benchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of timing runs per case')
+    parser.add_argument('--scale', type=int, default=100, help='Number of list entries in the smallest payload')
+    args = parser.parse_args()
+
+    print(f"{'payload':<16}{'entries':>8}{'bytes':>10}{'full (ms)':>12}{'values (ms)':>14}{'speedup':>10}")
+    for name, builder in PAYLOADS.items():
+        for count in (args.scale, args.scale * 4, args.scale * 16):
+            payload = builder(count)
+            full = Measure(payload, False, args.repeat)
+            valuesOnly = Measure(payload, True, args.repeat)
+            print(f"{name:<16}{count:>8}{len(payload):>10}{full * 1e3:>12.3f}{valuesOnly * 1e3:>14.3f}"
+                  f"{full / valuesOnly:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
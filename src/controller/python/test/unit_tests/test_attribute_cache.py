@@ -0,0 +1,216 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.clusters.ClusterObjects import ALL_ATTRIBUTES, ALL_EVENTS
+from chip.interaction_model import Status
+from chip.tlv import uint
+
+
+def _fill_basic_information(cache: Attribute.AttributeCache, endpoint: int = 0):
+    BI = Clusters.BasicInformation
+    cache.UpdateTLV(Attribute.AttributePath(EndpointId=endpoint, ClusterId=BI.id,
+                                            AttributeId=BI.Attributes.VendorName.attribute_id), 7, 'vendor')
+    cache.UpdateTLV(Attribute.AttributePath(EndpointId=endpoint, ClusterId=BI.id,
+                                            AttributeId=BI.Attributes.VendorID.attribute_id), 7, uint(0xFFF1))
+    cache.UpdateTLV(Attribute.AttributePath(EndpointId=endpoint, ClusterId=BI.id,
+                                            AttributeId=BI.Attributes.ProductID.attribute_id), 7, uint(0x8000))
+
+
+class TestIndexes(unittest.TestCase):
+    def test_indexes(self):
+        self.assertIs(Attribute._GetClusterType(Clusters.OnOff.id), Clusters.OnOff)
+        self.assertIs(Attribute._GetAttributeType(Clusters.OnOff.id, Clusters.OnOff.Attributes.OnTime.attribute_id),
+                      Clusters.OnOff.Attributes.OnTime)
+        self.assertIs(Attribute._GetEventType(Clusters.BasicInformation.id, Clusters.BasicInformation.Events.StartUp.event_id),
+                      Clusters.BasicInformation.Events.StartUp)
+        self.assertIsNone(Attribute._GetClusterType(0xFFF1FC00))
+        self.assertIsNone(Attribute._GetAttributeType(Clusters.OnOff.id, 0xFFF1FC00))
+        self.assertIsNone(Attribute._GetEventType(Clusters.OnOff.id, 0xFFF1FC00))
+
+    def test_generated_index_matches_definitions(self):
+        Clusters.Objects.LoadAllClusters()
+        for registry, index in ((ALL_ATTRIBUTES, Clusters.Objects._ATTRIBUTE_NAMES), (ALL_EVENTS, Clusters.Objects._EVENT_NAMES)):
+            defined = {(clusterId, objectId): objectType.__name__
+                       for clusterId, objectTypes in registry.items() for objectId, objectType in objectTypes.items()
+                       if objectType.__module__.startswith('chip.clusters.definitions.')}
+            self.assertEqual(index, defined)
+
+    def test_typed_attribute_path(self):
+        path = Attribute.TypedAttributePath(Path=Attribute.AttributePath(
+            EndpointId=1, ClusterId=Clusters.OnOff.id, AttributeId=Clusters.OnOff.Attributes.OnTime.attribute_id))
+        self.assertIs(path.ClusterType, Clusters.OnOff)
+        self.assertIs(path.AttributeType, Clusters.OnOff.Attributes.OnTime)
+        self.assertEqual(path.AttributeName, 'onTime')
+
+        with self.assertRaises(KeyError):
+            Attribute.TypedAttributePath(Path=Attribute.AttributePath(EndpointId=1, ClusterId=0xFFF1FC00, AttributeId=0))
+
+
+class TestAttributeCache(unittest.TestCase):
+    def test_cluster_view_decodes_each_cluster_once(self):
+        cache = Attribute.AttributeCache(returnClusterObject=True)
+        _fill_basic_information(cache)
+
+        with mock.patch.object(Clusters.BasicInformation, 'FromTagDict',
+                               wraps=Clusters.BasicInformation.FromTagDict) as fromTagDict:
+            data = cache.GetUpdatedAttributeCache()
+            self.assertEqual(fromTagDict.call_count, 1)
+
+        cluster = data[0][Clusters.BasicInformation]
+        self.assertEqual(cluster.vendorName, 'vendor')
+        self.assertEqual(cluster.vendorID, 0xFFF1)
+        self.assertEqual(cluster.productID, 0x8000)
+        self.assertEqual(cluster.data_version, 7)
+
+    def test_attribute_view(self):
+        cache = Attribute.AttributeCache()
+        _fill_basic_information(cache)
+
+        data = cache.GetUpdatedAttributeCache()
+        cluster = data[0][Clusters.BasicInformation]
+        self.assertEqual(cluster[Attribute.DataVersion], 7)
+        self.assertEqual(cluster[Clusters.BasicInformation.Attributes.VendorName], 'vendor')
+        self.assertEqual(cluster[Clusters.BasicInformation.Attributes.ProductID], 0x8000)
+
+    def test_lazy_cluster_view(self):
+        cache = Attribute.AttributeCache(returnClusterObject=True, lazyDecode=True)
+        _fill_basic_information(cache, endpoint=0)
+        _fill_basic_information(cache, endpoint=1)
+
+        with mock.patch.object(Clusters.BasicInformation, 'FromTagDict',
+                               wraps=Clusters.BasicInformation.FromTagDict) as fromTagDict:
+            data = cache.GetUpdatedAttributeCache()
+            self.assertEqual(fromTagDict.call_count, 0)
+            self.assertIn(Clusters.BasicInformation, data[1])
+
+            self.assertEqual(data[1][Clusters.BasicInformation].vendorName, 'vendor')
+            self.assertEqual(data[1][Clusters.BasicInformation].productID, 0x8000)
+            self.assertEqual(fromTagDict.call_count, 1)
+            self.assertFalse(data[0].IsDecoded(Clusters.BasicInformation))
+
+    def test_lazy_attribute_view(self):
+        cache = Attribute.AttributeCache(lazyDecode=True)
+        _fill_basic_information(cache)
+
+        data = cache.GetUpdatedAttributeCache()
+        cluster = data[0][Clusters.BasicInformation]
+        self.assertFalse(cluster.IsDecoded(Clusters.BasicInformation.Attributes.VendorName))
+        self.assertEqual(cluster[Clusters.BasicInformation.Attributes.VendorName], 'vendor')
+        self.assertTrue(cluster.IsDecoded(Clusters.BasicInformation.Attributes.VendorName))
+
+        # Updates replace previously decoded values with new deferred ones.
+        cache.UpdateTLV(Attribute.AttributePath(EndpointId=0, ClusterId=Clusters.BasicInformation.id,
+                                                AttributeId=Clusters.BasicInformation.Attributes.VendorName.attribute_id),
+                        8, 'other vendor')
+        data = cache.GetUpdatedAttributeCache()
+        cluster = data[0][Clusters.BasicInformation]
+        self.assertEqual(cluster[Clusters.BasicInformation.Attributes.VendorName], 'other vendor')
+        self.assertEqual(cluster[Attribute.DataVersion], 8)
+
+    def test_clear_cluster(self):
+        cache = Attribute.AttributeCache()
+        _fill_basic_information(cache, endpoint=0)
+        _fill_basic_information(cache, endpoint=1)
+        cache.GetUpdatedAttributeCache()
+
+        cache.ClearCluster(1, Clusters.BasicInformation.id)
+        self.assertEqual(cache.versionList[1], {})
+        self.assertEqual(cache.versionList[0], {Clusters.BasicInformation.id: 7})
+        data = cache.GetUpdatedAttributeCache()
+        self.assertNotIn(Clusters.BasicInformation, data[1])
+        self.assertIn(Clusters.BasicInformation, data[0])
+
+
+class TestIncrementalRead(unittest.TestCase):
+    def test_merge_into_cache(self):
+        BI = Clusters.BasicInformation
+        cache = Attribute.AttributeCache()
+        _fill_basic_information(cache, endpoint=0)
+        _fill_basic_information(cache, endpoint=1)
+        cache.GetUpdatedAttributeCache()
+
+        # Only endpoint 1 changed: its cluster is replaced by what is reported, endpoint 0 is kept.
+        transaction = Attribute.AsyncReadTransaction(None, None, None, returnClusterObject=False, cache=cache)
+        transaction.handleAttributeData(Attribute.AttributePath(EndpointId=1, ClusterId=BI.id,
+                                                                AttributeId=BI.Attributes.VendorName.attribute_id),
+                                        8, Status.Success, b'\x0c\x03new')
+        data = transaction.GetReadResponse().attributes
+
+        self.assertEqual(data[0][BI][BI.Attributes.VendorName], 'vendor')
+        self.assertEqual(data[1][BI][BI.Attributes.VendorName], 'new')
+        self.assertNotIn(BI.Attributes.ProductID, data[1][BI])
+        self.assertEqual(cache.versionList, {0: {BI.id: 7}, 1: {BI.id: 8}})
+
+
+class TestDeferredTLVDecode(unittest.TestCase):
+    def test_decoded_on_lookup(self):
+        BI = Clusters.BasicInformation
+        transaction = Attribute.AsyncReadTransaction(None, None, None, returnClusterObject=False, deferTLVDecode=True)
+        payload = b'\x0c\x03new'
+        for attribute in (BI.Attributes.VendorName, BI.Attributes.ProductName):
+            transaction.handleAttributeData(Attribute.AttributePath.from_attribute(EndpointId=0, Attribute=attribute), 7,
+                                            Status.Success, payload)
+
+        tlvCluster = transaction._cache.attributeTLVCache[0][BI.id]
+        vendorNameId = BI.Attributes.VendorName.attribute_id
+        self.assertFalse(tlvCluster.IsDecoded(vendorNameId))
+        raw = tlvCluster.GetRaw(vendorNameId)
+        self.assertEqual(raw, payload)
+        self.assertTrue(raw.readonly)
+
+        data = transaction.GetReadResponse().attributes
+        self.assertEqual(data[0][BI][BI.Attributes.VendorName], 'new')
+        self.assertTrue(tlvCluster.IsDecoded(vendorNameId))
+        self.assertIsNone(tlvCluster.GetRaw(vendorNameId))
+
+    def test_decode_failure(self):
+        OnOff = Clusters.OnOff
+        cache = Attribute.AttributeCache(deferTLVDecode=True)
+        cache.UpdateTLV(Attribute.AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnTime), 1,
+                        Attribute._DeferredValue(lambda: Attribute._DecodeTLV(b'\xff'), b'\xff'))
+        value = cache.GetUpdatedAttributeCache()[1][OnOff][OnOff.Attributes.OnTime]
+        self.assertIsInstance(value, Attribute.ValueDecodeFailure)
+
+        # Without deferTLVDecode, deferred values are decoded as they are stored.
+        cache = Attribute.AttributeCache()
+        cache.UpdateTLV(Attribute.AttributePath.from_attribute(EndpointId=1, Attribute=OnOff.Attributes.OnTime), 1,
+                        Attribute._DeferredValue(lambda: uint(5), b''))
+        self.assertEqual(cache.attributeTLVCache[1][OnOff.id][OnOff.Attributes.OnTime.attribute_id], 5)
+
+    def test_entry_replaced_while_decoding(self):
+        lazy = Attribute.LazyDecodeDict()
+
+        def decode():
+            # A new report for the same attribute lands while the old one is being decoded.
+            lazy.SetDeferred(1, lambda: 'newer', b'newer')
+            return 'older'
+
+        lazy.SetDeferred(1, decode, b'older')
+        self.assertEqual(lazy[1], 'older')
+        self.assertFalse(lazy.IsDecoded(1))
+        self.assertEqual(lazy.GetRaw(1), b'newer')
+        self.assertEqual(lazy[1], 'newer')
+        self.assertTrue(lazy.IsDecoded(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.clusters.AttributeCacheStore import AttributeCacheStore
+from chip.interaction_model import InteractionModelError, Status
+from chip.tlv import uint
+from test_device_proxy_cache import makeController
+
+BI = Clusters.BasicInformation
+NODE_ID = 0xFFFFFFEF00000001
+
+
+def _path(endpoint: int, attribute) -> Attribute.AttributePath:
+    return Attribute.AttributePath(EndpointId=endpoint, ClusterId=BI.id, AttributeId=attribute.attribute_id)
+
+
+class TestAttributeCacheStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = AttributeCacheStore(os.path.join(directory.name, 'cache.sqlite'))
+        self.addCleanup(self.store.Close)
+
+        self.cache = Attribute.AttributeCache()
+        for endpoint in (0, 1):
+            self.cache.UpdateTLV(_path(endpoint, BI.Attributes.VendorName), 7, 'vendor')
+            self.cache.UpdateTLV(_path(endpoint, BI.Attributes.ProductID), 7, uint(0x8000))
+            self.cache.UpdateTLV(_path(endpoint, BI.Attributes.Location), 7,
+                                 Attribute.ValueDecodeFailure(None, InteractionModelError(Status.UnsupportedAttribute)))
+
+    def test_round_trip(self):
+        self.store.Save(NODE_ID, 'view', self.cache)
+        self.assertIsNone(self.store.Load(NODE_ID, 'other view'))
+        self.assertEqual(self.store.Nodes(), [NODE_ID])
+
+        cache = self.store.Load(NODE_ID, 'view')
+        self.assertEqual(cache.versionList, self.cache.versionList)
+        data = cache.GetUpdatedAttributeCache()
+        self.assertEqual(data[1][BI][BI.Attributes.VendorName], 'vendor')
+        self.assertEqual(data[1][BI][BI.Attributes.ProductID], 0x8000)
+        self.assertEqual(data[1][BI][Attribute.DataVersion], 7)
+        self.assertEqual(data[0][BI][BI.Attributes.Location].Reason.status, Status.UnsupportedAttribute)
+
+    def test_save_clusters(self):
+        self.store.Save(NODE_ID, 'view', self.cache)
+        self.cache.ClearCluster(1, BI.id)
+        self.cache.UpdateTLV(_path(1, BI.Attributes.VendorName), 8, 'new vendor')
+        self.cache.UpdateTLV(_path(0, BI.Attributes.VendorName), 7, 'not saved')
+        self.store.Save(NODE_ID, 'view', self.cache, clusters=[(1, BI.id)])
+
+        cache = self.store.Load(NODE_ID, 'view')
+        self.assertEqual(cache.versionList, {0: {BI.id: 7}, 1: {BI.id: 8}})
+        self.assertEqual(cache.attributeTLVCache[0][BI.id][BI.Attributes.VendorName.attribute_id], 'vendor')
+        self.assertEqual(cache.attributeTLVCache[1][BI.id], {BI.Attributes.VendorName.attribute_id: 'new vendor'})
+
+    def test_deferred_decode(self):
+        self.store.Save(NODE_ID, 'view', self.cache)
+        cache = self.store.Load(NODE_ID, 'view', deferTLVDecode=True)
+        vendorName = cache.attributeTLVCache[1][BI.id]
+        self.assertFalse(vendorName.IsDecoded(BI.Attributes.VendorName.attribute_id))
+
+        # Payloads which were never decoded are saved as they are.
+        self.store.Save(NODE_ID, 'other view', cache)
+        data = self.store.Load(NODE_ID, 'other view').GetUpdatedAttributeCache()
+        self.assertFalse(vendorName.IsDecoded(BI.Attributes.VendorName.attribute_id))
+        self.assertEqual(data[1][BI][BI.Attributes.VendorName], 'vendor')
+        self.assertEqual(data[0][BI][BI.Attributes.Location].Reason.status, Status.UnsupportedAttribute)
+
+    def test_delete(self):
+        self.store.Save(NODE_ID, 'view', self.cache)
+        self.store.Save(2, 'view', self.cache)
+        self.store.Delete(NODE_ID)
+        self.assertEqual(self.store.Nodes(), [2])
+        self.store.Delete()
+        self.assertEqual(self.store.Nodes(), [])
+
+
+class TestReadIncrementalStore(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.controller, _, _ = makeController(self)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = AttributeCacheStore(os.path.join(directory.name, 'cache.sqlite'))
+        self.addCleanup(self.store.Close)
+        self.controller.SetAttributeCacheStore(self.store)
+
+        # The threads on which the database is accessed.
+        self.threads = []
+        for name in ('Load', 'Write'):
+            method = getattr(self.store, name)
+            patcher = mock.patch.object(self.store, name, side_effect=self.recordThread(method))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        async def readParsedPaths(nodeid, *args):
+            cache = args[-1]
+            cache.UpdateTLV(_path(0, BI.Attributes.VendorName), 7, 'vendor')
+            return cache
+        patcher = mock.patch.object(self.controller, '_ReadParsedPaths', readParsedPaths)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def recordThread(self, method):
+        def call(*args, **kwargs):
+            self.threads.append(threading.current_thread())
+            return method(*args, **kwargs)
+        return call
+
+    async def test_database_accessed_off_the_event_loop(self):
+        await self.controller.ReadIncremental(NODE_ID, [(0, BI.Attributes.VendorName)])
+        # After a restart, the snapshot is loaded from the store.
+        self.controller.ClearIncrementalReadCache()
+        cache = await self.controller.ReadIncremental(NODE_ID, [(0, BI.Attributes.VendorName)])
+
+        self.assertEqual(cache.versionList, {0: {BI.id: 7}})
+        self.assertEqual(len(self.threads), 4)
+        self.assertNotIn(threading.current_thread(), self.threads)
+        self.assertEqual(self.store.Nodes(), [NODE_ID])
+
+
+if __name__ == '__main__':
+    unittest.main()
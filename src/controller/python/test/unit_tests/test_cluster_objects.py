@@ -1,6 +1,6 @@
 import typing
 import unittest
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 import chip.ChipUtility
 from chip.clusters import ClusterObjects
@@ -187,6 +187,65 @@ class TestClusterObjects(unittest.TestCase):
         self.assertEqual(res, data)
 
 
+class TestCompiledDescriptor(unittest.TestCase):
+    def test_descriptor_is_cached(self):
+        descriptor = ClusterObjects.GetCompiledDescriptor(TestClusterObjects.C)
+        self.assertIs(ClusterObjects.GetCompiledDescriptor(TestClusterObjects.C), descriptor)
+        # Each access to the descriptor classproperty still builds a fresh descriptor.
+        self.assertIsNot(TestClusterObjects.C.descriptor, descriptor)
+
+    def test_field_lookup(self):
+        descriptor = ClusterObjects.GetCompiledDescriptor(TestClusterObjects.StructWithEmbeddedStructAndString)
+        self.assertEqual(descriptor.GetFieldByTag(1).Label, 'Y')
+        self.assertEqual(descriptor.GetFieldByLabel('Z').Tag, 2)
+        self.assertIsNone(descriptor.GetFieldByTag(3))
+        self.assertIsNone(descriptor.GetFieldByLabel('W'))
+
+    def test_field_plan(self):
+        plan = ClusterObjects.ClusterObjectFieldDescriptor(
+            Type=typing.Union[None, ClusterObjects.Nullable, typing.List[TestClusterObjects.C]]).plan
+        self.assertTrue(plan.nullable)
+        self.assertTrue(plan.optional)
+        self.assertTrue(plan.isList)
+        self.assertTrue(plan.isStruct)
+        self.assertIs(plan.elementType, TestClusterObjects.C)
+
+    def test_direct_construction(self):
+        data = {0: 'test-str', 1: {0: uint(12), 1: 34}, 2: b'byte-string', 3: 'unknown-field'}
+        res = TestClusterObjects.StructWithEmbeddedStructAndString.FromTagDict(data)
+        self.assertEqual(res, TestClusterObjects.StructWithEmbeddedStructAndString.FromTagDict(data, strict=True))
+        self.assertIsInstance(res.Y, TestClusterObjects.C)
+
+        res = TestClusterObjects.StructWithEmbeddedStructAndString.FromTagDict({1: {1: 34}})
+        self.assertEqual(res, TestClusterObjects.StructWithEmbeddedStructAndString(Y=TestClusterObjects.C(Y=34)))
+
+    def test_decode_errors(self):
+        descriptor = ClusterObjects.GetCompiledDescriptor(TestClusterObjects.StructWithEmbeddedStructAndString)
+        with self.assertRaises(ValueError):
+            descriptor.TagDictToLabelDict('', {1: 5})
+        with self.assertRaises(ValueError):
+            descriptor.TagDictToLabelDict('', {0: 5})
+
+    def test_object_encoding(self):
+        C = TestClusterObjects.C
+        SWAOSWA = TestClusterObjects.StructWithArrayOfStructWithArray
+        data = SWAOSWA(X=['a', 'b'], Y=[C(X=1, Y=-2), C(X=3, Y=4)], Z=[TestClusterObjects.StructWithArray(X=[5, 6], Y=7)],
+                       W=[SWAOSWA(X=['c'], Y=[], Z=[], W=[])])
+        descriptor = ClusterObjects.GetCompiledDescriptor(SWAOSWA)
+        self.assertEqual(data.ToTLV(), descriptor.DictToTLV(asdict(data)))
+
+        # Structs given as label dicts are still accepted.
+        mixed = SWAOSWA(X=['a', 'b'], Y=[{'X': 1, 'Y': -2}, C(X=3, Y=4)], Z=[{'X': [5, 6], 'Y': 7}],
+                        W=[{'X': ['c'], 'Y': [], 'Z': [], 'W': []}])
+        self.assertEqual(mixed.ToTLV(), data.ToTLV())
+
+    def test_encode_errors(self):
+        with self.assertRaisesRegex(ValueError, r'\[1\]\.X expected'):
+            TestClusterObjects.StructWithArray(X=[1, 'x'], Y=0).ToTLV()
+        with self.assertRaisesRegex(ValueError, 'expected a struct'):
+            TestClusterObjects.StructWithEmbeddedStructAndString(X='', Y=5, Z=b'').ToTLV()
+
+
 class TestAttributeDescriptor(unittest.TestCase):
     class IntAttribute(ClusterObjects.ClusterAttributeDescriptor):
         @chip.ChipUtility.classproperty
@@ -0,0 +1,134 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from chip.commissioning import pipeline
+from chip.exceptions import ChipStackError
+
+
+class FakeController:
+    ''' Commissions one device at a time, like a device controller. Payloads in failures always fail, the ones in
+        transient only fail the first time, and the ones in hang never complete.
+    '''
+
+    def __init__(self, name, failures=(), transient=(), hang=()):
+        self.name = name
+        self.commissioningStageTimes = {}
+        self.ExpireSessions = mock.Mock()
+        self._failures = failures
+        self._transient = set(transient)
+        self._hang = hang
+        self._busy = False
+        self.commissioned = []
+
+    async def CommissionWithCode(self, setupPayload, nodeid, discoveryType):
+        assert not self._busy, "concurrent commissioning on a controller"
+        self._busy = True
+        try:
+            self.commissioningStageTimes = {'start': time.monotonic()}
+            if setupPayload in self._hang:
+                await asyncio.sleep(60)
+            await asyncio.sleep(0.01)
+            if setupPayload == 'pase failure':
+                raise ChipStackError(0x32)
+            self.commissioningStageTimes['pase'] = time.monotonic()
+            await asyncio.sleep(0.01)
+            if setupPayload in self._transient:
+                self._transient.remove(setupPayload)
+                raise ChipStackError(0x32)
+            if setupPayload in self._failures:
+                raise ChipStackError(0x32)
+            self.commissioned.append(nodeid)
+            return nodeid
+        finally:
+            self._busy = False
+
+
+def _jobs(*payloads):
+    return [pipeline.CommissioningJob(payload, 100 + index) for index, payload in enumerate(payloads)]
+
+
+class TestCommissioningPipeline(unittest.IsolatedAsyncioTestCase):
+    async def test_parallel(self):
+        controllers = [FakeController(f'controller {index}') for index in range(3)]
+        seen = []
+        report = await pipeline.CommissioningPipeline(controllers).run(_jobs(*['code'] * 7), on_result=seen.append)
+
+        self.assertEqual([result.node_id for result in report.results], list(range(100, 107)))
+        self.assertEqual(len(report.succeeded), 7)
+        self.assertEqual(len(seen), 7)
+        self.assertEqual(sorted(len(controller.commissioned) for controller in controllers), [2, 2, 3])
+        # Serially, 7 commissionings would take at least 140ms.
+        self.assertLess(report.elapsed_seconds, 0.12)
+
+        stats = report.stage_statistics()
+        self.assertEqual(set(stats), {pipeline.STAGE_QUEUED, pipeline.STAGE_PASE, pipeline.STAGE_COMMISSIONING,
+                                      pipeline.STAGE_TOTAL})
+        self.assertEqual(stats[pipeline.STAGE_PASE]['count'], 7)
+        self.assertGreaterEqual(stats[pipeline.STAGE_PASE]['min'], 0.01)
+
+    async def test_concurrency(self):
+        controllers = [FakeController(f'controller {index}') for index in range(3)]
+        await pipeline.CommissioningPipeline(controllers, concurrency=1).run(_jobs('code', 'code'))
+        self.assertEqual([len(controller.commissioned) for controller in controllers], [2, 0, 0])
+
+        with self.assertRaises(ValueError):
+            pipeline.CommissioningPipeline([])
+
+    async def test_failures(self):
+        controllers = [FakeController('controller', failures=('failure',))]
+        report = await pipeline.CommissioningPipeline(controllers).run(_jobs('code', 'pase failure', 'failure'))
+
+        self.assertEqual([result.failed_stage for result in report.results],
+                         [None, pipeline.STAGE_PASE, pipeline.STAGE_COMMISSIONING])
+        self.assertIsInstance(report.results[1].error, ChipStackError)
+        self.assertNotIn(pipeline.STAGE_COMMISSIONING, report.results[1].stages)
+        self.assertEqual(len(report.failed), 2)
+
+    async def test_retries(self):
+        controllers = [FakeController('flaky', transient=('flaky',))]
+        report = await pipeline.CommissioningPipeline(controllers, retries=1).run(_jobs('flaky', 'code'))
+        self.assertEqual(len(report.succeeded), 2)
+        self.assertEqual([result.attempts for result in report.results], [2, 1])
+
+        report = await pipeline.CommissioningPipeline(controllers, retries=2).run(_jobs('pase failure'))
+        self.assertEqual(report.results[0].attempts, 3)
+        self.assertEqual(report.results[0].failed_stage, pipeline.STAGE_PASE)
+
+    async def test_timeout(self):
+        controllers = [FakeController('stuck', hang=('hang',)), FakeController('good')]
+        report = await pipeline.CommissioningPipeline(controllers, timeout_seconds=0.05).run(
+            _jobs('hang', 'code', 'code', 'code'))
+
+        self.assertIsInstance(report.results[0].error, asyncio.TimeoutError)
+        self.assertEqual(report.results[0].failed_stage, pipeline.STAGE_PASE)
+        controllers[0].ExpireSessions.assert_called_once_with(100)
+        # The stuck controller is not used anymore.
+        self.assertEqual(len(report.succeeded), 3)
+        self.assertEqual(len(controllers[1].commissioned), 3)
+
+        # Once no controller is left, the remaining jobs fail.
+        report = await pipeline.CommissioningPipeline(controllers[:1], timeout_seconds=0.05).run(_jobs('hang', 'code'))
+        self.assertEqual([result.failed_stage for result in report.results], [pipeline.STAGE_PASE, pipeline.STAGE_QUEUED])
+
+
+if __name__ == '__main__':
+    unittest.main()
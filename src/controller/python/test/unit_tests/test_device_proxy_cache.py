@@ -0,0 +1,213 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import builtins
+import threading
+import unittest
+from ctypes import c_void_p
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip import ChipDeviceCtrl
+from chip.clusters import Attribute, Command
+from chip.exceptions import ChipStackError
+from chip.interaction_model import InteractionModelError, Status
+from chip.native import PyChipError
+
+_SUCCESS = PyChipError.from_code(0)
+_NOT_FOUND = PyChipError.from_code(0x32)
+
+
+class FakeChipStack:
+    ''' Runs the work posted to the CHIP thread right away, counting the posted tasks.
+    '''
+
+    def __init__(self):
+        self.postedTasks = 0
+        self.subscriptions = set()
+
+    def Call(self, callFunct, timeoutMs=None):
+        self.postedTasks += 1
+        return callFunct()
+
+    async def CallAsyncWithResult(self, callFunct, timeoutMs=None):
+        self.postedTasks += 1
+        return callFunct()
+
+    async def CallAsync(self, callFunct, timeoutMs=None):
+        (await self.CallAsyncWithResult(callFunct, timeoutMs)).raise_on_error()
+
+    def PostTaskOnChipThread(self, callFunct):
+        callFunct()
+
+    def RegisterSubscription(self, subscription):
+        self.subscriptions.add(subscription)
+
+    def UnregisterSubscription(self, subscription):
+        self.subscriptions.remove(subscription)
+
+
+class FakeDeviceControllerLib:
+    ''' Hands out a new device proxy for every connection, whose session stays active until sessionActive is
+        cleared. lib stands for the native library.
+    '''
+
+    def __init__(self):
+        self.sessionActive = True
+        self.connections = 0
+        self.lib = mock.Mock()
+        self.lib.pychip_GetDeviceBeingCommissioned.return_value = _NOT_FOUND
+        self.lib.pychip_TestCommissionerUsed.return_value = False
+        for name in ('pychip_ExpireSessions', 'pychip_DeviceController_MarkSessionDefunct',
+                     'pychip_DeviceController_MarkSessionForEviction', 'pychip_DeviceController_DeleteDeviceController'):
+            getattr(self.lib, name).return_value = _SUCCESS
+        self.lib.pychip_IsActiveSession.side_effect = self._isActiveSession
+        self.lib.pychip_GetConnectedDeviceByNodeId.side_effect = self._getConnectedDevice
+
+    def _isActiveSession(self, deviceProxy, isActiveSession):
+        isActiveSession.contents.value = self.sessionActive
+        return _SUCCESS
+
+    def _getConnectedDevice(self, devCtrl, nodeid, closure, callback, payloadCapability):
+        self.connections += 1
+        self.sessionActive = True
+        closure.value.deviceAvailable(0x1000 + self.connections, _SUCCESS)
+        return _SUCCESS
+
+
+def makeController(testCase: unittest.TestCase):
+    chipStack = FakeChipStack()
+    dmLib = FakeDeviceControllerLib()
+
+    def initLib(self):
+        self._dmLib = dmLib.lib
+
+    for patcher in (mock.patch.object(builtins, 'chipStack', chipStack, create=True),
+                    mock.patch.object(ChipDeviceCtrl.ChipDeviceControllerBase, '_InitLib', initLib)):
+        patcher.start()
+        testCase.addCleanup(patcher.stop)
+
+    controller = ChipDeviceCtrl.ChipDeviceControllerBase('test')
+    controller._set_dev_ctrl(c_void_p(1), c_void_p(2))
+    controller._finish_init()
+    testCase.addCleanup(controller.Shutdown)
+    return controller, chipStack, dmLib
+
+
+class TestDeviceProxyCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.controller, self.chipStack, self.dmLib = makeController(self)
+
+    def assertStats(self, hits, misses, invalidations):
+        stats = self.controller.deviceProxyCacheStats
+        self.assertEqual((stats.hits, stats.misses, stats.invalidations), (hits, misses, invalidations))
+
+    async def test_hit(self):
+        device = await self.controller.GetConnectedDevice(1)
+        self.assertEqual(device.deviceProxy.value, 0x1001)
+        postedTasks = self.chipStack.postedTasks
+
+        self.assertIs(await self.controller.GetConnectedDevice(1), device)
+        # A hit only checks the session, with an asynchronous call.
+        self.assertEqual(self.chipStack.postedTasks, postedTasks + 1)
+        self.assertEqual(self.dmLib.connections, 1)
+        self.assertStats(hits=1, misses=1, invalidations=0)
+
+    async def test_miss(self):
+        first = await self.controller.GetConnectedDevice(1)
+        self.assertIsNot(await self.controller.GetConnectedDevice(2), first)
+        # Each payload capability has its own proxy.
+        self.assertIsNot(await self.controller.GetConnectedDevice(
+            1, payloadCapability=ChipDeviceCtrl.TransportPayloadCapability.LARGE_PAYLOAD), first)
+        self.assertEqual(self.dmLib.connections, 3)
+        self.assertStats(hits=0, misses=3, invalidations=0)
+
+    async def test_inactive_session(self):
+        first = await self.controller.GetConnectedDevice(1)
+        self.dmLib.sessionActive = False
+        self.assertIsNot(await self.controller.GetConnectedDevice(1), first)
+        self.assertStats(hits=0, misses=2, invalidations=1)
+
+    async def test_session_management_invalidates(self):
+        for invalidate in (self.controller.ExpireSessions, self.controller.MarkSessionDefunct,
+                           self.controller.MarkSessionForEviction, self.controller.InvalidateDeviceProxyCache):
+            with self.subTest(invalidate=invalidate.__name__):
+                first = await self.controller.GetConnectedDevice(1)
+                other = await self.controller.GetConnectedDevice(2)
+                invalidate(1)
+                self.assertIsNot(await self.controller.GetConnectedDevice(1), first)
+                self.assertIs(await self.controller.GetConnectedDevice(2), other)
+
+    async def test_commissioning_complete_invalidates(self):
+        first = await self.controller.GetConnectedDevice(1)
+        async with self.controller._commissioning_context as ctx:
+            # The commissioning complete callback comes from the CHIP thread.
+            thread = threading.Thread(target=self.controller.cbHandleCommissioningCompleteFunct, args=(1, _SUCCESS))
+            thread.start()
+            thread.join()
+            self.assertEqual(await asyncio.wrap_future(ctx.future), 1)
+        self.assertIsNot(await self.controller.GetConnectedDevice(1), first)
+        self.assertStats(hits=0, misses=2, invalidations=1)
+
+    async def test_failed_read_invalidates(self):
+        first = await self.controller.GetConnectedDevice(1)
+
+        def read(transaction, **kwargs):
+            transaction._future.set_exception(ChipStackError(0x32))
+            return _SUCCESS
+
+        with mock.patch.object(Attribute, 'Read', read):
+            with self.assertRaises(ChipStackError):
+                await self.controller.Read(1, [(0, Clusters.BasicInformation.Attributes.VendorName)])
+        self.assertIsNot(await self.controller.GetConnectedDevice(1), first)
+
+    async def test_failed_write_invalidates(self):
+        first = await self.controller.GetConnectedDevice(1)
+
+        def writeAttributes(future, eventLoop, device, attributes, **kwargs):
+            future.set_exception(ChipStackError(0x32))
+            return _SUCCESS
+
+        with mock.patch.object(Attribute, 'WriteAttributes', writeAttributes):
+            with self.assertRaises(ChipStackError):
+                await self.controller.WriteAttribute(1, [(0, Clusters.BasicInformation.Attributes.NodeLabel('label'))])
+        self.assertIsNot(await self.controller.GetConnectedDevice(1), first)
+
+    async def test_failed_command_invalidates(self):
+        error = None
+
+        async def sendCommand(future, eventLoop, responseType, device, commandPath, payload, **kwargs):
+            future.set_exception(error)
+            return _SUCCESS
+
+        with mock.patch.object(Command, 'SendCommand', sendCommand):
+            # A status returned by the node means the session works.
+            first = await self.controller.GetConnectedDevice(1)
+            error = InteractionModelError(Status.UnsupportedCommand)
+            with self.assertRaises(InteractionModelError):
+                await self.controller.SendCommand(1, 1, Clusters.OnOff.Commands.On())
+            self.assertIs(await self.controller.GetConnectedDevice(1), first)
+
+            error = ChipStackError(0x32)
+            with self.assertRaises(ChipStackError):
+                await self.controller.SendCommand(1, 1, Clusters.OnOff.Commands.On())
+            self.assertIsNot(await self.controller.GetConnectedDevice(1), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import builtins
+import sys
+import threading
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.interaction_model import Status
+from chip.tlv import TLVWriter
+
+_SHUT_DOWN = (Clusters.BasicInformation.id, Clusters.BasicInformation.Events.ShutDown.event_id)
+_START_UP = (Clusters.BasicInformation.id, Clusters.BasicInformation.Events.StartUp.event_id)
+
+
+def _header(number, event=_SHUT_DOWN, endpoint=0, priority=Attribute.EventPriority.INFO):
+    return Attribute.EventHeader(EndpointId=endpoint, ClusterId=event[0], EventId=event[1], EventNumber=number,
+                                 Priority=priority)
+
+
+def _event(number, **kwargs):
+    return Attribute.EventReadResult(Header=_header(number, **kwargs), Status=Status.Success)
+
+
+class TestEventStore(unittest.TestCase):
+    def test_unbounded(self):
+        store = Attribute.EventStore()
+        self.assertIsNone(store.nextEventNumber)
+        for number in range(100):
+            self.assertTrue(store.Append(_event(number)))
+        self.assertEqual(len(store), 100)
+        self.assertEqual(store.nextEventNumber, 100)
+        self.assertEqual(store.droppedEvents, 0)
+
+    def test_capacity(self):
+        store = Attribute.EventStore(capacity=3)
+        for number in range(5):
+            store.Append(_event(number, event=_SHUT_DOWN if number % 2 else _START_UP))
+
+        self.assertEqual([event.Header.EventNumber for event in store], [2, 3, 4])
+        self.assertEqual(store.droppedEvents, 2)
+        self.assertIsNone(store.Get(1))
+        self.assertEqual(store.Get(3).Header.EventNumber, 3)
+        self.assertEqual(store.nextEventNumber, 5)
+        self.assertEqual([event.Header.EventNumber for event in store.Query(0, *_START_UP)], [2, 4])
+
+        with self.assertRaises(ValueError):
+            Attribute.EventStore(capacity=0)
+
+    def test_age(self):
+        store = Attribute.EventStore(maxAgeSeconds=10)
+        with mock.patch.object(Attribute.time, 'monotonic', return_value=100.0) as monotonic:
+            store.Append(_event(1))
+            monotonic.return_value = 105.0
+            store.Append(_event(2))
+            monotonic.return_value = 112.0
+            self.assertEqual([event.Header.EventNumber for event in store], [2])
+            monotonic.return_value = 120.0
+            self.assertEqual(len(store), 0)
+        self.assertEqual(store.droppedEvents, 2)
+        self.assertEqual(store.nextEventNumber, 3)
+
+    def test_query(self):
+        store = Attribute.EventStore()
+        store.Append(_event(1, priority=Attribute.EventPriority.CRITICAL))
+        store.Append(_event(2, endpoint=1))
+        store.Append(_event(3, event=_START_UP))
+        store.Append(Attribute.EventReadResult(Header=None, Status=Status.UnsupportedEvent))
+
+        def numbers(**kwargs):
+            return [event.Header.EventNumber for event in store.Query(**kwargs)]
+
+        self.assertEqual(len(store.Query()), 4)
+        self.assertEqual(numbers(priority=Attribute.EventPriority.CRITICAL), [1])
+        self.assertEqual(numbers(endpointId=0), [1, 3])
+        self.assertEqual(numbers(clusterId=_SHUT_DOWN[0], eventId=_SHUT_DOWN[1]), [1, 2])
+        self.assertEqual(numbers(endpointId=0, clusterId=_SHUT_DOWN[0], eventId=_SHUT_DOWN[1]), [1])
+        self.assertEqual(numbers(minEventNumber=2), [2, 3])
+
+        store.Clear()
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.nextEventNumber, 4)
+
+    def test_duplicates(self):
+        store = Attribute.EventStore()
+        self.assertTrue(store.Append(_event(1)))
+        self.assertFalse(store.Append(_event(1)))
+        self.assertEqual(len(store), 1)
+
+    def test_concurrent_append_and_query(self):
+        # Events are appended from the CHIP thread while the store is queried from the asyncio thread.
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        store = Attribute.EventStore(capacity=50, maxAgeSeconds=0.001)
+        done = threading.Event()
+        errors = []
+
+        def append():
+            try:
+                for number in range(20000):
+                    store.Append(_event(number, event=_SHUT_DOWN if number % 2 else _START_UP,
+                                        priority=Attribute.EventPriority(number % 3)))
+            except Exception as ex:
+                errors.append(ex)
+            finally:
+                done.set()
+
+        def query():
+            try:
+                while not done.is_set():
+                    store.Query(endpointId=0, clusterId=_SHUT_DOWN[0], eventId=_SHUT_DOWN[1])
+                    store.Query(priority=Attribute.EventPriority.INFO)
+                    store.Query(minEventNumber=10)
+                    store.Get(10)
+                    len(store)
+                    list(store)
+            except Exception as ex:
+                errors.append(ex)
+
+        threads = [threading.Thread(target=append), threading.Thread(target=query)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(store.nextEventNumber, 20000)
+        stored = list(store)
+        self.assertEqual(store.droppedEvents + len(stored), 20000)
+        self.assertEqual(sum(len(store.Query(priority=priority)) for priority in Attribute.EventPriority), len(stored))
+
+
+class TestTransactionEventStore(unittest.IsolatedAsyncioTestCase):
+    async def test_subscription(self):
+        patcher = mock.patch.object(builtins, 'chipStack', mock.Mock(), create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        store = Attribute.EventStore(capacity=2)
+        loop = asyncio.get_running_loop()
+        transaction = Attribute.AsyncReadTransaction(loop.create_future(), loop, None, False, eventStore=store)
+        transaction._handleSubscriptionEstablished(1)
+        subscription = transaction.GetSubscriptionHandler()
+        callback = mock.Mock()
+        subscription.SetEventUpdateCallback(callback)
+        self.assertIs(subscription.eventStore, store)
+
+        writer = TLVWriter()
+        writer.put(None, {})
+        for number in (1, 2, 3, 3):
+            transaction.handleEventData(_header(number), Attribute.EventPath(ClusterId=_SHUT_DOWN[0], EventId=_SHUT_DOWN[1]),
+                                        bytes(writer.encoding), Status.Success)
+
+        self.assertEqual(callback.call_count, 3)
+        self.assertEqual([event.Header.EventNumber for event in subscription.GetEvents()], [2, 3])
+        self.assertEqual(store.nextEventNumber, 4)
+
+    async def test_read_response(self):
+        store = Attribute.EventStore()
+        store.Append(_event(0))
+        store.Append(_event(1))
+        loop = asyncio.get_running_loop()
+        transaction = Attribute.AsyncReadTransaction(loop.create_future(), loop, None, False, eventStore=store)
+
+        writer = TLVWriter()
+        writer.put(None, {})
+        for number in (1, 2):
+            transaction.handleEventData(_header(number), Attribute.EventPath(ClusterId=_SHUT_DOWN[0], EventId=_SHUT_DOWN[1]),
+                                        bytes(writer.encoding), Status.Success)
+
+        # The response holds the events of this read, including the one the store already had, and none other.
+        self.assertEqual([event.Header.EventNumber for event in transaction.GetReadResponse().events], [1, 2])
+        self.assertEqual([event.Header.EventNumber for event in store], [0, 1, 2])
+
+        transaction = Attribute.AsyncReadTransaction(loop.create_future(), loop, None, False, eventStore=store)
+        self.assertEqual(transaction.GetReadResponse().events, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
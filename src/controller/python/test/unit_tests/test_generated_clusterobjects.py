@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+import textwrap
 import unittest
 
 import chip.clusters as Clusters
@@ -16,6 +20,7 @@ class TestGeneratedClusterObjects(unittest.TestCase):
     def CheckData(self, expected):
         tlv = expected.ToTLV()
         actual = expected.FromTLV(tlv)
+        self.assertEqual(expected.FromTLV(tlv, strict=True), actual)
 
         if (enable_debug):
             print("Expected Data:")
@@ -105,5 +110,50 @@ class TestGeneratedClusterObjects(unittest.TestCase):
         self.CheckData(data)
 
 
+class TestLazyLoading(unittest.TestCase):
+    def RunInFreshInterpreter(self, code: str):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, '-c', textwrap.dedent(code)], env=env, check=True)
+
+    def test_clusters_load_on_first_access(self):
+        self.RunInFreshInterpreter('''
+            import sys
+            import chip.clusters as Clusters
+            from chip.clusters import ClusterObjects
+
+            def loaded():
+                return {name.rsplit('.', 1)[1] for name in sys.modules if name.startswith('chip.clusters.definitions.')}
+
+            assert loaded() <= {'Globals'}, loaded()
+            assert Clusters.OnOff.id == 6
+            assert loaded() == {'Globals', 'OnOff'}, loaded()
+
+            assert ClusterObjects.ALL_CLUSTERS[Clusters.Descriptor.id] is Clusters.Descriptor
+            assert 0x0028 in ClusterObjects.ALL_ATTRIBUTES
+            assert ClusterObjects.ALL_EVENTS.get(0x0028) is not None
+            assert loaded() == {'Globals', 'OnOff', 'Descriptor', 'BasicInformation'}, loaded()
+
+            from chip.clusters import Attribute
+            assert Attribute._GetAttributeType(0x0008, 0x0000) is Clusters.LevelControl.Attributes.CurrentLevel
+            assert Attribute._GetAttributeType(0x0006, 0xFFF1FC00) is None
+            assert Attribute._GetEventType(0x0003, 0x0000) is None
+            assert loaded() == {'Globals', 'OnOff', 'Descriptor', 'BasicInformation', 'LevelControl'}, loaded()
+            assert 0xFFF1FC00 not in ClusterObjects.ALL_CLUSTERS
+
+            assert len(ClusterObjects.ALL_CLUSTERS) == len(Clusters.Objects.__all__) - 1
+            assert 'UnitTesting' in dir(Clusters)
+        ''')
+
+    def test_registries(self):
+        self.assertIs(Clusters.ClusterObjects.ALL_CLUSTERS[Clusters.OnOff.id], Clusters.OnOff)
+        self.assertIs(Clusters.ClusterObjects.ALL_ATTRIBUTES[Clusters.OnOff.id][Clusters.OnOff.Attributes.OnTime.attribute_id],
+                      Clusters.OnOff.Attributes.OnTime)
+        self.assertIn(Clusters.UnitTesting, Clusters.ClusterObjects.ALL_CLUSTERS.values())
+        with self.assertRaises(KeyError):
+            Clusters.ClusterObjects.ALL_CLUSTERS[0xFFF1FC00]
+        with self.assertRaises(AttributeError):
+            Clusters.NotACluster
+
+
 if __name__ == '__main__':
     unittest.main()
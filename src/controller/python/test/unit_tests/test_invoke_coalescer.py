@@ -0,0 +1,109 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.clusters import Command
+from chip.interaction_model import InteractionModelError, Status
+
+
+class TestInvokeCoalescer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.target = Command.InvokeTarget(deviceProxy=mock.sentinel.device, maxPathsPerInvoke=3)
+        self.connect = mock.AsyncMock(return_value=self.target)
+        self.coalescer = Command.InvokeCoalescer(self.connect, windowSeconds=0.01)
+        self.batches = []
+        self.singles = []
+        self.failures = {}
+
+        async def sendBatchCommands(future, eventLoop, device, commands, **kwargs):
+            self.batches.append(commands)
+            future.set_result([self.failures.get(command.EndpointId) for command in commands])
+            return mock.Mock()
+
+        async def sendCommand(future, eventLoop, responseType, device, commandPath, payload, **kwargs):
+            self.singles.append(commandPath)
+            future.set_result(None)
+            return mock.Mock()
+
+        for name, fake in (('SendBatchCommands', sendBatchCommands), ('SendCommand', sendCommand)):
+            patcher = mock.patch.object(Command, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def send(self, endpoint, command=None, **kwargs):
+        return self.coalescer.SendCommand(1, endpoint, command or Clusters.OnOff.Commands.On(), **kwargs)
+
+    async def test_batches(self):
+        self.failures[2] = InteractionModelError(Status.UnsupportedEndpoint)
+        results = await asyncio.gather(*(self.send(endpoint) for endpoint in range(1, 6)), return_exceptions=True)
+
+        self.assertEqual([len(batch) for batch in self.batches], [3, 2])
+        self.assertEqual(self.singles, [])
+        self.assertEqual(results[0], None)
+        self.assertIsInstance(results[1], InteractionModelError)
+        self.assertEqual(results[1].status, Status.UnsupportedEndpoint)
+        self.assertEqual(results[2:], [None] * 3)
+        self.connect.assert_awaited_with(1, None, 0)
+
+    async def test_full_batch_sent_without_window(self):
+        await self.send(1)
+        self.coalescer._windowSeconds = 60
+        await asyncio.wait_for(asyncio.gather(*(self.send(endpoint) for endpoint in range(1, 4))), 1)
+        self.assertEqual([len(batch) for batch in self.batches], [3])
+
+    async def test_split(self):
+        # The same path can't be repeated in an invoke.
+        await asyncio.gather(self.send(1), self.send(1), self.send(1, Clusters.OnOff.Commands.Off()))
+        self.assertEqual([[command.EndpointId for command in batch] for batch in self.batches], [[1, 1]])
+        self.assertEqual(len(self.singles), 1)
+
+        # Neither can a batch exceed the size of a message over MRP.
+        self.batches.clear()
+        self.singles.clear()
+        self.target.maxPathsPerInvoke = 100
+        label = Clusters.UnitTesting.Commands.TestEmitTestEventRequest()
+        await asyncio.gather(*(self.send(endpoint, label) for endpoint in range(40)))
+        self.assertGreater(len(self.batches), 1)
+        self.assertEqual(sum(len(batch) for batch in self.batches) + len(self.singles), 40)
+
+    async def test_no_batching(self):
+        self.target.maxPathsPerInvoke = 1
+        await asyncio.gather(*(self.send(endpoint) for endpoint in range(3)))
+        self.assertEqual(self.batches, [])
+        self.assertEqual(len(self.singles), 3)
+
+    async def test_separate_parameters(self):
+        await asyncio.gather(self.send(1), self.send(2, interactionTimeoutMs=1000),
+                             self.coalescer.SendCommand(2, 1, Clusters.OnOff.Commands.On()))
+        self.assertEqual(self.batches, [])
+        self.assertEqual(len(self.singles), 3)
+
+    async def test_errors(self):
+        with self.assertRaises(InteractionModelError):
+            await self.send(1, Clusters.UnitTesting.Commands.TestNullableOptionalRequest(), timedRequestTimeoutMs=0)
+
+        self.connect.side_effect = TimeoutError()
+        results = await asyncio.gather(self.send(1), self.send(2), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, TimeoutError) for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
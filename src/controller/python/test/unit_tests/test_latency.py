@@ -0,0 +1,137 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import ctypes
+import json
+import os
+import tempfile
+import unittest
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.interaction_model import Status
+from chip.tlv import TLVWriter
+from chip.tracing import latency
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles(self):
+        histogram = latency.LatencyHistogram()
+        self.assertEqual(histogram.Percentile(50), 0.0)
+        for ms in range(1, 1001):
+            histogram.Record(ms / 1000)
+
+        self.assertEqual(histogram.count, 1000)
+        self.assertAlmostEqual(histogram.mean, 0.5005)
+        self.assertEqual(histogram.min, 0.001)
+        self.assertEqual(histogram.max, 1.0)
+        for percentile in (1, 50, 90, 99):
+            self.assertAlmostEqual(histogram.Percentile(percentile), percentile / 100, delta=percentile / 100 * 0.05)
+        self.assertEqual(histogram.Percentile(100), 1.0)
+        self.assertEqual(set(histogram.ToDict()), {'count', 'mean', 'min', 'max', 'p50', 'p90', 'p99', 'p99.9'})
+
+
+class TestLatencyRecorder(unittest.TestCase):
+    def tearDown(self):
+        latency.StopLatencyRecording()
+
+    def test_disabled(self):
+        self.assertIsNone(latency.GetLatencyRecorder())
+        with latency.Trace('read', 1, [6]) as span:
+            self.assertIsNone(span)
+            with latency.Phase(span, 'session'):
+                pass
+
+    def test_recording(self):
+        recorder = latency.StartLatencyRecording()
+        self.assertIs(latency.GetLatencyRecorder(), recorder)
+
+        with latency.Trace('read', 1, [6, None, 8]) as span:
+            with latency.Phase(span, 'session'):
+                pass
+            span.Mark('firstReport')
+            span.Add('decode', 0.25)
+            span.Add('decode', 0.25)
+        with self.assertRaises(TimeoutError):
+            with latency.Trace('invoke', 2, [6]):
+                raise TimeoutError()
+
+        self.assertEqual(recorder.Histogram('read', 'decode').count, 1)
+        self.assertEqual(recorder.Histogram('read', 'decode').max, 0.5)
+        self.assertEqual(recorder.Histogram('read', 'session', nodeid=1).count, 1)
+        self.assertIsNone(recorder.Histogram('read', nodeid=2))
+        self.assertEqual(recorder.Histogram('invoke', nodeid=2).count, 1)
+        self.assertEqual(recorder.Histogram('read', clusterId=8).count, 1)
+        self.assertEqual(recorder.Histogram('invoke', clusterId=6).count, 1)
+
+        snapshot = recorder.Snapshot()
+        self.assertIn('read/total', snapshot['overall'])
+        self.assertIn('0x0000000000000002/invoke/total', snapshot['nodes'])
+        self.assertIn('0x00000006/read/firstReport', snapshot['clusters'])
+        self.assertEqual(snapshot['errors'], {'invoke': 1})
+        json.dumps(snapshot)
+
+        self.assertIs(latency.StopLatencyRecording(), recorder)
+        with latency.Trace('read', 1) as span:
+            self.assertIsNone(span)
+        self.assertEqual(len(recorder.spans), 2)
+
+    def test_export_trace_events(self):
+        recorder = latency.StartLatencyRecording(maxSpans=2)
+        for nodeid in range(3):
+            with latency.Trace('write', nodeid, [6]):
+                pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'latency.json')
+            recorder.ExportTraceEvents(path)
+            with open(path) as file:
+                events = json.load(file)['traceEvents']
+
+        self.assertEqual([event['tid'] for event in events], ['node 0x0000000000000001', 'node 0x0000000000000002'])
+        self.assertEqual(events[0]['name'], 'write')
+        self.assertEqual(events[0]['args']['clusters'], ['0x00000006'])
+        self.assertIn('totalMs', events[0]['args'])
+
+
+class TestTransactionPhases(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        latency.StopLatencyRecording()
+
+    async def test_read(self):
+        recorder = latency.StartLatencyRecording()
+        loop = asyncio.get_running_loop()
+        writer = TLVWriter()
+        writer.put(None, True)
+
+        with latency.Trace('read', 1, [Clusters.OnOff.id]) as span:
+            transaction = Attribute.AsyncReadTransaction(loop.create_future(), loop, None, False, span=span)
+            # The native side holds a reference on the transaction, released when it is done.
+            ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
+            transaction.handleAttributeData(
+                Attribute.AttributePath.from_attribute(EndpointId=1, Attribute=Clusters.OnOff.Attributes.OnOff), 1,
+                Status.Success, bytes(writer.encoding))
+            transaction.handleDone()
+            await transaction._future
+
+        self.assertEqual(set(recorder.spans[0].phases), {'firstReport', 'decode', 'loopHop', 'total'})
+        self.assertEqual(recorder.Histogram('read', 'decode', clusterId=Clusters.OnOff.id).count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import ctypes
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip import ChipDeviceCtrl
+from chip.clusters import Attribute
+from chip.exceptions import ChipStackError
+from chip.native import PyChipError
+from test_device_proxy_cache import makeController
+
+_SUCCESS = PyChipError.from_code(0)
+_VENDOR_NAME = [(0, Clusters.BasicInformation.Attributes.VendorName)]
+
+
+class FakeReadClients:
+    ''' Stands for the ReadClients of the native library: a read completes after delay, unless its node is in failures
+        (it fails) or in hang (it never completes). A subscription is established after delay.
+    '''
+
+    def __init__(self, delay=0.01, failures=(), hang=()):
+        self.delay = delay
+        self.failures = failures
+        self.hang = hang
+        self.inFlight = {}
+        self.maxInFlight = 0
+        self.maxInFlightPerNode = 0
+        self.aborted = []
+        self._transactions = {}
+        self._nextReadClient = 1
+
+    def Read(self, transaction, device, subscriptionParameters=None, **kwargs):
+        nodeid = device.value
+        readClient = self._nextReadClient
+        self._nextReadClient += 1
+        self._transactions[readClient] = (nodeid, transaction)
+        self.inFlight[nodeid] = self.inFlight.get(nodeid, 0) + 1
+        self.maxInFlight = max(self.maxInFlight, sum(self.inFlight.values()))
+        self.maxInFlightPerNode = max(self.maxInFlightPerNode, self.inFlight[nodeid])
+
+        # Like pychip_ReadClient_Read, the transaction is kept alive until it is done.
+        ctypes.pythonapi.Py_IncRef(ctypes.py_object(transaction))
+        transaction.SetClientObjPointers(readClient)
+        loop = asyncio.get_running_loop()
+        if subscriptionParameters is not None:
+            loop.call_later(self.delay, transaction._handleSubscriptionEstablished, readClient)
+        elif nodeid not in self.hang:
+            loop.call_later(self.delay, self._complete, readClient)
+        return _SUCCESS
+
+    def _complete(self, readClient):
+        nodeid, transaction = self._transactions[readClient]
+        if nodeid in self.failures and not transaction._future.done():
+            transaction._future.set_exception(ChipStackError(0x32))
+        self._done(readClient)
+
+    def _done(self, readClient):
+        nodeid, transaction = self._transactions.pop(readClient)
+        self.inFlight[nodeid] -= 1
+        transaction.handleDone()
+
+    def Abort(self, transaction):
+        # Like pychip_ReadClient_Abort, the read is looked up by its transaction.
+        for readClient, (nodeid, readTransaction) in list(self._transactions.items()):
+            if readTransaction is transaction:
+                self.aborted.append(nodeid)
+                self._done(readClient)
+
+
+class TestReadMany(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.controller, self.chipStack, _ = makeController(self)
+        self.readClients = FakeReadClients()
+        # Errors raised by the callbacks scheduled on the loop, e.g. the ones of the fake ReadClients.
+        self.loopErrors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: self.loopErrors.append(context))
+
+        async def getConnectedDevice(nodeid, **kwargs):
+            return ChipDeviceCtrl.DeviceProxyWrapper(ctypes.c_void_p(nodeid),
+                                                     ChipDeviceCtrl.DeviceProxyWrapper.DeviceProxyType.COMMISSIONEE)
+
+        handle = mock.Mock()
+        handle.pychip_ReadClient_Abort.side_effect = lambda appContext: self.readClients.Abort(appContext.value)
+        for patcher in (mock.patch.object(self.controller, 'GetConnectedDevice', getConnectedDevice),
+                        mock.patch.object(Attribute, 'Read', lambda *args, **kwargs: self.readClients.Read(*args, **kwargs)),
+                        mock.patch.object(Attribute, 'GetLibraryHandle', return_value=handle)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def settle(self):
+        # Lets the aborted transactions finish, like the done callbacks of the native library.
+        await asyncio.sleep(self.readClients.delay * 2)
+
+    def assertNoSlotHeld(self):
+        self.assertEqual(self.controller._readManyInFlight, {})
+        self.assertEqual(self.loopErrors, [])
+
+    async def test_limits(self):
+        results = await self.controller.ReadMany(range(1, 9), _VENDOR_NAME, maxInFlight=3)
+
+        self.assertEqual(sorted(results), list(range(1, 9)))
+        self.assertTrue(all(result.succeeded for result in results.values()))
+        self.assertIsInstance(results[1].response, Attribute.AsyncReadTransaction.ReadResponse)
+        self.assertEqual(self.readClients.maxInFlight, 3)
+        self.assertNoSlotHeld()
+
+    async def test_limit_per_node_across_calls(self):
+        results = await asyncio.gather(*(self.controller.ReadMany([1, 2], _VENDOR_NAME, maxInFlightPerNode=1)
+                                         for _ in range(3)))
+
+        self.assertTrue(all(result.succeeded for nodeResults in results for result in nodeResults.values()))
+        self.assertEqual(self.readClients.maxInFlightPerNode, 1)
+        self.assertEqual(self.readClients.maxInFlight, 2)
+        self.assertNoSlotHeld()
+
+    async def test_invalid_limits(self):
+        for limits in ({'maxInFlight': 0}, {'maxInFlightPerNode': 0}):
+            with self.subTest(limits=limits), self.assertRaises(ValueError):
+                await self.controller.ReadMany([1], _VENDOR_NAME, **limits)
+
+    async def test_partial_failure(self):
+        self.readClients.failures = (2,)
+        results = await self.controller.ReadMany([1, 2, 3], _VENDOR_NAME)
+
+        self.assertEqual([nodeid for nodeid, result in results.items() if result.succeeded], [1, 3])
+        self.assertIsInstance(results[2].error, ChipStackError)
+        self.assertIsNone(results[2].response)
+        self.assertNoSlotHeld()
+
+    async def test_read_timeout(self):
+        self.readClients.hang = (2,)
+        results = await self.controller.ReadMany([1, 2], _VENDOR_NAME, timeoutSeconds=0.1)
+
+        self.assertTrue(results[1].succeeded)
+        self.assertIsInstance(results[2].error, asyncio.TimeoutError)
+        # The read that timed out does not keep running.
+        self.assertEqual(self.readClients.aborted, [2])
+        self.assertEqual(self.readClients.inFlight, {1: 0, 2: 0})
+        self.assertNoSlotHeld()
+
+        self.readClients.hang = ()
+        self.assertTrue((await self.controller.ReadMany([2], _VENDOR_NAME, timeoutSeconds=0.1))[2].succeeded)
+
+    async def test_abort_after_done(self):
+        transaction = Attribute.AsyncReadTransaction(asyncio.Future(), asyncio.get_running_loop(), self.controller, False)
+        self.readClients.Read(transaction, ctypes.c_void_p(1))
+        await self.settle()
+
+        # A late abort of a read that is done leaves the other reads alone.
+        self.readClients.hang = (2,)
+        other = asyncio.create_task(self.controller.ReadMany([2], _VENDOR_NAME, timeoutSeconds=0.2))
+        await asyncio.sleep(0.05)
+        transaction.Abort()
+        self.assertEqual(self.readClients.aborted, [])
+        self.assertIsInstance((await other)[2].error, asyncio.TimeoutError)
+        self.assertEqual(self.readClients.aborted, [2])
+
+    async def test_cancelled(self):
+        self.readClients.hang = (1, 2)
+        task = asyncio.create_task(self.controller.ReadMany([1, 2, 3], _VENDOR_NAME, maxInFlight=2))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(sorted(self.readClients.aborted), [1, 2])
+        self.assertNoSlotHeld()
+
+    async def test_subscribe(self):
+        results = await self.controller.SubscribeMany([1, 2], (0, 10), _VENDOR_NAME)
+
+        self.assertTrue(all(result.succeeded for result in results.values()))
+        self.assertIsInstance(results[1].response, Attribute.SubscriptionTransaction)
+        self.assertEqual(len(self.chipStack.subscriptions), 2)
+        self.assertNoSlotHeld()
+
+    async def test_subscribe_timeout(self):
+        # The subscriptions are established after the timeout.
+        self.readClients.delay = 0.2
+        results = await self.controller.SubscribeMany([1, 2], (0, 10), _VENDOR_NAME, timeoutSeconds=0.05)
+
+        self.assertTrue(all(isinstance(result.error, asyncio.TimeoutError) for result in results.values()))
+        self.assertEqual(sorted(self.readClients.aborted), [1, 2])
+        self.assertNoSlotHeld()
+
+        # The subscription established reports that were already on their way are ignored.
+        await self.settle()
+        self.assertEqual(self.loopErrors, [])
+        self.assertEqual(self.chipStack.subscriptions, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import ctypes
+import unittest
+
+from chip.clusters import Attribute
+from chip.interaction_model import AttributePathIBstruct, DataVersionFilterIBstruct, EventPathIBstruct
+
+
+def _entries(layout, pointers):
+    return [ctypes.string_at(pointer, layout.size) for pointer in pointers]
+
+
+class TestPathPacking(unittest.TestCase):
+    def test_layouts(self):
+        self.assertEqual(Attribute._AttributePathLayout.size, AttributePathIBstruct.sizeof())
+        self.assertEqual(Attribute._DataVersionFilterLayout.size, DataVersionFilterIBstruct.sizeof())
+        self.assertEqual(Attribute._EventPathLayout.size, EventPathIBstruct.sizeof())
+
+    def test_attribute_paths(self):
+        # Same encoding as building each path from a 0xFF-filled AttributePathIBstruct.
+        def legacy(endpointId, clusterId, attributeId):
+            path = AttributePathIBstruct.parse(b'\xff' * AttributePathIBstruct.sizeof())
+            if endpointId is not None:
+                path.EndpointId = endpointId
+            if clusterId is not None:
+                path.ClusterId = clusterId
+            if attributeId is not None:
+                path.AttributeId = attributeId
+            return AttributePathIBstruct.build(path)
+
+        paths = [(1, 6, 0), (None, 0x28, None), (0xFFFE, None, 0xFFF1FC00), (None, None, None)]
+        buffer, pointers = Attribute._PackPaths(Attribute._AttributePathLayout, [
+            (Attribute._Wildcard(e, 0xFFFF), Attribute._Wildcard(c, 0xFFFFFFFF), Attribute._Wildcard(a, 0xFFFFFFFF),
+             0xFFFFFFFF, 0xFF) for e, c, a in paths])
+        self.assertEqual(len(buffer), len(paths) * AttributePathIBstruct.sizeof())
+        self.assertEqual(_entries(Attribute._AttributePathLayout, pointers), [legacy(*p) for p in paths])
+
+    def test_data_version_filters_and_events(self):
+        buffer, pointers = Attribute._PackPaths(Attribute._DataVersionFilterLayout, [(1, 6, 0x12345678), (2, 8, 0)])
+        self.assertEqual(_entries(Attribute._DataVersionFilterLayout, pointers), [
+            DataVersionFilterIBstruct.build({'EndpointId': 1, 'ClusterId': 6, 'DataVersion': 0x12345678}),
+            DataVersionFilterIBstruct.build({'EndpointId': 2, 'ClusterId': 8, 'DataVersion': 0})])
+
+        buffer, pointers = Attribute._PackPaths(Attribute._EventPathLayout, [(0, 0x28, 0, 1)])
+        self.assertEqual(_entries(Attribute._EventPathLayout, pointers), [
+            EventPathIBstruct.build({'EndpointId': 0, 'ClusterId': 0x28, 'EventId': 0, 'Urgent': 1})])
+
+    def test_empty(self):
+        buffer, pointers = Attribute._PackPaths(Attribute._AttributePathLayout, [])
+        self.assertEqual(len(pointers), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import chip.storage
+from chip.storage import JsonFileStorageBackend, PersistentStorage, SqliteStorageBackend
+
+
+class TestPersistentStorage(unittest.TestCase):
+    def setUp(self):
+        # The native storage adapter is not needed to exercise the Python side of the storage.
+        patcher = mock.patch.object(chip.storage, 'GetLibraryHandle', mock.Mock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def fill(self, storage: PersistentStorage):
+        storage.SetSdkKey('g/fidx', b'\x01\x02')
+        storage.SetSdkKey('f/1/n', b'noc')
+        storage.SetReplKey('caList', {'1': [1]})
+        storage.DeleteSdkKey('f/1/n')
+
+    def check(self, storage: PersistentStorage):
+        self.assertEqual(storage.GetSdkKey('g/fidx'), b'\x01\x02')
+        self.assertIsNone(storage.GetSdkKey('f/1/n'))
+        self.assertEqual(storage.GetReplKey('caList'), {'1': [1]})
+
+    def test_json(self):
+        path = os.path.join(self.directory, 'storage.json')
+        storage = PersistentStorage(path)
+        self.fill(storage)
+        with open(path) as file:
+            self.assertEqual(json.load(file), storage.jsonData)
+        self.assertEqual(os.listdir(self.directory), ['storage.json'])
+        storage.Shutdown()
+
+        self.check(PersistentStorage(path))
+
+    def test_corrupted_json(self):
+        path = os.path.join(self.directory, 'storage.json')
+        with open(path, 'w') as file:
+            file.write('{"sdk-config": {')
+        storage = PersistentStorage(path)
+        self.assertEqual(storage.jsonData, {'sdk-config': {}, 'repl-config': {}})
+
+    def test_json_with_database_extension(self):
+        # SQLite is only used when asked for with the backend argument, a path is always a JSON file.
+        path = os.path.join(self.directory, 'storage.db')
+        storage = PersistentStorage(path)
+        self.fill(storage)
+        storage.Shutdown()
+
+        with open(path) as file:
+            self.assertIn('sdk-config', json.load(file))
+        self.check(PersistentStorage(path))
+
+    def test_sqlite(self):
+        path = os.path.join(self.directory, 'storage.sqlite')
+        storage = PersistentStorage(backend=SqliteStorageBackend(path))
+        self.fill(storage)
+        storage._backend.Compact()
+        storage.Shutdown()
+
+        self.check(PersistentStorage(backend=SqliteStorageBackend(path)))
+
+    def test_write_behind(self):
+        backend = JsonFileStorageBackend(os.path.join(self.directory, 'storage.json'))
+        with mock.patch.object(backend, 'Commit', wraps=backend.Commit) as commit:
+            storage = PersistentStorage(backend=backend, writeBehindSec=60)
+            self.fill(storage)
+            commit.assert_not_called()
+            storage.Flush()
+            commit.assert_called_once()
+            self.assertEqual(commit.call_args.args[1], {('sdk-config', 'g/fidx'), ('sdk-config', 'f/1/n'),
+                                                        ('repl-config', 'caList')})
+
+            storage.SetSdkKey('g/lkgt', b'\x00')
+            storage.Shutdown()
+            self.assertEqual(commit.call_count, 2)
+        self.assertEqual(PersistentStorage(backend=backend).GetSdkKey('g/lkgt'), b'\x00')
+
+    def test_set_key_during_commit(self):
+        backend = JsonFileStorageBackend(os.path.join(self.directory, 'storage.json'))
+        committing = threading.Event()
+        resume = threading.Event()
+
+        def commit(jsonData, changedKeys):
+            committing.set()
+            self.assertTrue(resume.wait(5))
+            JsonFileStorageBackend.Commit(backend, jsonData, changedKeys)
+
+        storage = PersistentStorage(backend=backend, writeBehindSec=60)
+        self.fill(storage)
+        with mock.patch.object(backend, 'Commit', side_effect=commit):
+            flush = threading.Thread(target=storage.Flush)
+            flush.start()
+            try:
+                self.assertTrue(committing.wait(5))
+                # Like the CHIP thread, set a key while the backend is still writing the previous configuration.
+                setKey = threading.Thread(target=storage.SetSdkKey, args=('g/lkgt', b'\x00'))
+                setKey.start()
+                setKey.join(5)
+                self.assertFalse(setKey.is_alive())
+            finally:
+                resume.set()
+                flush.join()
+        # The key is committed by the next flush.
+        self.assertNotIn('g/lkgt', PersistentStorage(backend=backend).jsonData['sdk-config'])
+        storage.Shutdown()
+        self.assertEqual(PersistentStorage(backend=backend).GetSdkKey('g/lkgt'), b'\x00')
+
+    def test_write_behind_timer(self):
+        path = os.path.join(self.directory, 'storage.json')
+        storage = PersistentStorage(path, writeBehindSec=0.01)
+        self.fill(storage)
+        deadline = time.monotonic() + 5
+        while not os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        storage.Shutdown()
+        self.check(PersistentStorage(path))
+
+    def test_arguments(self):
+        with self.assertRaises(ValueError):
+            PersistentStorage()
+        with self.assertRaises(ValueError):
+            PersistentStorage(os.path.join(self.directory, 'storage.json'), jsonData={})
+        with self.assertRaises(ValueError):
+            PersistentStorage(jsonData={}, writeBehindSec=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
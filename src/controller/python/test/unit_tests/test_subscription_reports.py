@@ -0,0 +1,128 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import builtins
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.interaction_model import Status
+from chip.tlv import TLVWriter, uint
+
+
+def _path(attribute) -> Attribute.AttributePath:
+    return Attribute.AttributePath.from_attribute(EndpointId=1, Attribute=attribute)
+
+
+def _encode(value) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+class TestSubscriptionReports(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        patcher = mock.patch.object(builtins, 'chipStack', mock.Mock(), create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        loop = asyncio.get_running_loop()
+        self.transaction = Attribute.AsyncReadTransaction(loop.create_future(), loop, None, returnClusterObject=False)
+        self.transaction._handleSubscriptionEstablished(1)
+        self.subscription = self.transaction.GetSubscriptionHandler()
+        self.attributeCallback = mock.Mock()
+
+    def report(self, onOff: bool, onTime: int = 0, event: bool = False):
+        self.transaction.handleAttributeData(_path(Clusters.OnOff.Attributes.OnOff), 1, Status.Success, _encode(onOff))
+        self.transaction.handleAttributeData(_path(Clusters.OnOff.Attributes.OnTime), 1, Status.Success, _encode(uint(onTime)))
+        if event:
+            self.transaction.handleEventData(
+                Attribute.EventHeader(EndpointId=0, ClusterId=Clusters.BasicInformation.id,
+                                      EventId=Clusters.BasicInformation.Events.ShutDown.event_id),
+                Attribute.EventPath(ClusterId=Clusters.BasicInformation.id,
+                                    EventId=Clusters.BasicInformation.Events.ShutDown.event_id),
+                _encode({}), Status.Success)
+        self.transaction._handleReportEnd()
+
+    async def test_reports(self):
+        stream = self.subscription.reports()
+        self.report(True, 5, event=True)
+        self.report(False)
+
+        report = await stream.__anext__()
+        self.assertEqual(report.attributes, {_path(Clusters.OnOff.Attributes.OnOff): True,
+                                             _path(Clusters.OnOff.Attributes.OnTime): 5})
+        self.assertEqual(len(report.events), 1)
+        self.assertIsInstance(report.events[0].Data, Clusters.BasicInformation.Events.ShutDown)
+        report = await stream.__anext__()
+        self.assertFalse(report.attributes[_path(Clusters.OnOff.Attributes.OnOff)])
+        self.assertEqual(report.events, [])
+
+        self.subscription._FinishReportStreams()
+        self.assertEqual([report async for report in stream], [])
+
+    async def test_callbacks(self):
+        self.subscription.SetAttributeUpdateCallback(self.attributeCallback)
+        stream = self.subscription.reports()
+        self.report(True)
+        await stream.__anext__()
+        self.assertEqual(self.attributeCallback.call_count, 2)
+
+    async def test_coalesce(self):
+        stream = self.subscription.reports(coalesce=True)
+        self.report(True, 1, event=True)
+        self.report(False, 2, event=True)
+        self.report(True, 3)
+        await asyncio.sleep(0)
+
+        report = await stream.__anext__()
+        self.assertEqual(report.reportCount, 3)
+        self.assertEqual(report.attributes[_path(Clusters.OnOff.Attributes.OnTime)], 3)
+        self.assertEqual(len(report.events), 2)
+
+    async def test_overflow(self):
+        for policy, expectedOnTimes, dropped in ((Attribute.ReportOverflowPolicy.DROP_OLDEST, [3, 4], 2),
+                                                 (Attribute.ReportOverflowPolicy.DROP_NEWEST, [1, 2], 2),
+                                                 (Attribute.ReportOverflowPolicy.COALESCE, [1, 4], 0)):
+            with self.subTest(policy=policy):
+                stream = self.subscription.reports(maxQueueSize=2, overflowPolicy=policy)
+                for onTime in range(1, 5):
+                    self.report(True, onTime)
+                await asyncio.sleep(0)
+                self.subscription._FinishReportStreams()
+                reports = [report async for report in stream]
+                self.assertEqual([r.attributes[_path(Clusters.OnOff.Attributes.OnTime)] for r in reports], expectedOnTimes)
+                self.assertEqual(reports[0].droppedReports, dropped)
+
+    async def test_close(self):
+        stream = self.subscription.reports()
+        self.report(True)
+        await asyncio.sleep(0)
+        stream.Close()
+        self.report(False)
+        self.assertEqual([report async for report in stream], [])
+        self.assertEqual(self.subscription._reportStreams, ())
+
+    async def test_queue_size(self):
+        with self.assertRaises(ValueError):
+            self.subscription.reports(maxQueueSize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
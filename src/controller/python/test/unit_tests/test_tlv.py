@@ -133,9 +133,10 @@ class TestTLVWriter(unittest.TestCase):
 
 class TestTLVReader(unittest.TestCase):
     def _read_case(self, input, answer):
-        decoded = TLVReader(bytearray(input)).get()["Any"]
-        self.assertEqual(type(decoded), type(answer))
-        self.assertEqual(decoded, answer)
+        for valuesOnly in (False, True):
+            decoded = TLVReader(bytearray(input), valuesOnly=valuesOnly).get()["Any"]
+            self.assertEqual(type(decoded), type(answer))
+            self.assertEqual(decoded, answer)
 
     def test_int(self):
         self._read_case([0b00000011,
@@ -195,6 +196,26 @@ class TestTLVReader(unittest.TestCase):
                          0x18   # End of container
                          ], TLVList([(None, 1), (None, TLVList([(None, 2), (3, 4)]))]))
 
+    def test_values_only(self):
+        writer = TLVWriter()
+        writer.put(None, {
+            1: [{0: tlvUint(0x1234), 1: -(0x55555555), 2: "Hello!"}],
+            2: bytes([0xDE, 0xAD, 0xBE, 0xEF]),
+            3: None,
+            4: True,
+            5: 1.5,
+            (0x235A0000, 42): "FOO",
+            (None, 42): TLVList([(None, 1), (2, "BAR")]),
+        })
+        full = TLVReader(writer.encoding)
+        valuesOnly = TLVReader(memoryview(bytes(writer.encoding)), valuesOnly=True)
+        self.assertEqual(valuesOnly.get(), full.get())
+        self.assertNotEqual(full.decoding, [])
+        self.assertEqual(valuesOnly.decoding, [])
+
+        with self.assertRaises(ValueError):
+            TLVReader(bytes([0b00011001]), valuesOnly=True).get()
+
 
 class TestTLVTypes(unittest.TestCase):
     def test_list(self):
@@ -0,0 +1,128 @@
+#
+#    Copyright (c) 2025 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import unittest
+from unittest import mock
+
+import chip.clusters as Clusters
+from chip.clusters import Attribute
+from chip.interaction_model import InteractionModelError, Status
+
+
+def _write(endpoint, attribute):
+    return Attribute.AttributeWriteRequest(endpoint, attribute, 0, 0, attribute.value)
+
+
+class TestWriteCoalescer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.connect = mock.AsyncMock(return_value=mock.sentinel.device)
+        self.coalescer = Attribute.WriteCoalescer(self.connect, windowSeconds=0.01)
+        self.requests = []
+        self.error = None
+
+        def writeAttributes(future, eventLoop, device, attributes, **kwargs):
+            self.requests.append((attributes, kwargs))
+            if self.error is not None:
+                future.set_exception(self.error)
+            else:
+                future.set_result([Attribute.AttributeWriteResult(
+                    Path=Attribute.AttributePath(EndpointId=attr.EndpointId, ClusterId=attr.Attribute.cluster_id,
+                                                 AttributeId=attr.Attribute.attribute_id),
+                    Status=Status.Success if attr.EndpointId != 9 else Status.UnsupportedEndpoint) for attr in attributes])
+            return mock.Mock()
+
+        patcher = mock.patch.object(Attribute, 'WriteAttributes', writeAttributes)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, *attributes, **kwargs):
+        return self.coalescer.WriteAttributes(1, list(attributes), **kwargs)
+
+    async def test_merge(self):
+        onTime = Clusters.OnOff.Attributes.OnTime(5)
+        results = await asyncio.gather(
+            self.write(_write(1, onTime), _write(2, onTime)),
+            self.write(_write(3, onTime)),
+            self.write(_write(9, onTime)))
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual([attr.EndpointId for attr in self.requests[0][0]], [1, 2, 3, 9])
+        self.assertEqual([[result.Path.EndpointId for result in statuses] for statuses in results], [[1, 2], [3], [9]])
+        self.assertEqual(results[2][0].Status, Status.UnsupportedEndpoint)
+        self.connect.assert_awaited_once_with(1, None, 0)
+
+    async def test_same_path_in_order(self):
+        await asyncio.gather(
+            self.write(_write(1, Clusters.OnOff.Attributes.OnTime(1))),
+            self.write(_write(1, Clusters.OnOff.Attributes.OffWaitTime(1))),
+            self.write(_write(1, Clusters.OnOff.Attributes.OnTime(2))))
+
+        self.assertEqual([[attr.Data for attr in attributes] for attributes, _ in self.requests], [[1, 1], [2]])
+
+    async def test_timed(self):
+        with self.assertRaises(InteractionModelError) as ctx:
+            await self.write(_write(1, Clusters.UnitTesting.Attributes.TimedWriteBoolean(True)))
+        self.assertEqual(ctx.exception.status, Status.NeedsTimedInteraction)
+
+        await asyncio.gather(
+            self.write(_write(1, Clusters.UnitTesting.Attributes.TimedWriteBoolean(True)), timedRequestTimeoutMs=100),
+            self.write(_write(1, Clusters.OnOff.Attributes.OnTime(1))))
+        self.assertEqual(sorted(kwargs['timedRequestTimeoutMs'] or 0 for _, kwargs in self.requests), [0, 100])
+
+    async def test_errors(self):
+        self.error = InteractionModelError(Status.Busy)
+        results = await asyncio.gather(self.write(_write(1, Clusters.OnOff.Attributes.OnTime(1))),
+                                       self.write(_write(2, Clusters.OnOff.Attributes.OnTime(1))), return_exceptions=True)
+        self.assertEqual(results, [self.error, self.error])
+
+        self.connect.side_effect = TimeoutError()
+        with self.assertRaises(TimeoutError):
+            await self.write(_write(1, Clusters.OnOff.Attributes.OnTime(1)))
+
+    async def test_windows_in_order(self):
+        async def connect(nodeid, interactionTimeoutMs, payloadCapability):
+            # The session for the first window takes longer to establish than the window of the second write.
+            if interactionTimeoutMs is None:
+                await asyncio.sleep(0.05)
+            return mock.sentinel.device
+
+        self.connect.side_effect = connect
+        first = self.write(_write(1, Clusters.OnOff.Attributes.OnTime(1)))
+        await asyncio.sleep(0.001)
+        await asyncio.gather(first, self.write(_write(1, Clusters.OnOff.Attributes.OnTime(2)), interactionTimeoutMs=1000))
+
+        self.assertEqual([[attr.Data for attr in attributes] for attributes, _ in self.requests], [[1], [2]])
+
+    async def test_drain(self):
+        write = asyncio.ensure_future(self.write(_write(1, Clusters.OnOff.Attributes.OnTime(1))))
+        await asyncio.sleep(0)
+        await self.coalescer.Drain(2)
+        self.assertEqual(self.requests, [])
+
+        await self.coalescer.Drain(1)
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(write.done())
+
+        # The window timer was cancelled, nothing is sent again when the window would have closed.
+        await asyncio.sleep(0.02)
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(len(await write), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -59,6 +59,7 @@ from chip.storage import PersistentStorage
 from chip.testing.commissioning import (CommissioningInfo, CustomCommissioningParameters, SetupPayloadInfo, commission_devices,
                                         get_setup_payload_info_config)
 from chip.testing.global_attribute_ids import GlobalAttributeIds
+from chip.testing.pics import PicsEvaluator
 from chip.testing.problem_notices import AttributePathLocation, ClusterMapper, ProblemLocation, ProblemNotice, ProblemSeverity
 from chip.testing.runner import TestRunnerHooks, TestStep
 from chip.tlv import uint
@@ -450,7 +451,11 @@ class MatterBaseTest(base_test.BaseTestClass):
         super().teardown_class()
 
     def check_pics(self, pics_key: str) -> bool:
-        return self.matter_test_config.pics.get(pics_key.strip(), False)
+        """ Returns the value of a PICS code, or of a PICS expression such as 'OO.S.F00 && !OO.S.A4000'. """
+        evaluator = getattr(self, '_pics_evaluator', None)
+        if evaluator is None or evaluator.pics is not self.matter_test_config.pics:
+            evaluator = self._pics_evaluator = PicsEvaluator(self.matter_test_config.pics)
+        return evaluator.check(pics_key)
 
     @property
     def is_pics_sdk_ci_only(self) -> bool:
@@ -20,6 +20,14 @@ import os
 import typing
 import xml.etree.ElementTree as ET
 
+try:
+    from matter.yamltests.pics_checker import compile_pics_expression
+except ImportError:
+    compile_pics_expression = None
+
+# Characters which can only be found in a PICS expression, not in a PICS code.
+_EXPRESSION_CHARACTERS = frozenset('!&|()')
+
 
 def attribute_pics_str(pics_base: str, id: int) -> str:
     return f'{pics_base}.S.A{id:04x}'
@@ -102,3 +110,32 @@ def read_pics_from_file(path: str) -> dict[str, bool]:
         with open(path, 'r') as f:
             lines = f.readlines()
             return parse_pics(lines)
+
+
+class PicsEvaluator:
+    """ Evaluates PICS codes and PICS expressions (e.g. 'OO.S.A0000 && !OO.S.F00', see matter.yamltests) against a
+        dictionary of PICS, which is not expected to change.
+
+        Expressions are compiled once and shared with the PICS checker of the YAML tests, and their values are
+        memoized.
+    """
+
+    def __init__(self, pics: dict[str, bool]):
+        self.pics = pics
+        self._lowercase: typing.Optional[dict[str, bool]] = None
+        self._results: dict[str, bool] = {}
+
+    def check(self, pics_key: str) -> bool:
+        key = pics_key.strip()
+        if _EXPRESSION_CHARACTERS.isdisjoint(key):
+            return self.pics.get(key, False)
+
+        result = self._results.get(key)
+        if result is None:
+            if compile_pics_expression is None:
+                raise ValueError(f'PICS expression {pics_key!r} can not be evaluated without the matter.yamltests package')
+            if self._lowercase is None:
+                # Expressions are evaluated against lowercase codes, as in the YAML tests.
+                self._lowercase = {code.lower(): value for code, value in self.pics.items()}
+            result = self._results[key] = compile_pics_expression(key)(self._lowercase)
+        return result